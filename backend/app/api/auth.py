@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.core.dependencies import get_current_user
-from app.database.models.user import User
+from app.core.dependencies import get_current_user, get_session_id
+from app.core.principal import Principal
 from app.dto.auth import (
-    AccessTokenResponse,
     LoginRequest,
     RefreshTokenRequest,
+    SessionResponse,
     TokenResponse,
 )
 from app.dto.user import UserResponse
@@ -17,17 +19,43 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(body: LoginRequest, db: AsyncSession = Depends(get_db)):
-    access, refresh = await auth_service.authenticate(body.email, body.password, db)
+async def login(body: LoginRequest, request: Request, db: AsyncSession = Depends(get_db)):
+    access, refresh = await auth_service.authenticate(
+        body.email, body.password, db, user_agent=request.headers.get("user-agent")
+    )
     return TokenResponse(access_token=access, refresh_token=refresh)
 
 
-@router.post("/refresh", response_model=AccessTokenResponse)
+@router.post("/refresh", response_model=TokenResponse)
 async def refresh(body: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
-    access = await auth_service.refresh_access_token(body.refresh_token, db)
-    return AccessTokenResponse(access_token=access)
+    access, refresh = await auth_service.refresh_tokens(body.refresh_token, db)
+    return TokenResponse(access_token=access, refresh_token=refresh)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(body: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
+    await auth_service.logout(body.refresh_token, db)
 
 
 @router.get("/me", response_model=UserResponse)
-async def me(user: User = Depends(get_current_user)):
-    return UserResponse.from_entity(user)
+async def me(user: Principal = Depends(get_current_user)):
+    return UserResponse.from_principal(user)
+
+
+@router.get("/sessions", response_model=list[SessionResponse])
+async def list_sessions(
+    user: Principal = Depends(get_current_user),
+    current_session_id: UUID | None = Depends(get_session_id),
+    db: AsyncSession = Depends(get_db),
+):
+    sessions = await auth_service.list_sessions(user.id, db)
+    return [SessionResponse.from_entity(s, current_session_id) for s in sessions]
+
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_session(
+    session_id: UUID,
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    await auth_service.revoke_session(session_id, user.id, db)
@@ -1,19 +1,18 @@
-import random
-
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_current_user
-from app.database.models.user import User
+from app.core.principal import Principal
+from app.database import get_read_db
+from app.dto.dashboard import DashboardStats
+from app.services import dashboard_service
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
-@router.get("/stats")
-async def stats(user: User = Depends(get_current_user)):
-    return {
-        "tenant": user.tenant.name,
-        "total_users": random.randint(10, 500),
-        "active_users": random.randint(5, 200),
-        "revenue": round(random.uniform(1000, 50000), 2),
-        "growth": round(random.uniform(-5, 25), 1),
-    }
+@router.get("/stats", response_model=DashboardStats)
+async def stats(
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return await dashboard_service.get_stats(user, db)
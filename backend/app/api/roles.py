@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.core.dependencies import require_role
+from app.core.principal import Identity
+from app.core.roles import role_registry
+from app.dto.role import RoleResponse
+
+router = APIRouter(prefix="/admin/roles", tags=["roles"])
+
+
+@router.get("", response_model=list[RoleResponse])
+async def list_roles(
+    user: Identity = Depends(require_role("admin", "superadmin")),
+    db: AsyncSession = Depends(get_db),
+):
+    await role_registry.ensure_loaded(db)
+    return [RoleResponse(id=role_id, name=name) for role_id, name in role_registry.items()]
+
+
+@router.post("/refresh", response_model=list[RoleResponse])
+async def refresh_roles(
+    user: Identity = Depends(require_role("superadmin")),
+    db: AsyncSession = Depends(get_db),
+):
+    """Reload the role registry of the worker handling this request from the database."""
+    await role_registry.load(db)
+    return [RoleResponse(id=role_id, name=name) for role_id, name in role_registry.items()]
@@ -1,61 +1,160 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.core.dependencies import require_role
+from app.core.exceptions import AppError, NotFoundError
+from app.core.jobs import Job, job_registry
 from app.core.pagination import PaginationParams
-from app.database.models.user import User
-from app.dto.common import PaginatedResponse
+from app.core.principal import Identity
+from app.core.responses import TrustedJSONResponse
+from app.dto.common import CursorPaginatedResponse, PaginatedResponse
+from app.dto.job import JobResponse
 from app.dto.tenant import CreateTenantRequest, TenantResponse, UpdateTenantRequest
 from app.services import tenant_service
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/admin/tenants", tags=["tenants"])
 
 
-@router.get("", response_model=PaginatedResponse[TenantResponse])
+@router.get(
+    "",
+    response_model=PaginatedResponse[TenantResponse] | CursorPaginatedResponse[TenantResponse],
+)
 async def list_tenants(
     pagination: PaginationParams = Depends(),
-    user: User = Depends(require_role("superadmin")),
-    db: AsyncSession = Depends(get_db),
+    user: Identity = Depends(require_role("superadmin")),
+    db: AsyncSession = Depends(get_read_db),
 ):
+    if pagination.keyset:
+        tenants, next_cursor = await tenant_service.list_tenants_after(
+            db, after=pagination.after, limit=pagination.limit
+        )
+        return TrustedJSONResponse(
+            {
+                "items": [TenantResponse.values_of(t) for t in tenants],
+                "next_cursor": next_cursor,
+                "limit": pagination.limit,
+            }
+        )
+
     tenants, total = await tenant_service.list_tenants(
-        db, offset=pagination.offset, limit=pagination.limit
+        db, offset=pagination.offset, limit=pagination.limit, count=pagination.count
     )
-    return PaginatedResponse(
-        items=[TenantResponse.from_entity(t) for t in tenants],
-        total=total,
-        offset=pagination.offset,
-        limit=pagination.limit,
+    return TrustedJSONResponse(
+        {
+            "items": [TenantResponse.values_of(t) for t in tenants],
+            "total": total,
+            "offset": pagination.offset,
+            "limit": pagination.limit,
+        }
     )
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_tenants(
+    format: ExportFormat = "ndjson",
+    user: Identity = Depends(require_role("superadmin")),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Download every tenant visible to the caller as NDJSON or CSV, streamed from the database."""
+    return export_response(tenant_service.export_tenants(db), format, TenantResponse, "tenants")
+
+
 @router.post("", response_model=TenantResponse, status_code=status.HTTP_201_CREATED)
 async def create_tenant(
     body: CreateTenantRequest,
-    user: User = Depends(require_role("superadmin")),
+    user: Identity = Depends(require_role("superadmin")),
     db: AsyncSession = Depends(get_db),
 ):
     tenant = await tenant_service.create_tenant(body, db)
     return TenantResponse.from_entity(tenant)
 
 
-@router.patch("/{tenant_id}", response_model=TenantResponse)
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: UUID,
+    user: Identity = Depends(require_role("superadmin")),
+):
+    """Progress of a cascade started by this worker."""
+    job = job_registry.get(job_id)
+    if job is None:
+        raise NotFoundError("JOB_NOT_FOUND", "Job not found")
+    return JobResponse.from_job(job)
+
+
+def _accepted(job: Job) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=JobResponse.from_job(job).model_dump(mode="json"),
+    )
+
+
+@router.patch(
+    "/{tenant_id}",
+    response_model=TenantResponse,
+    responses={202: {"model": JobResponse, "description": "Deactivated; users cascading"}},
+)
 async def update_tenant(
     tenant_id: UUID,
     body: UpdateTenantRequest,
-    user: User = Depends(require_role("superadmin")),
+    cascade: bool = False,
+    user: Identity = Depends(require_role("superadmin")),
     db: AsyncSession = Depends(get_db),
 ):
+    """Update a tenant.
+
+    With ``cascade=true`` and ``is_active: false``, every user of the tenant is also
+    deactivated by a background job, and the response is 202 with that job.
+    ``cascade=true`` without ``is_active: false`` is rejected with 422.
+    """
+    if cascade and body.is_active is not False:
+        raise AppError(
+            "CASCADE_REQUIRES_DEACTIVATION",
+            "cascade=true is only valid with is_active: false",
+            status=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        )
     tenant = await tenant_service.update_tenant(tenant_id, body, db)
+    if cascade:
+        return _accepted(tenant_service.start_user_cascade(tenant_id, delete=False))
     return TenantResponse.from_entity(tenant)
 
 
-@router.delete("/{tenant_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{tenant_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={202: {"model": JobResponse, "description": "Deleted; users cascading"}},
+)
 async def delete_tenant(
     tenant_id: UUID,
-    user: User = Depends(require_role("superadmin")),
+    cascade: bool = False,
+    user: Identity = Depends(require_role("superadmin")),
     db: AsyncSession = Depends(get_db),
 ):
+    """Soft-delete a tenant.
+
+    With ``cascade=true``, every user of the tenant is also soft-deleted by a
+    background job, and the response is 202 with that job. If that job fails or
+    dies with its worker, ``POST /{tenant_id}/cascade`` runs it again.
+    """
     await tenant_service.delete_tenant(tenant_id, db)
+    if cascade:
+        return _accepted(tenant_service.start_user_cascade(tenant_id, delete=True))
+
+
+@router.post(
+    "/{tenant_id}/cascade", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+async def rerun_cascade(
+    tenant_id: UUID,
+    user: Identity = Depends(require_role("superadmin")),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-run the user cascade of a deleted or deactivated tenant, e.g. after its job failed.
+
+    Users of a deleted tenant are soft-deleted, those of a deactivated one deactivated.
+    """
+    return JobResponse.from_job(await tenant_service.rerun_user_cascade(tenant_id, db))
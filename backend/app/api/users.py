@@ -1,61 +1,137 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.core.dependencies import require_role
 from app.core.pagination import PaginationParams
-from app.database.models.user import User
-from app.dto.common import PaginatedResponse
-from app.dto.user import CreateUserRequest, UpdateUserRequest, UserResponse
-from app.services import user_service
+from app.core.principal import Identity
+from app.core.responses import DuplexStreamingResponse, TrustedJSONResponse
+from app.dto.common import CursorPaginatedResponse, PaginatedResponse
+from app.dto.user import (
+    BulkDeleteUsersRequest,
+    BulkUpdateUsersRequest,
+    BulkUsersResponse,
+    CreateUserRequest,
+    UpdateUserRequest,
+    UserResponse,
+)
+from app.services import user_import_service, user_service
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/admin/users", tags=["users"])
 
 
-@router.get("", response_model=PaginatedResponse[UserResponse])
+@router.get(
+    "", response_model=PaginatedResponse[UserResponse] | CursorPaginatedResponse[UserResponse]
+)
 async def list_users(
     pagination: PaginationParams = Depends(),
-    user: User = Depends(require_role("admin", "superadmin")),
-    db: AsyncSession = Depends(get_db),
+    user: Identity = Depends(require_role("admin", "superadmin")),
+    db: AsyncSession = Depends(get_read_db),
 ):
+    if pagination.keyset:
+        users, next_cursor = await user_service.list_users_after(
+            user, db, after=pagination.after, limit=pagination.limit
+        )
+        return TrustedJSONResponse(
+            {
+                "items": [UserResponse.values_of(u) for u in users],
+                "next_cursor": next_cursor,
+                "limit": pagination.limit,
+            }
+        )
+
     users, total = await user_service.list_users(
-        user, db, offset=pagination.offset, limit=pagination.limit
+        user, db, offset=pagination.offset, limit=pagination.limit, count=pagination.count
     )
-    return PaginatedResponse(
-        items=[UserResponse.from_entity(u) for u in users],
-        total=total,
-        offset=pagination.offset,
-        limit=pagination.limit,
+    return TrustedJSONResponse(
+        {
+            "items": [UserResponse.values_of(u) for u in users],
+            "total": total,
+            "offset": pagination.offset,
+            "limit": pagination.limit,
+        }
     )
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    format: ExportFormat = "ndjson",
+    user: Identity = Depends(require_role("admin", "superadmin")),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Download every user visible to the caller as NDJSON or CSV, streamed from the database."""
+    return export_response(user_service.export_users(user, db), format, UserResponse, "users")
+
+
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     body: CreateUserRequest,
-    user: User = Depends(require_role("admin", "superadmin")),
+    user: Identity = Depends(require_role("admin", "superadmin")),
     db: AsyncSession = Depends(get_db),
 ):
     new_user = await user_service.create_user(body, user, db)
-    return UserResponse.from_entity(new_user)
+    return UserResponse.from_row(new_user)
+
+
+@router.post("/import", response_class=StreamingResponse)
+async def import_users(
+    request: Request,
+    tenant_id: UUID | None = None,
+    user: Identity = Depends(require_role("admin", "superadmin")),
+    db: AsyncSession = Depends(get_db),
+):
+    """Bulk-create users from a CSV (``text/csv``) or NDJSON (``application/x-ndjson``) body.
+
+    Each row has ``email``, ``password`` or an existing bcrypt ``password_hash``, and an
+    optional ``role_id``. Responds with one NDJSON result per input row, in input order,
+    each batch's rows sent as soon as that batch is committed.
+    """
+    fmt = user_import_service.import_format(request.headers.get("content-type"))
+    target_tenant_id = await user_import_service.resolve_tenant(user, db, tenant_id)
+    results = user_import_service.import_users(request.stream(), fmt, user, db, target_tenant_id)
+    return DuplexStreamingResponse(
+        (r.model_dump_json(exclude_none=True) + "\n" async for r in results),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/bulk-update", response_model=BulkUsersResponse)
+async def bulk_update_users(
+    body: BulkUpdateUsersRequest,
+    user: Identity = Depends(require_role("admin", "superadmin")),
+    db: AsyncSession = Depends(get_db),
+):
+    return await user_service.bulk_update_users(body, user, db)
+
+
+@router.post("/bulk-delete", response_model=BulkUsersResponse)
+async def bulk_delete_users(
+    body: BulkDeleteUsersRequest,
+    user: Identity = Depends(require_role("admin", "superadmin")),
+    db: AsyncSession = Depends(get_db),
+):
+    return await user_service.bulk_delete_users(body, user, db)
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
 async def update_user(
     user_id: UUID,
     body: UpdateUserRequest,
-    user: User = Depends(require_role("admin", "superadmin")),
+    user: Identity = Depends(require_role("admin", "superadmin")),
     db: AsyncSession = Depends(get_db),
 ):
     target = await user_service.update_user(user_id, body, user, db)
-    return UserResponse.from_entity(target)
+    return UserResponse.from_row(target)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: UUID,
-    user: User = Depends(require_role("admin", "superadmin")),
+    user: Identity = Depends(require_role("admin", "superadmin")),
     db: AsyncSession = Depends(get_db),
 ):
     await user_service.delete_user(user_id, user, db)
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,11 +10,100 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     CORS_ORIGINS: str = "http://localhost:3000"
+    # Send per-request app/db/bcrypt timings to clients in a Server-Timing header.
+    SERVER_TIMING_HEADER: bool = True
+
+    # Authenticated principal cache (0 disables). Bounds how long a change made by
+    # another worker process can go unnoticed; local writes invalidate immediately.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    # Verified access-token payloads (0 disables). Entries expire with their token.
+    ACCESS_TOKEN_CACHE_MAX_SIZE: int = 10_000
+
+    # bcrypt worker pool. Up to WORKERS hashes run at once and QUEUE_SIZE more may
+    # wait; anything beyond that is rejected with 503 instead of piling up.
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+
+    # Stateless auth: role checks and tenant isolation trust verified token claims
+    # instead of loading the user. Revocations made by other processes take effect
+    # within AUTH_EPOCH_REFRESH_SECONDS.
+    AUTH_STATELESS: bool = False
+    AUTH_EPOCH_REFRESH_SECONDS: int = 30
+    # Reloads re-read epochs changed this long before the newest one already seen, to
+    # catch bumps from long transactions or committed behind a lagging replica.
+    AUTH_EPOCH_RELOAD_OVERLAP_SECONDS: int = 300
+
+    # Refresh sessions: one row per signed-in device, rotated on every refresh. The
+    # cache holds each session's token claims so a refresh is usually a single UPDATE;
+    # revocations still apply immediately since that UPDATE checks the database.
+    # Expired sessions are deleted every PURGE_INTERVAL (0 disables) in batches.
+    AUTH_SESSION_CACHE_TTL_SECONDS: int = 3600
+    AUTH_SESSION_CACHE_MAX_SIZE: int = 10_000
+    AUTH_SESSION_PURGE_INTERVAL_SECONDS: int = 3600
+    AUTH_SESSION_PURGE_BATCH_SIZE: int = 1000
+
+    # Connection pool. A request waiting longer than DB_POOL_TIMEOUT_SECONDS for a
+    # connection fails with 503; -1 disables recycling.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    DB_POOL_PRE_PING: bool = False
+
+    # asyncpg connection tuning. 0 keeps the server's statement_timeout.
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_COMMAND_TIMEOUT_SECONDS: float | None = None
+    # SQLAlchemy's compiled-statement cache, per engine (SQLAlchemy's default is 500).
+    DB_COMPILED_CACHE_SIZE: int = 500
+
+    # Statements slower than DB_SLOW_QUERY_MS are logged with their call site (0 disables).
+    # DB_QUERY_TRACE records every statement per request and logs a summary, warning
+    # about statements repeated DB_REPEATED_STATEMENT_THRESHOLD+ times (N+1); for
+    # development, it walks the stack on every statement.
+    DB_SLOW_QUERY_MS: float = 500.0
+    DB_QUERY_TRACE: bool = False
+    DB_REPEATED_STATEMENT_THRESHOLD: int = 5
+
+    # Optional read replicas (comma-separated URLs) for list and auth lookups. After a
+    # write, the same user (through any of their sessions) reads from the primary for
+    # READ_YOUR_WRITES_SECONDS.
+    DATABASE_REPLICA_URLS: str = ""
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Per-tenant dashboard stats cache (0 disables). Local user changes invalidate
+    # immediately; changes made by other processes show up within the TTL.
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    DASHBOARD_CACHE_MAX_SIZE: int = 10_000
+
+    # Bulk user import: rows per INSERT/commit, and the most rows one request may carry.
+    USER_IMPORT_BATCH_SIZE: int = 1000
+    USER_IMPORT_MAX_ROWS: int = 100_000
+
+    # Most ids one bulk user update/delete request may name.
+    USER_BULK_MAX_IDS: int = 10_000
+
+    # Users soft-deleted/deactivated per transaction when a tenant is offboarded.
+    TENANT_CASCADE_CHUNK_SIZE: int = 1000
+    # Users locked by other transactions are retried every RETRY seconds; the job
+    # fails if none of them could be changed for TIMEOUT seconds.
+    TENANT_CASCADE_LOCK_RETRY_SECONDS: float = 1.0
+    TENANT_CASCADE_LOCK_TIMEOUT_SECONDS: float = 300.0
+
+    # Streaming exports: rows fetched per server-side cursor round trip, and rows per
+    # response chunk.
+    EXPORT_BATCH_SIZE: int = 1000
 
     @property
     def cors_origin_list(self) -> list[str]:
         return [o.strip() for o in self.CORS_ORIGINS.split(",") if o.strip()]
 
+    @property
+    def replica_url_list(self) -> list[str]:
+        return [u.strip() for u in self.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+
     model_config = {"env_file": [".env", "../.env"], "extra": "ignore"}
 
 
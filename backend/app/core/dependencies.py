@@ -1,26 +1,28 @@
+from typing import TypeVar
 from uuid import UUID
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.core.config import settings
+from app.core.principal import Identity, Principal, principal_cache
+from app.core.revocation import revocation_epochs
+from app.core.roles import role_registry
+from app.database import get_db, get_read_db
 from app.utils.security import decode_token
 from app.database.models.user import User
+from app.database.utils.statements import USER_BY_ID
 
 bearer_scheme = HTTPBearer()
 
 SYSTEM_TENANT_SLUG = "system"
 
+IdentityT = TypeVar("IdentityT", bound=Identity)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    token = credentials.credentials
+
+def _decode_access_token(token: str) -> dict:
     try:
         payload = decode_token(token)
     except jwt.ExpiredSignatureError:
@@ -31,16 +33,42 @@ async def get_current_user(
     if payload.get("type") != "access":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
-    user_id = payload.get("sub")
-    if not user_id:
+    if not payload.get("sub"):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.tenant), selectinload(User.role))
-        .where(User.id == UUID(user_id))
-    )
-    user = result.scalar_one_or_none()
+    return payload
+
+
+async def _load_user(db: AsyncSession, user_id: UUID) -> User | None:
+    await role_registry.ensure_loaded(db)
+    result = await db.execute(USER_BY_ID, {"user_id": user_id})
+    return result.scalar_one_or_none()
+
+
+def _authenticated(identity: IdentityT, primary: AsyncSession) -> IdentityT:
+    """Tag the request's primary session with the caller, so its commits mark them a recent writer."""
+    primary.info["user_id"] = identity.id
+    return identity
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_read_db),
+    primary: AsyncSession = Depends(get_db),
+) -> Principal:
+    token = credentials.credentials
+    payload = _decode_access_token(token)
+    user_id = UUID(payload["sub"])
+
+    cache_key = (user_id, token)
+    principal = principal_cache.get(cache_key)
+    if principal is not None:
+        return _authenticated(principal, primary)
+
+    user = await _load_user(db, user_id)
+    if user is None and db is not primary:
+        # A user created moments ago may not have reached the replica yet.
+        user = await _load_user(primary, user_id)
 
     if not user or user.deleted_at is not None or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
@@ -48,16 +76,59 @@ async def get_current_user(
     if user.tenant.deleted_at is not None or not user.tenant.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant is deactivated")
 
-    return user
+    principal = Principal.from_entity(user)
+    principal_cache.set(cache_key, principal)
+    return _authenticated(principal, primary)
+
+
+async def get_identity(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_read_db),
+    primary: AsyncSession = Depends(get_db),
+) -> Identity:
+    """Caller identity for role checks and tenant isolation.
+
+    With ``AUTH_STATELESS`` enabled it is rebuilt from the verified token claims and
+    checked against the in-memory revocation epochs, so no query runs per request.
+    Otherwise (or for tokens issued before the claims existed) it is the principal
+    loaded by ``get_current_user``.
+    """
+    if not settings.AUTH_STATELESS:
+        return await get_current_user(credentials, db, primary)
+
+    payload = _decode_access_token(credentials.credentials)
+    if "tsl" not in payload:
+        return await get_current_user(credentials, db, primary)
+
+    await role_registry.ensure_loaded(db)
+    await revocation_epochs.refresh(db)
+    if revocation_epochs.is_revoked(payload):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+
+    identity = Identity(
+        id=UUID(payload["sub"]),
+        tenant_id=UUID(payload["tid"]),
+        tenant_slug=payload["tsl"],
+        role_name=payload["role"],
+    )
+    return _authenticated(identity, primary)
+
+
+def get_session_id(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> UUID | None:
+    """Session (device) the access token was issued to; None for tokens from before sessions."""
+    session_id = _decode_access_token(credentials.credentials).get("sid")
+    return UUID(session_id) if session_id else None
 
 
 def require_role(*allowed_roles: str):
-    async def role_checker(user: User = Depends(get_current_user)) -> User:
-        if user.role.name not in allowed_roles:
+    async def role_checker(user: Identity = Depends(get_identity)) -> Identity:
+        if user.role_name not in allowed_roles:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
         return user
     return role_checker
 
 
-def is_superadmin(user: User) -> bool:
-    return user.tenant.slug == SYSTEM_TENANT_SLUG and user.role.name == "superadmin"
+def is_superadmin(user: Identity) -> bool:
+    return user.tenant_slug == SYSTEM_TENANT_SLUG and user.role_name == "superadmin"
@@ -1,6 +1,7 @@
 import logging
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from sqlalchemy import exc as sa_exc
 
 
 logger = logging.getLogger(__name__)
@@ -36,10 +37,23 @@ class UnauthorizedError(AppError):
         super().__init__(code, message, status=401)
 
 
+class ServiceUnavailableError(AppError):
+    def __init__(self, code: str = "SERVICE_UNAVAILABLE", message: str = "Service temporarily unavailable"):
+        super().__init__(code, message, status=503)
+
+
 async def app_error_handler(_request: Request, exc: AppError) -> JSONResponse:
     return JSONResponse(status_code=exc.status, content={"code": exc.code, "detail": exc.message})
 
 
+async def pool_timeout_handler(request: Request, _exc: sa_exc.TimeoutError) -> JSONResponse:
+    """Pool exhaustion: no connection freed up within DB_POOL_TIMEOUT_SECONDS."""
+    logger.warning("Database pool exhausted path=%s", request.url.path)
+    return await app_error_handler(
+        request, ServiceUnavailableError("DB_POOL_EXHAUSTED", "Database busy, retry shortly")
+    )
+
+
 async def unhandled_error_handler(_request: Request, exc: Exception) -> JSONResponse:
     logger.exception("Unhandled exception: %s", exc)
     return JSONResponse(status_code=500, content={"code": "INTERNAL_ERROR", "detail": "Internal server error"})
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal, TypeVar
+
+from app.core.config import settings
+from app.core.instrumentation import record_bcrypt
+from app.core.exceptions import ServiceUnavailableError
+from app.utils.security import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded worker pool.
+
+    bcrypt releases the GIL, so the default thread pool gives real parallelism; a
+    process pool is available for deployments that prefer isolating the CPU work.
+    At most ``workers + queue_size`` operations may be pending at once; further calls
+    fail fast with ``ServiceUnavailableError`` so a login storm sheds load instead of
+    stalling every other request. Bulk hashing from all callers together holds at
+    most ``bulk_slots`` of that capacity, so logins always keep headroom.
+    """
+
+    def __init__(self, executor: Literal["thread", "process"], workers: int, queue_size: int):
+        self.executor_kind = executor
+        self.workers = workers
+        self.queue_size = queue_size
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Executor | None = None
+        # Shared by every hash_many call; below capacity unless capacity is 1.
+        self.bulk_slots = max(1, min(workers, self.capacity - 1))
+        self._bulk = asyncio.Semaphore(self.bulk_slots)
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_size
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            logger.warning("Password hasher saturated pending=%s", self.pending)
+            raise ServiceUnavailableError(
+                "AUTH_BUSY", "Too many concurrent authentication requests, retry shortly"
+            )
+
+        self.pending += 1
+        started_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.pending -= 1
+            record_bcrypt(time.perf_counter() - started_at)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password, password, hashed)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """Hash a batch for bulk work, in parallel across the pool.
+
+        Waits for a slot instead of failing fast. All concurrent batches share
+        ``bulk_slots``, so however many imports run, interactive calls are not stuck
+        behind them or rejected for lack of capacity.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def one(password: str) -> str:
+            async with self._bulk:
+                self.pending += 1
+                try:
+                    return await loop.run_in_executor(self._get_executor(), hash_password, password)
+                finally:
+                    self.pending -= 1
+
+        started_at = time.perf_counter()
+        try:
+            return list(await asyncio.gather(*(one(p) for p in passwords)))
+        finally:
+            record_bcrypt(time.perf_counter() - started_at)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
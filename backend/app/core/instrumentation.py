@@ -0,0 +1,352 @@
+"""Per-request timing: latency, database statements and time, and bcrypt time.
+
+``MetricsMiddleware`` opens a ``RequestTiming`` for each HTTP request in a context
+variable. Engine events and the password hasher add to it, and when the request
+ends it is folded into per-route histograms served on ``/metrics``. The running
+totals also go out in a ``Server-Timing`` header, as of when the headers are sent
+(a streamed body's later work is in the histograms only).
+
+Statements slower than ``DB_SLOW_QUERY_MS`` are logged with their call site. With
+``DB_QUERY_TRACE`` on, every statement of a request is kept with its parameter
+shape, duration and call site, and the request ends with a summary log line plus
+a warning for each statement repeated ``DB_REPEATED_STATEMENT_THRESHOLD`` times
+or more, the signature of an N+1.
+"""
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import greenlet
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.utils.metrics import Histogram, Labels, prometheus_histogram, prometheus_samples
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+_APP_DIR = Path(__file__).resolve().parent.parent
+# Frames skipped when looking for the code that issued a statement.
+_PLUMBING = (str(_APP_DIR / "database"), __file__)
+
+# Requests no route matched share one label, so scanners cannot blow up cardinality.
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _call_site() -> str | None:
+    """``file:line in function`` of the innermost app frame outside the DB plumbing.
+
+    SQLAlchemy's asyncio layer runs statements in a child greenlet, so the search
+    continues into the frames of the greenlet (coroutine) that is awaiting it.
+    """
+    frame = sys._getframe(1)
+    current = greenlet.getcurrent()
+    while True:
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(str(_APP_DIR)) and not filename.startswith(_PLUMBING):
+                path = Path(filename).relative_to(_APP_DIR.parent)
+                return f"{path}:{frame.f_lineno} in {frame.f_code.co_name}"
+            frame = frame.f_back
+        current = current.parent
+        if current is None:
+            return None
+        frame = current.gr_frame
+
+
+def _parameter_shape(parameters, executemany: bool) -> str:
+    """Parameter types without values, e.g. ``(UUID, str)`` or ``250 x (UUID, str)``."""
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {_parameter_shape(rows[0], False)}" if rows else "0 x ()"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return type(parameters).__name__
+
+
+@dataclass(slots=True)
+class StatementRecord:
+    statement: str
+    parameters: str
+    seconds: float
+    call_site: str | None
+
+
+@dataclass(slots=True)
+class StatementTrace:
+    """Statements run within one request (or one test block), in order."""
+
+    records: list[StatementRecord] = field(default_factory=list)
+
+    def add(self, statement: str, parameters: str, seconds: float, call_site: str | None) -> None:
+        self.records.append(StatementRecord(statement, parameters, seconds, call_site))
+
+    def repeated(self, threshold: int) -> list[tuple[StatementRecord, int]]:
+        """First occurrence and count of each statement run at least ``threshold`` times."""
+        counts = Counter(r.statement for r in self.records)
+        first: dict[str, StatementRecord] = {}
+        for r in self.records:
+            first.setdefault(r.statement, r)
+        return [(first[sql], n) for sql, n in counts.most_common() if n >= threshold]
+
+    def slow(self, threshold_ms: float) -> list[StatementRecord]:
+        return [r for r in self.records if r.seconds * 1000 >= threshold_ms]
+
+    def summary(self) -> dict:
+        return {
+            "statements": len(self.records),
+            "db_ms": round(sum(r.seconds for r in self.records) * 1000, 1),
+            "slow": len(self.slow(settings.DB_SLOW_QUERY_MS)) if settings.DB_SLOW_QUERY_MS else 0,
+            "repeated": {
+                r.call_site or r.statement[:80]: n
+                for r, n in self.repeated(settings.DB_REPEATED_STATEMENT_THRESHOLD)
+            },
+        }
+
+    def report(self) -> str:
+        """One line per statement, for test failure messages."""
+        return "\n".join(
+            f"{i}. [{r.call_site or '?'}] {' '.join(r.statement.split())} {r.parameters}"
+            for i, r in enumerate(self.records, 1)
+        )
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    db_statements: int = 0
+    db_seconds: float = 0.0
+    bcrypt_seconds: float = 0.0
+    trace: StatementTrace | None = None
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f"app;dur={total_seconds * 1000:.1f}, "
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_statements} statements", '
+            f"bcrypt;dur={self.bcrypt_seconds * 1000:.1f}"
+        )
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> RequestTiming | None:
+    return _current.get()
+
+
+def record_bcrypt(seconds: float) -> None:
+    timing = _current.get()
+    if timing is not None:
+        timing.bcrypt_seconds += seconds
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, parameters, _context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    timing = _current.get()
+    if timing is not None:
+        timing.db_statements += 1
+        timing.db_seconds += elapsed
+        if timing.trace is not None:
+            timing.trace.add(
+                statement, _parameter_shape(parameters, executemany), elapsed, _call_site()
+            )
+
+    if settings.DB_SLOW_QUERY_MS and elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow statement ms=%.1f site=%s params=%s sql=%s",
+            elapsed * 1000,
+            _call_site(),
+            _parameter_shape(parameters, executemany),
+            " ".join(statement.split()),
+        )
+
+
+def _handle_error(context) -> None:
+    started = context.connection.info.get("query_started_at") if context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attribute the engine's statements to the request running them. Idempotent."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def trace_statements(
+    engine: AsyncEngine, *, ignore: tuple[str, ...] = ()
+) -> Iterator[StatementTrace]:
+    """Record every statement ``engine`` runs inside the block, whichever task runs it.
+
+    Statements starting with one of the ``ignore`` prefixes (case-insensitive) are skipped.
+    """
+    trace = StatementTrace()
+    sync_engine = engine.sync_engine
+    prefixes = tuple(p.upper() for p in ignore)
+
+    def before(conn, _cursor, _statement, _parameters, _context, _executemany):
+        conn.info.setdefault("traced_started_at", []).append(time.perf_counter())
+
+    def after(conn, _cursor, statement, parameters, _context, executemany):
+        elapsed = time.perf_counter() - conn.info["traced_started_at"].pop()
+        if not statement.lstrip().upper().startswith(prefixes):
+            trace.add(statement, _parameter_shape(parameters, executemany), elapsed, _call_site())
+
+    event.listen(sync_engine, "before_cursor_execute", before)
+    event.listen(sync_engine, "after_cursor_execute", after)
+    try:
+        yield trace
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before)
+        event.remove(sync_engine, "after_cursor_execute", after)
+
+
+def _log_trace(method: str, route: str, trace: StatementTrace) -> None:
+    summary = trace.summary()
+    logger.info(
+        "DB trace method=%s route=%s statements=%s db_ms=%s slow=%s repeated=%s",
+        method, route, summary["statements"], summary["db_ms"], summary["slow"],
+        sum(summary["repeated"].values()),
+        extra={"db_trace": {"method": method, "route": route, **summary}},
+    )
+    for record, count in trace.repeated(settings.DB_REPEATED_STATEMENT_THRESHOLD):
+        logger.warning(
+            "Repeated statement (possible N+1) method=%s route=%s count=%s site=%s sql=%s",
+            method, route, count, record.call_site, " ".join(record.statement.split()),
+        )
+
+
+class RouteMetrics:
+    def __init__(self):
+        self.duration = Histogram()
+        self.db_statements = Histogram(STATEMENT_BUCKETS)
+        self.db_seconds = Histogram()
+        self.bcrypt_seconds = Histogram()
+        self.responses: dict[int, int] = {}
+
+    def observe(self, status: int, seconds: float, timing: RequestTiming) -> None:
+        self.duration.observe(seconds)
+        self.db_statements.observe(timing.db_statements)
+        self.db_seconds.observe(timing.db_seconds)
+        self.bcrypt_seconds.observe(timing.bcrypt_seconds)
+        self.responses[status] = self.responses.get(status, 0) + 1
+
+
+class RouteRegistry:
+    def __init__(self):
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def get(self, method: str, route: str) -> RouteMetrics:
+        key = (method, route)
+        metrics = self._routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._routes.setdefault(key, RouteMetrics())
+        return metrics
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def prometheus(self) -> list[str]:
+        with self._lock:
+            routes = sorted(self._routes.items())
+        series: list[tuple[Labels, RouteMetrics]] = [
+            ({"method": method, "route": route}, m) for (method, route), m in routes
+        ]
+
+        lines = prometheus_samples(
+            "http_requests_total",
+            "counter",
+            "Responses by route and status code.",
+            [
+                ({**labels, "status": str(status)}, n)
+                for labels, m in series
+                for status, n in sorted(m.responses.items())
+            ],
+        )
+        lines += prometheus_histogram(
+            "http_request_duration_seconds",
+            "Request latency, including streaming the response body.",
+            [(labels, m.duration.snapshot()) for labels, m in series],
+        )
+        lines += prometheus_histogram(
+            "http_request_db_statements",
+            "Database statements run per request.",
+            [(labels, m.db_statements.snapshot()) for labels, m in series],
+        )
+        lines += prometheus_histogram(
+            "http_request_db_seconds",
+            "Time per request spent waiting on database statements.",
+            [(labels, m.db_seconds.snapshot()) for labels, m in series],
+        )
+        lines += prometheus_histogram(
+            "http_request_bcrypt_seconds",
+            "Time per request spent waiting on password hashing, queueing included.",
+            [(labels, m.bcrypt_seconds.snapshot()) for labels, m in series],
+        )
+        return lines
+
+
+route_metrics = RouteRegistry()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streamed responses are timed to their last byte."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(trace=StatementTrace() if settings.DB_QUERY_TRACE else None)
+        token = _current.set(timing)
+        started_at = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.SERVER_TIMING_HEADER:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", timing.server_timing(time.perf_counter() - started_at)
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            route_metrics.get(scope["method"], route).observe(
+                status, time.perf_counter() - started_at, timing
+            )
+            if timing.trace is not None:
+                _log_trace(scope["method"], route, timing.trace)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+JobStatus = Literal["running", "succeeded", "failed"]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
+class Job:
+    """Progress of a background job. Mutated in place by the job while it runs."""
+
+    kind: str
+    subject_id: UUID
+    id: UUID = field(default_factory=uuid.uuid4)
+    status: JobStatus = "running"
+    total: int | None = None
+    processed: int = 0
+    error: str | None = None
+    created_at: datetime = field(default_factory=_now)
+    finished_at: datetime | None = None
+
+
+class JobRegistry:
+    """In-process background jobs with pollable progress.
+
+    Jobs live on the worker that started them, and only the last ``keep`` finished
+    jobs are remembered. Work must be safe to re-run, since a job dies with its worker.
+    """
+
+    def __init__(self, keep: int = 1000):
+        self.keep = keep
+        self._jobs: OrderedDict[UUID, Job] = OrderedDict()
+        self._tasks: dict[UUID, asyncio.Task] = {}
+
+    def start(self, kind: str, subject_id: UUID, work: Callable[[Job], Awaitable[None]]) -> Job:
+        job = Job(kind=kind, subject_id=subject_id)
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job, work))
+        self._forget_finished()
+        return job
+
+    async def _run(self, job: Job, work: Callable[[Job], Awaitable[None]]) -> None:
+        try:
+            await work(job)
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status, job.error = "failed", "cancelled"
+            raise
+        except Exception as e:
+            job.status, job.error = "failed", str(e)
+            logger.exception("Job failed id=%s kind=%s", job.id, job.kind)
+        finally:
+            job.finished_at = _now()
+            self._tasks.pop(job.id, None)
+            logger.info(
+                "Job finished id=%s kind=%s status=%s processed=%s",
+                job.id, job.kind, job.status, job.processed,
+            )
+
+    def _forget_finished(self) -> None:
+        finished = [i for i, j in self._jobs.items() if j.finished_at is not None]
+        for job_id in finished[: max(0, len(finished) - self.keep)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: UUID) -> Job | None:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: UUID) -> Job | None:
+        """Wait for a job to finish (no-op if it already has) and return it."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.wait([task])
+        return self._jobs.get(job_id)
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+job_registry = JobRegistry()
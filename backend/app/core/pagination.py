@@ -1,13 +1,56 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
 from fastapi import Query
 
+from app.core.exceptions import AppError
+
+# How offset pages report ``total``: "exact" runs a separate COUNT(*), "window" folds
+# count(*) OVER () into the page query (one round trip, but the whole result set is
+# materialized, so it only pays off for tenant-sized listings), "estimated" uses the
+# planner's row estimate (no scan; meant for superadmin-wide listings), "none" skips it.
+CountStrategy = Literal["exact", "window", "estimated", "none"]
+
 
 class PaginationParams:
-    """Reusable dependency for offset/limit pagination."""
+    """Reusable dependency for offset/limit or keyset (cursor) pagination.
+
+    Sending ``cursor`` switches to keyset mode; an empty value starts from the first
+    page, after which clients pass back each page's ``next_cursor``.
+    """
 
     def __init__(
         self,
         offset: int = Query(0, ge=0, description="Number of items to skip"),
         limit: int = Query(50, ge=1, le=200, description="Max items to return"),
+        cursor: str | None = Query(
+            None,
+            description="Opaque keyset cursor from a previous page; send it empty to start cursor pagination",
+        ),
+        count: CountStrategy = Query(
+            "exact",
+            description="How to compute total: exact, window (single query), estimated (planner) or none",
+        ),
     ):
         self.offset = offset
         self.limit = limit
+        self.count = count
+        self.keyset = cursor is not None
+        self.after = decode_cursor(cursor) if cursor else None
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise AppError("INVALID_CURSOR", "Invalid pagination cursor")
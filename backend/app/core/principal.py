@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.roles import role_registry
+
+if TYPE_CHECKING:
+    from app.database.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class Identity:
+    """What authorization needs to know about the caller: role checks and tenant isolation.
+
+    Can be rebuilt from verified access-token claims alone (see ``get_identity``).
+    """
+
+    id: UUID
+    tenant_id: UUID
+    tenant_slug: str
+    role_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class Principal(Identity):
+    """Compact, immutable snapshot of the authenticated user, its tenant and role.
+
+    Returned by ``get_current_user`` instead of the ORM entity so it can be cached
+    across requests without holding on to a session.
+    """
+
+    email: str
+    is_active: bool
+    tenant_name: str
+    role_id: int
+    created_at: datetime
+    updated_at: datetime | None
+
+    @classmethod
+    def from_entity(cls, user: User) -> Principal:
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_active=user.is_active,
+            tenant_id=user.tenant_id,
+            tenant_name=user.tenant.name,
+            tenant_slug=user.tenant.slug,
+            role_id=user.role_id,
+            role_name=role_registry.name_of(user.role_id),
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+# Keyed by (user_id, access_token) so a revoked/rotated token never resolves to a cached principal.
+principal_cache: TTLCache[tuple[UUID, str], Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop cached principals for a user. Call after any change to the user row."""
+    principal_cache.discard_where(lambda key, _principal: key[0] == user_id)
+
+
+def invalidate_users(user_ids: Collection[UUID]) -> None:
+    """``invalidate_user`` for many users in one pass over the cache."""
+    ids = set(user_ids)
+    principal_cache.discard_where(lambda key, _principal: key[0] in ids)
+
+
+def invalidate_tenant(tenant_id: UUID) -> None:
+    """Drop cached principals of every user in a tenant. Call after any change to the tenant row."""
+    principal_cache.discard_where(lambda _key, principal: principal.tenant_id == tenant_id)
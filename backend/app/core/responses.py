@@ -0,0 +1,40 @@
+from typing import Any
+
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+
+class TrustedJSONResponse(Response):
+    """JSON for plain dicts and lists built from trusted (database) values.
+
+    For hot list endpoints. Returning a response skips FastAPI's validation of the
+    result against the route's ``response_model``, which then only documents the
+    schema, and its stdlib ``json`` encoding. The whole body is encoded in one
+    pydantic-core call, with UUIDs and datetimes written the way the response
+    models write them, so the bytes are the same as the validated path's.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """A streamed response whose content is produced while the request body is read.
+
+    Before ASGI 2.4, ``StreamingResponse`` watches ``receive`` for the client going
+    away while it streams, and that watch would swallow body chunks the content
+    still has to read. Here only the content reads ``receive``: ``request.stream()``
+    raises ``ClientDisconnect`` if the client goes away, which ends the response.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from collections.abc import Collection
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database.models.auth_epoch import AuthEpoch
+from app.database.utils.statements import EPOCHS_BY_SUBJECT
+
+USER = "user"
+TENANT = "tenant"
+
+
+class RevocationEpochs:
+    """In-memory mirror of the ``auth_epochs`` table.
+
+    Lets stateless token verification reject tokens of deactivated or deleted users
+    and tenants without a query per request. Bumps made by this process apply
+    immediately; bumps made by other processes are picked up on the next periodic
+    reload, which bounds the revocation delay to ``refresh_seconds``.
+
+    Epochs only ever go up, so everything read is merged by taking the larger value:
+    a reload from a lagging replica, or one that cannot see this process's bump yet,
+    never undoes it. After the first full load, reloads only read rows changed since
+    the newest ``updated_at`` seen, minus ``overlap_seconds``: ``updated_at`` is the
+    bumping transaction's start time, so a bump committed (or replicated) late can
+    carry a timestamp older than rows already read.
+    """
+
+    def __init__(self, refresh_seconds: float, overlap_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self._epochs: dict[tuple[str, UUID], int] = {}
+        self._loaded_at: float | None = None
+        self._high_water: datetime | None = None
+        self._lock = asyncio.Lock()
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_seconds
+
+    def _merge(self, kind: str, subject_id: UUID, epoch: int) -> None:
+        key = (kind, subject_id)
+        if epoch > self._epochs.get(key, 0):
+            self._epochs[key] = epoch
+
+    async def refresh(self, db: AsyncSession, *, force: bool = False) -> None:
+        """Merge in epochs changed since the last reload, once it is ``refresh_seconds`` old."""
+        if not force and not self.is_stale():
+            return
+        async with self._lock:
+            if not force and not self.is_stale():
+                return
+            stmt = select(
+                AuthEpoch.subject_type, AuthEpoch.subject_id, AuthEpoch.epoch, AuthEpoch.updated_at
+            )
+            if self._high_water is not None:
+                stmt = stmt.where(AuthEpoch.updated_at > self._high_water - self.overlap)
+            for kind, subject_id, epoch, updated_at in await db.execute(stmt):
+                self._merge(kind, subject_id, epoch)
+                if self._high_water is None or updated_at > self._high_water:
+                    self._high_water = updated_at
+            self._loaded_at = time.monotonic()
+
+    def current(self, kind: str, subject_id: UUID) -> int:
+        return self._epochs.get((kind, subject_id), 0)
+
+    def is_revoked(self, payload: dict) -> bool:
+        """True if the token predates a revocation of its user or tenant."""
+        return payload.get("uep", 0) < self.current(USER, UUID(payload["sub"])) or payload.get(
+            "tep", 0
+        ) < self.current(TENANT, UUID(payload["tid"]))
+
+    async def fetch(self, db: AsyncSession, user_id: UUID, tenant_id: UUID) -> tuple[int, int]:
+        """Read the authoritative (user_epoch, tenant_epoch) to embed in a newly issued token."""
+        keys = [(USER, user_id), (TENANT, tenant_id)]
+        result = await db.execute(EPOCHS_BY_SUBJECT, {"keys": keys})
+        for kind, subject_id, epoch in result:
+            self._merge(kind, subject_id, epoch)
+        return self.current(USER, user_id), self.current(TENANT, tenant_id)
+
+    async def bump(self, db: AsyncSession, kind: str, subject_id: UUID) -> int:
+        """Revoke all tokens issued so far for a subject. Runs in the caller's transaction."""
+        stmt = (
+            insert(AuthEpoch)
+            .values(subject_type=kind, subject_id=subject_id, epoch=1)
+            .on_conflict_do_update(
+                index_elements=[AuthEpoch.subject_type, AuthEpoch.subject_id],
+                set_={"epoch": AuthEpoch.epoch + 1, "updated_at": func.now()},
+            )
+            .returning(AuthEpoch.epoch)
+        )
+        epoch = (await db.execute(stmt)).scalar_one()
+        self._merge(kind, subject_id, epoch)
+        return epoch
+
+    async def bump_many(self, db: AsyncSession, kind: str, subject_ids: Collection[UUID]) -> None:
+        """``bump`` for many subjects of one kind in a single statement."""
+        if not subject_ids:
+            return
+        stmt = (
+            insert(AuthEpoch)
+            .on_conflict_do_update(
+                index_elements=[AuthEpoch.subject_type, AuthEpoch.subject_id],
+                set_={"epoch": AuthEpoch.epoch + 1, "updated_at": func.now()},
+            )
+            .returning(AuthEpoch.subject_id, AuthEpoch.epoch)
+        )
+        result = await db.execute(
+            stmt, [{"subject_type": kind, "subject_id": s, "epoch": 1} for s in subject_ids]
+        )
+        for subject_id, epoch in result:
+            self._merge(kind, subject_id, epoch)
+
+
+revocation_epochs = RevocationEpochs(
+    refresh_seconds=settings.AUTH_EPOCH_REFRESH_SECONDS,
+    overlap_seconds=settings.AUTH_EPOCH_RELOAD_OVERLAP_SECONDS,
+)
@@ -0,0 +1,53 @@
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import AppError
+from app.database.models.role import Role
+
+logger = logging.getLogger(__name__)
+
+
+class RoleRegistry:
+    """Process-wide id <-> name map of the fixed ``roles`` lookup table.
+
+    Loaded in the app lifespan and refreshable through ``POST /admin/roles/refresh``,
+    so queries never need to join or lazy-load ``User.role``. ``ensure_loaded`` covers
+    code paths that run without the lifespan (tests, scripts).
+    """
+
+    def __init__(self):
+        self._names: dict[int, str] = {}
+        self._ids: dict[str, int] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._names)
+
+    async def load(self, db: AsyncSession) -> None:
+        result = await db.execute(select(Role.id, Role.name))
+        names = {role_id: name for role_id, name in result}
+        self._names = names
+        self._ids = {name: role_id for role_id, name in names.items()}
+        logger.info("Role registry loaded roles=%s", sorted(self._ids))
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        if not self.loaded:
+            await self.load(db)
+
+    def name_of(self, role_id: int) -> str:
+        return self._names[role_id]
+
+    def id_of(self, name: str) -> int:
+        return self._ids[name]
+
+    def validate(self, role_id: int) -> None:
+        if role_id not in self._names:
+            raise AppError("INVALID_ROLE", f"Unknown role id {role_id}")
+
+    def items(self) -> list[tuple[int, str]]:
+        return sorted(self._names.items())
+
+
+role_registry = RoleRegistry()
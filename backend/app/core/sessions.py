@@ -0,0 +1,239 @@
+import asyncio
+import hashlib
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.revocation import TENANT, USER
+from app.database.models.auth_epoch import AuthEpoch
+from app.database.models.auth_session import AuthSession
+from app.utils.security import create_refresh_token
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionClaims:
+    """The access-token claims of a session's user, as of its last full check."""
+
+    user_id: UUID
+    tenant_id: UUID
+    tenant_slug: str
+    role_name: str
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _epoch_of(kind: str, subject_id) -> object:
+    return func.coalesce(
+        select(AuthEpoch.epoch)
+        .where(AuthEpoch.subject_type == kind, AuthEpoch.subject_id == subject_id)
+        .scalar_subquery(),
+        0,
+    )
+
+
+# Rotate the presented token of a live session in one statement, provided neither
+# its user nor its tenant was revoked since the session's last full check.
+# :session_id, :presented_token_id, :presented_token_hash,
+# :new_token_id, :new_token_hash, :new_expires_at
+_ROTATE = (
+    update(AuthSession)
+    .where(
+        AuthSession.id == bindparam("session_id"),
+        AuthSession.token_id == bindparam("presented_token_id"),
+        AuthSession.token_hash == bindparam("presented_token_hash"),
+        AuthSession.revoked_at.is_(None),
+        AuthSession.expires_at > func.now(),
+        AuthSession.user_epoch >= _epoch_of(USER, AuthSession.user_id),
+        AuthSession.tenant_epoch >= _epoch_of(TENANT, AuthSession.tenant_id),
+    )
+    .values(
+        token_id=bindparam("new_token_id"),
+        token_hash=bindparam("new_token_hash"),
+        expires_at=bindparam("new_expires_at"),
+        last_used_at=func.now(),
+    )
+    .returning(AuthSession.user_epoch, AuthSession.tenant_epoch)
+)
+
+
+class SessionStore:
+    """Server-side refresh sessions, with an LRU of their token claims in front.
+
+    The database decides whether a refresh token is still good: every rotation
+    checks the session is live and its user and tenant were not revoked. The cache
+    only saves re-reading the user, tenant and role to build the new access token,
+    so with a hit a refresh costs one indexed UPDATE.
+    """
+
+    def __init__(self, cache_size: int, cache_ttl: float):
+        self.cache: TTLCache[UUID, SessionClaims] = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+
+    @staticmethod
+    def _new_token(claims: SessionClaims, session_id: UUID) -> tuple[UUID, str, datetime]:
+        token_id = uuid.uuid4()
+        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        token = create_refresh_token(claims.user_id, session_id, token_id, expires_at)
+        return token_id, token, expires_at
+
+    async def open(
+        self,
+        db: AsyncSession,
+        claims: SessionClaims,
+        epochs: tuple[int, int],
+        user_agent: str | None = None,
+    ) -> tuple[UUID, str]:
+        """Start a session for a device and return (session_id, refresh_token). Commits."""
+        session_id = uuid.uuid4()
+        token_id, token, expires_at = self._new_token(claims, session_id)
+        db.add(
+            AuthSession(
+                id=session_id,
+                user_id=claims.user_id,
+                tenant_id=claims.tenant_id,
+                token_id=token_id,
+                token_hash=hash_token(token),
+                user_epoch=epochs[0],
+                tenant_epoch=epochs[1],
+                user_agent=user_agent[:255] if user_agent else None,
+                expires_at=expires_at,
+            )
+        )
+        await db.commit()
+        self.cache.set(session_id, claims)
+        return session_id, token
+
+    async def rotate(
+        self, db: AsyncSession, session_id: UUID, token_id: UUID, token: str
+    ) -> tuple[SessionClaims, str, tuple[int, int]] | None:
+        """Swap the presented token for a new one if the cached claims can be reused. Commits.
+
+        Returns (claims, new refresh token, epochs), or None when the session is not
+        cached or failed any check, and the caller has to ``load`` and check it.
+        """
+        claims = self.cache.get(session_id)
+        if claims is None:
+            return None
+        new_token_id, new_token, expires_at = self._new_token(claims, session_id)
+        result = await db.execute(
+            _ROTATE,
+            {
+                "session_id": session_id,
+                "presented_token_id": token_id,
+                "presented_token_hash": hash_token(token),
+                "new_token_id": new_token_id,
+                "new_token_hash": hash_token(new_token),
+                "new_expires_at": expires_at,
+            },
+        )
+        epochs = result.one_or_none()
+        if epochs is None:
+            return None
+        await db.commit()
+        return claims, new_token, (epochs.user_epoch, epochs.tenant_epoch)
+
+    async def load(self, db: AsyncSession, session_id: UUID) -> AuthSession | None:
+        """The session row, locked until the caller commits, for a full check."""
+        result = await db.execute(
+            select(AuthSession).where(AuthSession.id == session_id).with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    async def reissue(
+        self,
+        db: AsyncSession,
+        session: AuthSession,
+        claims: SessionClaims,
+        epochs: tuple[int, int],
+    ) -> str:
+        """Rotate a session ``load``ed and checked by the caller. Commits."""
+        token_id, token, expires_at = self._new_token(claims, session.id)
+        session.token_id = token_id
+        session.token_hash = hash_token(token)
+        session.user_epoch, session.tenant_epoch = epochs
+        session.expires_at = expires_at
+        session.last_used_at = datetime.now(timezone.utc)
+        await db.commit()
+        self.cache.set(session.id, claims)
+        return token
+
+    async def revoke(self, db: AsyncSession, session_id: UUID, user_id: UUID) -> bool:
+        """Sign one of a user's devices out. Commits. False if no such live session."""
+        result = await db.execute(
+            update(AuthSession)
+            .where(
+                AuthSession.id == session_id,
+                AuthSession.user_id == user_id,
+                AuthSession.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+            .returning(AuthSession.id)
+        )
+        revoked = result.scalar_one_or_none() is not None
+        await db.commit()
+        self.cache.pop(session_id)
+        return revoked
+
+    async def list_live(self, db: AsyncSession, user_id: UUID) -> list[AuthSession]:
+        result = await db.execute(
+            select(AuthSession)
+            .where(
+                AuthSession.user_id == user_id,
+                AuthSession.revoked_at.is_(None),
+                AuthSession.expires_at > func.now(),
+            )
+            .order_by(AuthSession.last_used_at.desc())
+        )
+        return list(result.scalars())
+
+    async def purge_expired(self, db: AsyncSession, batch_size: int) -> int:
+        """Delete expired sessions, ``batch_size`` rows per transaction. Returns the count.
+
+        Revoked sessions are kept until they expire so their old tokens keep being
+        recognized (and rejected) rather than looking unknown.
+        """
+        batch = (
+            select(AuthSession.id)
+            .where(AuthSession.expires_at <= func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        purge = delete(AuthSession).where(AuthSession.id == batch.c.id)
+        total = 0
+        while True:
+            deleted = (await db.execute(purge)).rowcount
+            await db.commit()
+            total += deleted
+            if deleted < batch_size:
+                return total
+
+    async def purge_periodically(
+        self, sessionmaker: async_sessionmaker, interval: float, batch_size: int
+    ) -> None:
+        """Run ``purge_expired`` every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with sessionmaker() as db:
+                    purged = await self.purge_expired(db, batch_size)
+                if purged:
+                    logger.info("Expired sessions purged count=%s", purged)
+            except Exception:
+                logger.exception("Session purge failed")
+
+
+session_store = SessionStore(
+    cache_size=settings.AUTH_SESSION_CACHE_MAX_SIZE,
+    cache_ttl=settings.AUTH_SESSION_CACHE_TTL_SECONDS,
+)
@@ -1,15 +1,19 @@
 from app.database.base import AuditMixin, Base, TenantMixin
-from app.database.models import Role, Tenant, User
-from app.database.session import async_session, engine, get_db
+from app.database.models import AuthEpoch, Role, Tenant, TenantSignupDay, TenantUserCount, User
+from app.database.session import async_session, engine, get_db, get_read_db
 
 __all__ = [
     "AuditMixin",
+    "AuthEpoch",
     "Base",
     "Role",
     "Tenant",
     "TenantMixin",
+    "TenantSignupDay",
+    "TenantUserCount",
     "User",
     "async_session",
     "engine",
     "get_db",
+    "get_read_db",
 ]
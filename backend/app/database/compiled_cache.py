@@ -0,0 +1,45 @@
+from sqlalchemy import event
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class CompiledCacheStats:
+    """Counts how executions fared in SQLAlchemy's compiled-statement cache.
+
+    A steady stream of misses once warm means statements whose cache key keeps
+    changing (e.g. literals inlined into the SQL) or a cache too small for them.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def record(self, _conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+        if context is None or context.compiled is None:
+            return  # raw driver SQL
+        if context.cache_hit is CacheStats.CACHE_HIT:
+            self.hits += 1
+        elif context.cache_hit is CacheStats.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
+
+    def track(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self.record)
+
+
+compiled_cache_stats = CompiledCacheStats()
+
+
+def compiled_cache_status(engine: AsyncEngine) -> dict:
+    cache = engine.sync_engine._compiled_cache
+    lookups = compiled_cache_stats.hits + compiled_cache_stats.misses
+    return {
+        "size": len(cache) if cache is not None else 0,
+        "capacity": cache.capacity if cache is not None else 0,
+        "hits": compiled_cache_stats.hits,
+        "misses": compiled_cache_stats.misses,
+        "uncached": compiled_cache_stats.uncached,
+        "hit_rate": compiled_cache_stats.hits / lookups if lookups else 0.0,
+    }
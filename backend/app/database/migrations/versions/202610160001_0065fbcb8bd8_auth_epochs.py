@@ -0,0 +1,40 @@
+"""auth epochs
+
+Revision ID: 0065fbcb8bd8
+Revises: ed7ae417d004
+Create Date: 2026-10-16 09:12:04.118512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0065fbcb8bd8"
+down_revision: Union[str, Sequence[str], None] = "ed7ae417d004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "auth_epochs",
+        sa.Column("subject_type", sa.String(length=10), nullable=False),
+        sa.Column("subject_id", sa.UUID(), nullable=False),
+        sa.Column("epoch", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("subject_type", "subject_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("auth_epochs")
@@ -0,0 +1,36 @@
+"""keyset pagination indexes
+
+Revision ID: 44fb8b360f33
+Revises: 0065fbcb8bd8
+Create Date: 2026-10-16 10:41:27.530971
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "44fb8b360f33"
+down_revision: Union[str, Sequence[str], None] = "0065fbcb8bd8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_tenant_id_created_at_id",
+        "users",
+        ["tenant_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], unique=False)
+    op.create_index("ix_tenants_created_at_id", "tenants", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tenants_created_at_id", table_name="tenants")
+    op.drop_index("ix_users_created_at_id", table_name="users")
+    op.drop_index("ix_users_tenant_id_created_at_id", table_name="users")
@@ -0,0 +1,64 @@
+"""tenant user stats
+
+Revision ID: 5c2e91d7a4f0
+Revises: 44fb8b360f33
+Create Date: 2026-10-16 13:41:27.552904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e91d7a4f0"
+down_revision: Union[str, Sequence[str], None] = "44fb8b360f33"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tenant_user_counts",
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("role_id", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("active", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["role_id"], ["roles.id"]),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("tenant_id", "role_id"),
+    )
+    op.create_table(
+        "tenant_signups_daily",
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("tenant_id", "day"),
+    )
+
+    # Backfill from existing users; afterwards the user service keeps them current.
+    op.execute(
+        "INSERT INTO tenant_user_counts (tenant_id, role_id, total, active) "
+        "SELECT tenant_id, role_id, count(*), count(*) FILTER (WHERE is_active) "
+        "FROM users WHERE deleted_at IS NULL GROUP BY tenant_id, role_id"
+    )
+    op.execute(
+        "INSERT INTO tenant_signups_daily (tenant_id, day, count) "
+        "SELECT tenant_id, (created_at AT TIME ZONE 'UTC')::date, count(*) "
+        "FROM users GROUP BY 1, 2"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("tenant_signups_daily")
+    op.drop_table("tenant_user_counts")
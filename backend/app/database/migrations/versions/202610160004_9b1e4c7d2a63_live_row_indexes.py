@@ -0,0 +1,71 @@
+"""live row indexes
+
+Revision ID: 9b1e4c7d2a63
+Revises: 5c2e91d7a4f0
+Create Date: 2026-10-16 15:22:48.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1e4c7d2a63"
+down_revision: Union[str, Sequence[str], None] = "5c2e91d7a4f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if two existing emails differ only in case; merge those accounts first.
+    op.create_index(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+
+    op.create_index(
+        "ix_users_live_tenant_id_created_at_id",
+        "users",
+        ["tenant_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=LIVE,
+    )
+    op.create_index(
+        "ix_users_live_created_at_id",
+        "users",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=LIVE,
+    )
+    op.create_index(
+        "ix_tenants_live_created_at_id",
+        "tenants",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=LIVE,
+    )
+
+    op.drop_index("ix_tenants_created_at_id", table_name="tenants")
+    op.drop_index("ix_users_created_at_id", table_name="users")
+    op.drop_index("ix_users_tenant_id_created_at_id", table_name="users")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_users_tenant_id_created_at_id",
+        "users",
+        ["tenant_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], unique=False)
+    op.create_index("ix_tenants_created_at_id", "tenants", ["created_at", "id"], unique=False)
+
+    op.drop_index("ix_tenants_live_created_at_id", table_name="tenants")
+    op.drop_index("ix_users_live_created_at_id", table_name="users")
+    op.drop_index("ix_users_live_tenant_id_created_at_id", table_name="users")
+    op.drop_index("ix_users_email_lower", table_name="users")
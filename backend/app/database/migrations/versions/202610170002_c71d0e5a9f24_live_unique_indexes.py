@@ -0,0 +1,51 @@
+"""live unique indexes
+
+Revision ID: c71d0e5a9f24
+Revises: 3f8a6d21c0b7
+Create Date: 2026-10-17 11:06:37.281604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c71d0e5a9f24"
+down_revision: Union[str, Sequence[str], None] = "3f8a6d21c0b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_live_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+        postgresql_where=LIVE,
+    )
+    op.create_index(
+        "ix_tenants_live_slug", "tenants", ["slug"], unique=True, postgresql_where=LIVE
+    )
+
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.drop_constraint("users_email_key", "users", type_="unique")
+    op.drop_constraint("tenants_slug_key", "tenants", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Fails once a soft-deleted row shares an email or slug with another row.
+    op.create_unique_constraint("tenants_slug_key", "tenants", ["slug"])
+    op.create_unique_constraint("users_email_key", "users", ["email"])
+    op.create_index(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+
+    op.drop_index("ix_tenants_live_slug", table_name="tenants")
+    op.drop_index("ix_users_live_email_lower", table_name="users")
@@ -0,0 +1,29 @@
+"""auth epochs updated_at index
+
+Revision ID: 5d2e8a61b4f9
+Revises: c71d0e5a9f24
+Create Date: 2026-10-17 14:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8a61b4f9"
+down_revision: Union[str, Sequence[str], None] = "c71d0e5a9f24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_auth_epochs_updated_at"), "auth_epochs", ["updated_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_auth_epochs_updated_at"), table_name="auth_epochs")
@@ -1,5 +1,16 @@
+from app.database.models.auth_epoch import AuthEpoch
+from app.database.models.auth_session import AuthSession
 from app.database.models.role import Role
 from app.database.models.tenant import Tenant
 from app.database.models.user import User
+from app.database.models.user_stats import TenantSignupDay, TenantUserCount
 
-__all__ = ["Role", "Tenant", "User"]
+__all__ = [
+    "AuthEpoch",
+    "AuthSession",
+    "Role",
+    "Tenant",
+    "TenantSignupDay",
+    "TenantUserCount",
+    "User",
+]
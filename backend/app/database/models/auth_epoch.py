@@ -0,0 +1,26 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+
+
+class AuthEpoch(Base):
+    """Revocation counter for a user or tenant.
+
+    Access tokens embed the epoch current at issue time; bumping it invalidates every
+    token issued before. Only subjects that were ever revoked have a row.
+    """
+
+    __tablename__ = "auth_epochs"
+
+    subject_type: Mapped[str] = mapped_column(String(10), primary_key=True)
+    subject_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    epoch: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Indexed for the incremental reload of the in-process mirror.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
@@ -0,0 +1,39 @@
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+
+
+class TenantUserCount(Base):
+    """Live (not soft-deleted) users of a tenant with a given role, and how many are active.
+
+    Maintained incrementally by the user service so the dashboard never scans ``users``.
+    """
+
+    __tablename__ = "tenant_user_counts"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenants.id"), primary_key=True
+    )
+    role_id: Mapped[int] = mapped_column(Integer, ForeignKey("roles.id"), primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    active: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class TenantSignupDay(Base):
+    """Users created in a tenant on a given (UTC) day."""
+
+    __tablename__ = "tenant_signups_daily"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenants.id"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
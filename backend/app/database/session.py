@@ -1,14 +1,124 @@
+import itertools
 from collections.abc import AsyncGenerator
+from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import jwt
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.instrumentation import instrument_engine
+from app.database.compiled_cache import compiled_cache_stats
+from app.database.pool import InstrumentedQueuePool
+from app.utils.security import decode_token
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
 
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+def _connect_args() -> dict:
+    args: dict = {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+    if settings.DB_COMMAND_TIMEOUT_SECONDS is not None:
+        args["command_timeout"] = settings.DB_COMMAND_TIMEOUT_SECONDS
+    return args
+
+
+def build_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the pool, cache and asyncpg settings from ``Settings``."""
+    engine = create_async_engine(
+        url,
+        echo=False,
+        query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+    compiled_cache_stats.track(engine)
+    instrument_engine(engine)
+    return engine
+
+
+class PrimarySession(Session):
+    """Sync session class behind primary sessions; commits mark the caller as a recent writer."""
+
+
+engine = build_engine(settings.DATABASE_URL)
+
+async_session = async_sessionmaker(
+    engine, class_=AsyncSession, sync_session_class=PrimarySession, expire_on_commit=False
+)
+
+replica_engines = [build_engine(url) for url in settings.replica_url_list]
+replica_sessions = [
+    async_sessionmaker(e, class_=AsyncSession, expire_on_commit=False) for e in replica_engines
+]
+_replica_cycle = itertools.count()
+
+# Users that committed a write recently and must keep reading from the primary until
+# replicas catch up, whichever of their sessions (tokens) they read through next.
+_recent_writers: TTLCache[UUID, bool] = TTLCache(
+    maxsize=10_000, ttl=settings.READ_YOUR_WRITES_SECONDS
+)
+
+
+def remember_write(user_id: UUID | None) -> None:
+    if user_id is not None:
+        _recent_writers.set(user_id, True)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _remember_writer(session: Session) -> None:
+    # Set by the auth dependencies once the caller is authenticated.
+    remember_write(session.info.get("user_id"))
+
+
+def _token_user_id(request: Request) -> UUID | None:
+    """User id of a valid access token on the request, or None.
+
+    Only picks the session for ``get_read_db``, which runs before authentication;
+    rejecting bad tokens is left to the auth dependencies.
+    """
+    scheme, _, token = (request.headers.get("authorization") or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = decode_token(token)
+        return UUID(payload["sub"]) if payload.get("type") == "access" else None
+    except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+        return None
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+async def get_read_db(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only paths.
+
+    Uses a replica (round-robin) unless none are configured or the caller wrote
+    within ``READ_YOUR_WRITES_SECONDS``, in which case it is the primary session.
+    """
+    if not replica_sessions:
+        yield db
+        return
+    user_id = _token_user_id(request)
+    if user_id is not None and _recent_writers.get(user_id):
+        yield db
+        return
+
+    async with replica_sessions[next(_replica_cycle) % len(replica_sessions)]() as session:
+        yield session
@@ -1,11 +1,78 @@
-from sqlalchemy import Select
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import is_superadmin
-from app.database.models.user import User
+from app.core.pagination import CountStrategy
+from app.core.principal import Identity
 
 
-def tenant_filter(query: Select, user: User, tenant_id_column) -> Select:
+def tenant_filter(query: Select, user: Identity, tenant_id_column) -> Select:
     """Apply tenant isolation to a query. SuperAdmin bypasses the filter."""
     if is_superadmin(user):
         return query
     return query.where(tenant_id_column == user.tenant_id)
+
+
+def keyset_page(
+    query: Select,
+    created_at_column,
+    id_column,
+    *,
+    after: tuple[datetime, UUID] | None,
+    limit: int,
+) -> Select:
+    """Order by (created_at, id) and seek past ``after``.
+
+    Fetches one extra row so the caller can tell whether another page exists.
+    """
+    if after is not None:
+        query = query.where(tuple_(created_at_column, id_column) > after)
+    return query.order_by(created_at_column, id_column).limit(limit + 1)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    *,
+    offset: int,
+    limit: int,
+    count: CountStrategy = "exact",
+) -> tuple[list, int | None]:
+    """Run an ordered offset page of ``query`` and report its total per ``count``."""
+    page = query.offset(offset).limit(limit)
+
+    if count == "window":
+        # Same scan as COUNT(*), but in the page query itself: one round trip.
+        result = await db.execute(page.add_columns(func.count().over().label("total")))
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        # A page past the end has no rows to carry the window total.
+        return [], 0 if offset == 0 else await _exact_count(db, query)
+
+    items = list((await db.execute(page)).scalars().all())
+    if count == "exact":
+        return items, await _exact_count(db, query)
+    if count == "estimated":
+        return items, await _estimated_count(db, query)
+    return items, None
+
+
+async def _exact_count(db: AsyncSession, query: Select) -> int:
+    result = await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+    return result.scalar_one()
+
+
+async def _estimated_count(db: AsyncSession, query: Select) -> int:
+    """Planner row estimate for the filtered query: no table scan, accuracy depends on ANALYZE."""
+    sql = query.order_by(None).compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    conn = await db.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
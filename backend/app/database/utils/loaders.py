@@ -0,0 +1,7 @@
+from sqlalchemy.orm import joinedload
+
+from app.database.models.user import User
+
+# User.tenant is a non-nullable many-to-one: INNER JOIN it into the user query instead of
+# issuing a separate SELECT. Role names come from the in-memory role registry.
+USER_RELATIONS = (joinedload(User.tenant, innerjoin=True),)
@@ -0,0 +1,46 @@
+"""Pre-built statements for the queries run on (almost) every request.
+
+Building ``select(...).options(...).where(...)`` per call costs Python time before
+the compiled-statement cache is even consulted: constructing the statement, then
+walking it to compute its cache key. These are built once with ``bindparam``
+placeholders and executed with a parameter dict, so each call skips both (the
+cache key is memoized on the statement) and goes straight to the cached
+compilation. Keep them immutable: ``.where()`` on a shared statement returns a
+new, unmemoized copy, which defeats the point.
+"""
+from sqlalchemy import bindparam, func, select, tuple_
+
+from app.database.models.auth_epoch import AuthEpoch
+from app.database.models.tenant import Tenant
+from app.database.models.user import User
+from app.database.utils.loaders import USER_RELATIONS
+
+# :user_id
+USER_BY_ID = select(User).options(*USER_RELATIONS).where(User.id == bindparam("user_id"))
+
+# :email, already lower-cased. Only live users: deleted ones may share the email.
+LIVE_USER_BY_EMAIL = (
+    select(User)
+    .options(*USER_RELATIONS)
+    .where(func.lower(User.email) == bindparam("email"), User.deleted_at.is_(None))
+)
+
+# :user_id
+LIVE_USER_BY_ID = (
+    select(User)
+    .options(*USER_RELATIONS)
+    .where(User.id == bindparam("user_id"), User.deleted_at.is_(None))
+)
+
+# :user_id, :tenant_id
+LIVE_USER_BY_ID_IN_TENANT = LIVE_USER_BY_ID.where(User.tenant_id == bindparam("tenant_id"))
+
+# :tenant_id
+LIVE_TENANT_BY_ID = select(Tenant).where(
+    Tenant.id == bindparam("tenant_id"), Tenant.deleted_at.is_(None)
+)
+
+# :keys, a list of (subject_type, subject_id)
+EPOCHS_BY_SUBJECT = select(AuthEpoch.subject_type, AuthEpoch.subject_id, AuthEpoch.epoch).where(
+    tuple_(AuthEpoch.subject_type, AuthEpoch.subject_id).in_(bindparam("keys", expanding=True))
+)
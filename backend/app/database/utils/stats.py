@@ -0,0 +1,108 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import Select, func, or_, select, text, union_all
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.database.models.user_stats import TenantSignupDay, TenantUserCount
+
+# (tenant_id, role_id, total delta, active delta)
+CountDelta = tuple[UUID, int, int, int]
+
+
+async def adjust_user_counts(db: AsyncSession, deltas: Iterable[CountDelta]) -> None:
+    """Apply counter deltas in a single upsert. Run it in the transaction making the change.
+
+    Deltas for the same (tenant, role) are merged first, since one INSERT .. ON CONFLICT
+    cannot touch a row twice; zero deltas are dropped.
+    """
+    totals: Counter[tuple[UUID, int]] = Counter()
+    actives: Counter[tuple[UUID, int]] = Counter()
+    for tenant_id, role_id, total, active in deltas:
+        totals[(tenant_id, role_id)] += total
+        actives[(tenant_id, role_id)] += active
+
+    rows = [
+        {"tenant_id": t, "role_id": r, "total": totals[(t, r)], "active": actives[(t, r)]}
+        for (t, r) in totals
+        if totals[(t, r)] or actives[(t, r)]
+    ]
+    if not rows:
+        return
+    await db.execute(_add_to_counts(insert(TenantUserCount).values(rows)))
+
+
+def user_count_changes(*deltas: Select) -> Insert:
+    """The counter upsert for delta rows selected by a statement that changes users.
+
+    Each of ``deltas`` selects (tenant_id, role_id, total, active) rows, typically
+    from the RETURNING rows of a data-modifying CTE; they are summed per (tenant,
+    role) and zero sums dropped. Attach the result to that statement as a CTE so
+    the counters move in the same round trip.
+    """
+    d = union_all(*deltas).subquery("deltas")
+    total, active = func.sum(d.c.total), func.sum(d.c.active)
+    rows = (
+        select(d.c.tenant_id, d.c.role_id, total, active)
+        .group_by(d.c.tenant_id, d.c.role_id)
+        .having(or_(total != 0, active != 0))
+    )
+    return _add_to_counts(
+        insert(TenantUserCount).from_select(["tenant_id", "role_id", "total", "active"], rows)
+    )
+
+
+def _add_to_counts(stmt: Insert) -> Insert:
+    return stmt.on_conflict_do_update(
+        index_elements=[TenantUserCount.tenant_id, TenantUserCount.role_id],
+        set_={
+            "total": TenantUserCount.total + stmt.excluded.total,
+            "active": TenantUserCount.active + stmt.excluded.active,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def signup_changes(signups: Select) -> Insert:
+    """The signup counter upsert for (tenant_id, day, count) rows, like ``user_count_changes``.
+
+    Each (tenant, day) may appear once.
+    """
+    return _add_to_signups(
+        insert(TenantSignupDay).from_select(["tenant_id", "day", "count"], signups)
+    )
+
+
+async def record_signups(db: AsyncSession, tenant_id: UUID, day: date, count: int = 1) -> None:
+    stmt = insert(TenantSignupDay).values(tenant_id=tenant_id, day=day, count=count)
+    await db.execute(_add_to_signups(stmt))
+
+
+def _add_to_signups(stmt: Insert) -> Insert:
+    return stmt.on_conflict_do_update(
+        index_elements=[TenantSignupDay.tenant_id, TenantSignupDay.day],
+        set_={"count": TenantSignupDay.count + stmt.excluded.count},
+    )
+
+
+async def rebuild_user_stats(db: AsyncSession | AsyncConnection) -> None:
+    """Recompute every counter from ``users``. For seeding and repair, not request paths."""
+    await db.execute(text("DELETE FROM tenant_user_counts"))
+    await db.execute(text("DELETE FROM tenant_signups_daily"))
+    await db.execute(
+        text(
+            "INSERT INTO tenant_user_counts (tenant_id, role_id, total, active) "
+            "SELECT tenant_id, role_id, count(*), count(*) FILTER (WHERE is_active) "
+            "FROM users WHERE deleted_at IS NULL GROUP BY tenant_id, role_id"
+        )
+    )
+    await db.execute(
+        text(
+            "INSERT INTO tenant_signups_daily (tenant_id, day, count) "
+            "SELECT tenant_id, (created_at AT TIME ZONE 'UTC')::date, count(*) "
+            "FROM users GROUP BY 1, 2"
+        )
+    )
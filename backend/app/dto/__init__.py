@@ -1,21 +1,46 @@
 from app.dto.auth import (
-    AccessTokenResponse,
     LoginRequest,
     RefreshTokenRequest,
+    SessionResponse,
     TokenResponse,
 )
-from app.dto.common import ErrorResponse, PaginatedResponse
+from app.dto.common import CursorPaginatedResponse, ErrorResponse, PaginatedResponse
+from app.dto.dashboard import DailySignups, DashboardStats, RoleCount
+from app.dto.job import JobResponse
+from app.dto.role import RoleResponse
 from app.dto.tenant import CreateTenantRequest, TenantResponse, UpdateTenantRequest
-from app.dto.user import CreateUserRequest, UpdateUserRequest, UserResponse
+from app.dto.user import (
+    BulkDeleteUsersRequest,
+    BulkUpdateUsersRequest,
+    BulkUserOutcome,
+    BulkUsersResponse,
+    CreateUserRequest,
+    ImportRowResult,
+    ImportUserRow,
+    UpdateUserRequest,
+    UserResponse,
+)
 
 __all__ = [
-    "AccessTokenResponse",
+    "BulkDeleteUsersRequest",
+    "BulkUpdateUsersRequest",
+    "BulkUserOutcome",
+    "BulkUsersResponse",
     "CreateTenantRequest",
     "CreateUserRequest",
+    "CursorPaginatedResponse",
+    "DailySignups",
+    "DashboardStats",
     "ErrorResponse",
+    "ImportRowResult",
+    "ImportUserRow",
+    "JobResponse",
     "LoginRequest",
     "PaginatedResponse",
     "RefreshTokenRequest",
+    "RoleCount",
+    "RoleResponse",
+    "SessionResponse",
     "TenantResponse",
     "TokenResponse",
     "UpdateTenantRequest",
@@ -1,5 +1,14 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
 from pydantic import BaseModel, EmailStr
 
+if TYPE_CHECKING:
+    from app.database.models.auth_session import AuthSession
+
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -16,6 +25,21 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
-class AccessTokenResponse(BaseModel):
-    access_token: str
-    token_type: str = "bearer"
+class SessionResponse(BaseModel):
+    id: UUID
+    user_agent: str | None
+    created_at: datetime
+    last_used_at: datetime
+    expires_at: datetime
+    current: bool
+
+    @classmethod
+    def from_entity(cls, session: AuthSession, current_session_id: UUID | None) -> SessionResponse:
+        return cls(
+            id=session.id,
+            user_agent=session.user_agent,
+            created_at=session.created_at,
+            last_used_at=session.last_used_at,
+            expires_at=session.expires_at,
+            current=session.id == current_session_id,
+        )
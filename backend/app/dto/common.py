@@ -6,11 +6,17 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     offset: int
     limit: int
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+    limit: int
+
+
 class ErrorResponse(BaseModel):
     code: str
     detail: str
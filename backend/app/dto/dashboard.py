@@ -0,0 +1,22 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class RoleCount(BaseModel):
+    role: str
+    total: int
+    active: int
+
+
+class DailySignups(BaseModel):
+    day: date
+    count: int
+
+
+class DashboardStats(BaseModel):
+    tenant: str
+    total_users: int
+    active_users: int
+    roles: list[RoleCount]
+    signups: list[DailySignups]  # one entry per day, oldest first, zero-filled
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from app.core.jobs import Job
+
+
+class JobResponse(BaseModel):
+    id: UUID
+    kind: str
+    subject_id: UUID
+    status: str
+    total: int | None
+    processed: int
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+
+    @classmethod
+    def from_job(cls, job: Job) -> JobResponse:
+        return cls(
+            id=job.id,
+            kind=job.kind,
+            subject_id=job.subject_id,
+            status=job.status,
+            total=job.total,
+            processed=job.processed,
+            error=job.error,
+            created_at=job.created_at,
+            finished_at=job.finished_at,
+        )
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class RoleResponse(BaseModel):
+    id: int
+    name: str
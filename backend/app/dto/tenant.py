@@ -28,13 +28,18 @@ class TenantResponse(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
+    @staticmethod
+    def values_of(tenant: Tenant) -> dict:
+        """The response fields of a tenant, unvalidated, for ``TrustedJSONResponse``."""
+        return {
+            "id": tenant.id,
+            "name": tenant.name,
+            "slug": tenant.slug,
+            "is_active": tenant.is_active,
+            "created_at": tenant.created_at,
+            "updated_at": tenant.updated_at,
+        }
+
     @classmethod
     def from_entity(cls, tenant: Tenant) -> TenantResponse:
-        return cls(
-            id=tenant.id,
-            name=tenant.name,
-            slug=tenant.slug,
-            is_active=tenant.is_active,
-            created_at=tenant.created_at,
-            updated_at=tenant.updated_at,
-        )
+        return cls(**cls.values_of(tenant))
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+from app.core.config import settings
+from app.core.roles import role_registry
 
 if TYPE_CHECKING:
+    from sqlalchemy import Row
+
+    from app.core.principal import Principal
     from app.database.models.user import User
 
 
@@ -17,11 +23,54 @@ class CreateUserRequest(BaseModel):
     tenant_id: UUID | None = None  # superadmin can assign to a specific tenant
 
 
+class ImportUserRow(BaseModel):
+    """One row of a bulk import: either a plaintext ``password`` or an existing bcrypt ``password_hash``."""
+
+    email: EmailStr
+    password: str | None = Field(default=None, min_length=1)
+    password_hash: str | None = Field(default=None, pattern=r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$")
+    role_id: int = 3
+
+    @model_validator(mode="after")
+    def _one_password(self) -> ImportUserRow:
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError("exactly one of password or password_hash is required")
+        return self
+
+
+class ImportRowResult(BaseModel):
+    row: int  # 1-based data row, not counting a CSV header
+    status: Literal["created", "exists", "invalid"]
+    email: str | None = None
+    id: UUID | None = None
+    error: str | None = None
+
+
 class UpdateUserRequest(BaseModel):
     role_id: int | None = None
     is_active: bool | None = None
 
 
+class BulkUpdateUsersRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=settings.USER_BULK_MAX_IDS)
+    role_id: int | None = None
+    is_active: bool | None = None
+
+
+class BulkDeleteUsersRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=settings.USER_BULK_MAX_IDS)
+
+
+class BulkUserOutcome(BaseModel):
+    id: UUID
+    status: Literal["updated", "deleted", "not_found", "protected"]
+
+
+class BulkUsersResponse(BaseModel):
+    items: list[BulkUserOutcome]  # one per distinct requested id, in request order
+    succeeded: int
+
+
 class UserResponse(BaseModel):
     id: UUID
     email: str
@@ -32,15 +81,47 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
+    @staticmethod
+    def values_of(user: User) -> dict:
+        """The response fields of a loaded user, unvalidated, for ``TrustedJSONResponse``."""
+        return {
+            "id": user.id,
+            "email": user.email,
+            "is_active": user.is_active,
+            "role": role_registry.name_of(user.role_id),
+            "tenant_id": user.tenant_id,
+            "tenant_name": user.tenant.name,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+
     @classmethod
     def from_entity(cls, user: User) -> UserResponse:
+        return cls(**cls.values_of(user))
+
+    @classmethod
+    def from_row(cls, row: Row) -> UserResponse:
+        """From user columns plus ``tenant_name``, as exports and writes return them."""
+        return cls(
+            id=row.id,
+            email=row.email,
+            is_active=row.is_active,
+            role=role_registry.name_of(row.role_id),
+            tenant_id=row.tenant_id,
+            tenant_name=row.tenant_name,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    @classmethod
+    def from_principal(cls, principal: Principal) -> UserResponse:
         return cls(
-            id=user.id,
-            email=user.email,
-            is_active=user.is_active,
-            role=user.role.name,
-            tenant_id=user.tenant_id,
-            tenant_name=user.tenant.name,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
+            id=principal.id,
+            email=principal.email,
+            is_active=principal.is_active,
+            role=principal.role_name,
+            tenant_id=principal.tenant_id,
+            tenant_name=principal.tenant_name,
+            created_at=principal.created_at,
+            updated_at=principal.updated_at,
         )
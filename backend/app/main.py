@@ -1,19 +1,63 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import exc as sa_exc
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api import auth, dashboard, tenants, users
+from app.api import auth, dashboard, roles, tenants, users
 from app.core.config import settings
-from app.database import get_db
-from app.core.exceptions import AppError, app_error_handler, unhandled_error_handler
+from app.core.hashing import password_hasher
+from app.core.instrumentation import MetricsMiddleware, route_metrics
+from app.core.jobs import job_registry
+from app.core.principal import principal_cache
+from app.core.roles import role_registry
+from app.core.sessions import session_store
+from app.database import async_session, engine, get_db
+from app.database.compiled_cache import compiled_cache_status
+from app.database.pool import pool_status
+from app.database.session import replica_engines
+from app.core.exceptions import (
+    AppError,
+    app_error_handler,
+    pool_timeout_handler,
+    unhandled_error_handler,
+)
+from app.services.dashboard_service import stats_cache
 from app.utils.logging import setup_logging
+from app.utils.metrics import prometheus_histogram, prometheus_samples
+from app.utils.security import token_cache
 
 setup_logging()
 
-app = FastAPI(title="SaaS API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    async with async_session() as db:
+        await role_registry.load(db)
+    purge = None
+    if settings.AUTH_SESSION_PURGE_INTERVAL_SECONDS > 0:
+        purge = asyncio.create_task(
+            session_store.purge_periodically(
+                async_session,
+                settings.AUTH_SESSION_PURGE_INTERVAL_SECONDS,
+                settings.AUTH_SESSION_PURGE_BATCH_SIZE,
+            )
+        )
+    yield
+    if purge is not None:
+        purge.cancel()
+    await job_registry.shutdown()
+    password_hasher.shutdown()
+
+
+app = FastAPI(title="SaaS API", version="0.1.0", lifespan=lifespan)
 
 app.add_exception_handler(AppError, app_error_handler)
+app.add_exception_handler(sa_exc.TimeoutError, pool_timeout_handler)
 app.add_exception_handler(Exception, unhandled_error_handler)
 
 app.add_middleware(
@@ -23,10 +67,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so it times everything below it and sees the final status code.
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, prefix="/api")
 app.include_router(tenants.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
+app.include_router(roles.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
 
 
@@ -39,3 +86,95 @@ async def health():
 async def readiness(db: AsyncSession = Depends(get_db)):
     await db.execute(text("SELECT 1"))
     return {"status": "ready"}
+
+
+@app.get("/health/pool")
+async def pool_health():
+    return pool_status(engine)
+
+
+@app.get("/health/statement-cache")
+async def statement_cache_health():
+    return compiled_cache_status(engine)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of request, pool, cache and password hashing metrics."""
+    pools = {"primary": pool_status(engine)} | {
+        f"replica{i}": pool_status(e) for i, e in enumerate(replica_engines)
+    }
+    statement_cache = compiled_cache_status(engine)
+    caches = {
+        "principal": principal_cache.stats(),
+        "dashboard": stats_cache.stats(),
+        "session": session_store.cache.stats(),
+        "token": token_cache.stats(),
+    }
+
+    lines = route_metrics.prometheus()
+    lines += prometheus_samples(
+        "db_pool_connections",
+        "gauge",
+        "Pool connections by pool and state.",
+        [
+            ({"pool": name, "state": state}, pool[state])
+            for name, pool in pools.items()
+            for state in ("checked_out", "checked_in", "overflow")
+        ],
+    )
+    lines += prometheus_samples(
+        "db_pool_timeouts_total",
+        "counter",
+        "Pool checkouts that timed out.",
+        [({"pool": name}, pool["timeouts"]) for name, pool in pools.items()],
+    )
+    lines += prometheus_histogram(
+        "db_pool_wait_seconds",
+        "Time to check out a connection.",
+        [({"pool": name}, pool["wait_seconds"]) for name, pool in pools.items()],
+    )
+    lines += prometheus_samples(
+        "db_compiled_cache_lookups_total",
+        "counter",
+        "SQLAlchemy compiled-statement cache lookups by result.",
+        [
+            ({"result": "hit"}, statement_cache["hits"]),
+            ({"result": "miss"}, statement_cache["misses"]),
+        ],
+    )
+    lines += prometheus_samples(
+        "db_compiled_cache_entries",
+        "gauge",
+        "Compiled statements cached.",
+        [({}, statement_cache["size"])],
+    )
+    lines += prometheus_samples(
+        "cache_lookups_total",
+        "counter",
+        "In-process cache lookups by result.",
+        [
+            ({"cache": name, "result": result}, stats[key])
+            for name, stats in caches.items()
+            for result, key in (("hit", "hits"), ("miss", "misses"))
+        ],
+    )
+    lines += prometheus_samples(
+        "cache_entries",
+        "gauge",
+        "In-process cache entries.",
+        [({"cache": name}, stats["size"]) for name, stats in caches.items()],
+    )
+    lines += prometheus_samples(
+        "password_hash_pending",
+        "gauge",
+        "Password hashes running or queued.",
+        [({}, password_hasher.pending)],
+    )
+    lines += prometheus_samples(
+        "password_hash_rejected_total",
+        "counter",
+        "Password hashes rejected because the worker pool was saturated.",
+        [({}, password_hasher.rejected)],
+    )
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
@@ -2,38 +2,32 @@ import logging
 from uuid import UUID
 
 import jwt
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from app.core.exceptions import ForbiddenError, UnauthorizedError
-from app.utils.security import (
-    create_access_token,
-    create_refresh_token,
-    decode_token,
-    verify_password,
-)
+
+from app.core.exceptions import ForbiddenError, NotFoundError, UnauthorizedError
+from app.core.hashing import password_hasher
+from app.core.revocation import revocation_epochs
+from app.core.roles import role_registry
+from app.core.sessions import SessionClaims, hash_token, session_store
+from app.utils.security import create_access_token, decode_token
+from app.database.models.auth_session import AuthSession
 from app.database.models.user import User
+from app.database.utils.statements import LIVE_USER_BY_EMAIL, USER_BY_ID
 
 logger = logging.getLogger(__name__)
 
 
-async def authenticate(email: str, password: str, db: AsyncSession) -> tuple[str, str]:
-    """Validate credentials and return (access_token, refresh_token)."""
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.tenant), selectinload(User.role))
-        .where(func.lower(User.email) == email.lower())
-    )
+async def authenticate(
+    email: str, password: str, db: AsyncSession, user_agent: str | None = None
+) -> tuple[str, str]:
+    """Validate credentials, open a session for the device and return (access_token, refresh_token)."""
+    result = await db.execute(LIVE_USER_BY_EMAIL, {"email": email.lower()})
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await password_hasher.verify(password, user.hashed_password):
         logger.warning("Login failed for email=%s", email)
         raise UnauthorizedError("INVALID_CREDENTIALS", "Invalid credentials")
 
-    if user.deleted_at is not None:
-        raise ForbiddenError("USER_DELETED", "User has been deleted")
-
     if not user.is_active:
         raise ForbiddenError("USER_DEACTIVATED", "User is deactivated")
 
@@ -43,15 +37,70 @@ async def authenticate(email: str, password: str, db: AsyncSession) -> tuple[str
     if not user.tenant.is_active:
         raise ForbiddenError("TENANT_DEACTIVATED", "Tenant is deactivated")
 
-    logger.info("Login success user=%s tenant=%s", user.id, user.tenant_id)
-    return (
-        create_access_token(user.id, user.tenant_id, user.role.name),
-        create_refresh_token(user.id),
-    )
+    claims, epochs = await _claims_of(user, db)
+    session_id, refresh_token = await session_store.open(db, claims, epochs, user_agent)
+    logger.info("Login success user=%s tenant=%s session=%s", user.id, user.tenant_id, session_id)
+    return _issue_access_token(claims, epochs, session_id), refresh_token
+
+
+async def refresh_tokens(refresh_token: str, db: AsyncSession) -> tuple[str, str]:
+    """Rotate a refresh token and return a new (access_token, refresh_token).
+
+    The presented token is spent: presenting it again means it leaked, and the
+    whole session is revoked.
+    """
+    payload = _decode_refresh_token(refresh_token)
+    session_id, token_id = UUID(payload["sid"]), UUID(payload["jti"])
+
+    rotated = await session_store.rotate(db, session_id, token_id, refresh_token)
+    if rotated is not None:
+        claims, new_refresh_token, epochs = rotated
+        return _issue_access_token(claims, epochs, session_id), new_refresh_token
+
+    # Not cached, or the cheap rotation refused: check everything against the database.
+    session = await session_store.load(db, session_id)
+    if session is None or session.revoked_at is not None:
+        raise UnauthorizedError("SESSION_REVOKED", "Session has been revoked")
+
+    if session.token_id != token_id or session.token_hash != hash_token(refresh_token):
+        await session_store.revoke(db, session.id, session.user_id)
+        logger.warning("Refresh token reuse session=%s user=%s", session.id, session.user_id)
+        raise UnauthorizedError("TOKEN_REUSED", "Refresh token was already used")
+
+    result = await db.execute(USER_BY_ID, {"user_id": session.user_id})
+    user = result.scalar_one_or_none()
+
+    if not user or user.deleted_at is not None or not user.is_active:
+        await session_store.revoke(db, session.id, session.user_id)
+        raise UnauthorizedError("USER_INACTIVE", "User not found or inactive")
+
+    if user.tenant.deleted_at is not None or not user.tenant.is_active:
+        await session_store.revoke(db, session.id, session.user_id)
+        raise UnauthorizedError("TENANT_INACTIVE", "Tenant not found or inactive")
+
+    claims, epochs = await _claims_of(user, db)
+    new_refresh_token = await session_store.reissue(db, session, claims, epochs)
+    return _issue_access_token(claims, epochs, session_id), new_refresh_token
+
+
+async def logout(refresh_token: str, db: AsyncSession) -> None:
+    """Revoke the session a refresh token belongs to. Already revoked is fine."""
+    payload = _decode_refresh_token(refresh_token)
+    await session_store.revoke(db, UUID(payload["sid"]), UUID(payload["sub"]))
+
 
+async def list_sessions(user_id: UUID, db: AsyncSession) -> list[AuthSession]:
+    return await session_store.list_live(db, user_id)
 
-async def refresh_access_token(refresh_token: str, db: AsyncSession) -> str:
-    """Validate a refresh token and return a new access token."""
+
+async def revoke_session(session_id: UUID, user_id: UUID, db: AsyncSession) -> None:
+    """Sign one of the caller's devices out."""
+    if not await session_store.revoke(db, session_id, user_id):
+        raise NotFoundError("SESSION_NOT_FOUND", "Session not found")
+    logger.info("Session revoked id=%s user=%s", session_id, user_id)
+
+
+def _decode_refresh_token(refresh_token: str) -> dict:
     try:
         payload = decode_token(refresh_token)
     except jwt.ExpiredSignatureError:
@@ -62,18 +111,32 @@ async def refresh_access_token(refresh_token: str, db: AsyncSession) -> str:
     if payload.get("type") != "refresh":
         raise UnauthorizedError("INVALID_TOKEN_TYPE", "Invalid token type")
 
-    user_id = payload.get("sub")
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.tenant), selectinload(User.role))
-        .where(User.id == UUID(user_id))
-    )
-    user = result.scalar_one_or_none()
+    # Refresh tokens from before server-side sessions carry no session.
+    if not payload.get("sid") or not payload.get("jti"):
+        raise UnauthorizedError("INVALID_TOKEN", "Invalid refresh token")
 
-    if not user or user.deleted_at is not None or not user.is_active:
-        raise UnauthorizedError("USER_INACTIVE", "User not found or inactive")
+    return payload
 
-    if user.tenant.deleted_at is not None or not user.tenant.is_active:
-        raise UnauthorizedError("TENANT_INACTIVE", "Tenant not found or inactive")
 
-    return create_access_token(user.id, user.tenant_id, user.role.name)
+async def _claims_of(user: User, db: AsyncSession) -> tuple[SessionClaims, tuple[int, int]]:
+    await role_registry.ensure_loaded(db)
+    epochs = await revocation_epochs.fetch(db, user.id, user.tenant_id)
+    claims = SessionClaims(
+        user_id=user.id,
+        tenant_id=user.tenant_id,
+        tenant_slug=user.tenant.slug,
+        role_name=role_registry.name_of(user.role_id),
+    )
+    return claims, epochs
+
+
+def _issue_access_token(claims: SessionClaims, epochs: tuple[int, int], session_id: UUID) -> str:
+    return create_access_token(
+        claims.user_id,
+        claims.tenant_id,
+        claims.role_name,
+        tenant_slug=claims.tenant_slug,
+        user_epoch=epochs[0],
+        tenant_epoch=epochs[1],
+        session_id=session_id,
+    )
@@ -0,0 +1,65 @@
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.principal import Principal
+from app.core.roles import role_registry
+from app.database.models.user_stats import TenantSignupDay, TenantUserCount
+from app.dto.dashboard import DailySignups, DashboardStats, RoleCount
+
+SIGNUP_WINDOW_DAYS = 30
+
+stats_cache: TTLCache[UUID, DashboardStats] = TTLCache(
+    maxsize=settings.DASHBOARD_CACHE_MAX_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_stats(tenant_id: UUID) -> None:
+    """Drop a tenant's cached stats. Call after committing a change to its users."""
+    stats_cache.pop(tenant_id)
+
+
+async def get_stats(current_user: Principal, db: AsyncSession) -> DashboardStats:
+    """Dashboard aggregates for the caller's tenant, read from the counter tables."""
+    cached = stats_cache.get(current_user.tenant_id)
+    if cached is not None:
+        return cached
+
+    counts = await db.execute(
+        select(TenantUserCount.role_id, TenantUserCount.total, TenantUserCount.active)
+        .where(TenantUserCount.tenant_id == current_user.tenant_id)
+        .order_by(TenantUserCount.role_id)
+    )
+    roles = [
+        RoleCount(role=role_registry.name_of(role_id), total=total, active=active)
+        for role_id, total, active in counts.all()
+        if total
+    ]
+
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=SIGNUP_WINDOW_DAYS - 1)
+    signup_rows = await db.execute(
+        select(TenantSignupDay.day, TenantSignupDay.count).where(
+            TenantSignupDay.tenant_id == current_user.tenant_id,
+            TenantSignupDay.day >= first_day,
+        )
+    )
+    per_day: dict[date, int] = dict(signup_rows.all())
+
+    stats = DashboardStats(
+        tenant=current_user.tenant_name,
+        total_users=sum(r.total for r in roles),
+        active_users=sum(r.active for r in roles),
+        roles=roles,
+        signups=[
+            DailySignups(day=day, count=per_day.get(day, 0))
+            for day in (first_day + timedelta(days=i) for i in range(SIGNUP_WINDOW_DAYS))
+        ],
+    )
+    stats_cache.set(current_user.tenant_id, stats)
+    return stats
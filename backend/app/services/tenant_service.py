@@ -1,69 +1,128 @@
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.dependencies import SYSTEM_TENANT_SLUG
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError
+from app.core.jobs import Job, job_registry
+from app.core.pagination import CountStrategy, encode_cursor
+from app.core.principal import invalidate_tenant
+from app.core.revocation import TENANT, revocation_epochs
 from app.database.models.tenant import Tenant
-from app.dto.tenant import CreateTenantRequest, UpdateTenantRequest
+from app.database.models.user import User
+from app.database.session import async_session
+from app.database.utils.common import fetch_page, keyset_page
+from app.database.utils.statements import LIVE_TENANT_BY_ID
+from app.dto.tenant import CreateTenantRequest, TenantResponse, UpdateTenantRequest
+from app.services import user_service
+from app.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
 
 async def list_tenants(
-    db: AsyncSession, *, offset: int = 0, limit: int = 50
-) -> tuple[list[Tenant], int]:
+    db: AsyncSession, *, offset: int = 0, limit: int = 50, count: CountStrategy = "exact"
+) -> tuple[list[Tenant], int | None]:
     """Return (tenants, total_count) with pagination. Excludes soft-deleted tenants."""
     base = select(Tenant).where(Tenant.deleted_at.is_(None))
 
-    count_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = count_result.scalar_one()
+    query = base.order_by(Tenant.created_at, Tenant.id)
+    return await fetch_page(db, query, offset=offset, limit=limit, count=count)
 
-    query = base.order_by(Tenant.created_at).offset(offset).limit(limit)
-    result = await db.execute(query)
-    return list(result.scalars().all()), total
+
+async def list_tenants_after(
+    db: AsyncSession, *, after: tuple[datetime, UUID] | None = None, limit: int = 50
+) -> tuple[list[Tenant], str | None]:
+    """Return (tenants, next_cursor) for the page following ``after`` in (created_at, id) order."""
+    base = select(Tenant).where(Tenant.deleted_at.is_(None))
+
+    result = await db.execute(
+        keyset_page(base, Tenant.created_at, Tenant.id, after=after, limit=limit)
+    )
+    tenants = list(result.scalars().all())
+    if len(tenants) <= limit:
+        return tenants, None
+    last = tenants[limit - 1]
+    return tenants[:limit], encode_cursor(last.created_at, last.id)
+
+
+async def export_tenants(db: AsyncSession) -> AsyncIterator[TenantResponse]:
+    """Yield every live tenant in (created_at, id) order from a server-side cursor."""
+    query = (
+        select(Tenant)
+        .where(Tenant.deleted_at.is_(None))
+        .order_by(Tenant.created_at, Tenant.id)
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+    tenants = await db.stream_scalars(query)
+    async for tenant in tenants:
+        yield TenantResponse.from_entity(tenant)
 
 
 async def create_tenant(body: CreateTenantRequest, db: AsyncSession) -> Tenant:
-    existing = await db.execute(
-        select(Tenant).where(Tenant.slug == body.slug, Tenant.deleted_at.is_(None))
+    """Insert a tenant, or raise ``ConflictError`` if a live one has the slug. One statement."""
+    result = await db.execute(
+        insert(Tenant)
+        .values(id=uuid7(), name=body.name, slug=body.slug, is_active=True)
+        .on_conflict_do_nothing(
+            index_elements=[Tenant.slug], index_where=Tenant.deleted_at.is_(None)
+        )
+        .returning(Tenant)
     )
-    if existing.scalar_one_or_none():
+    tenant = result.scalar_one_or_none()
+    if tenant is None:
         raise ConflictError("SLUG_EXISTS", "Slug already exists")
-
-    tenant = Tenant(name=body.name, slug=body.slug)
-    db.add(tenant)
     await db.commit()
-    await db.refresh(tenant)
 
     logger.info("Tenant created id=%s slug=%s", tenant.id, tenant.slug)
     return tenant
 
 
-async def update_tenant(
-    tenant_id: UUID, body: UpdateTenantRequest, db: AsyncSession
-) -> Tenant:
+async def _write_tenant(tenant_id: UUID, values: dict, db: AsyncSession, *, verb: str) -> Tenant:
+    """Apply ``values`` to a live tenant other than the system one and return it, in one statement."""
     result = await db.execute(
-        select(Tenant).where(Tenant.id == tenant_id, Tenant.deleted_at.is_(None))
+        update(Tenant)
+        .where(
+            Tenant.id == tenant_id,
+            Tenant.deleted_at.is_(None),
+            Tenant.slug != SYSTEM_TENANT_SLUG,
+        )
+        .values(**values)
+        .returning(Tenant)
     )
     tenant = result.scalar_one_or_none()
-    if not tenant:
-        raise NotFoundError("TENANT_NOT_FOUND", "Tenant not found")
+    if tenant is not None:
+        return tenant
+
+    # Nothing written: tell a missing tenant from the protected one.
+    result = await db.execute(LIVE_TENANT_BY_ID, {"tenant_id": tenant_id})
+    if result.scalar_one_or_none():
+        raise ForbiddenError("SYSTEM_TENANT_PROTECTED", f"Cannot {verb} system tenant")
+    raise NotFoundError("TENANT_NOT_FOUND", "Tenant not found")
 
-    if tenant.slug == SYSTEM_TENANT_SLUG:
-        raise ForbiddenError("SYSTEM_TENANT_PROTECTED", "Cannot modify system tenant")
 
+async def update_tenant(
+    tenant_id: UUID, body: UpdateTenantRequest, db: AsyncSession
+) -> Tenant:
+    values: dict = {"updated_at": func.now()}
     if body.name is not None:
-        tenant.name = body.name
+        values["name"] = body.name
     if body.is_active is not None:
-        tenant.is_active = body.is_active
+        values["is_active"] = body.is_active
+    tenant = await _write_tenant(tenant_id, values, db, verb="modify")
 
-    tenant.updated_at = datetime.now(timezone.utc)
+    if body.is_active is False:
+        await revocation_epochs.bump(db, TENANT, tenant_id)
     await db.commit()
-    await db.refresh(tenant)
+    invalidate_tenant(tenant_id)
 
     logger.info("Tenant updated id=%s", tenant_id)
     return tenant
@@ -71,18 +130,80 @@ async def update_tenant(
 
 async def delete_tenant(tenant_id: UUID, db: AsyncSession) -> None:
     """Soft-delete a tenant by setting deleted_at timestamp."""
-    result = await db.execute(
-        select(Tenant).where(Tenant.id == tenant_id, Tenant.deleted_at.is_(None))
+    await _write_tenant(
+        tenant_id,
+        {"deleted_at": func.now(), "updated_at": func.now(), "is_active": False},
+        db,
+        verb="delete",
     )
-    tenant = result.scalar_one_or_none()
-    if not tenant:
-        raise NotFoundError("TENANT_NOT_FOUND", "Tenant not found")
-
-    if tenant.slug == SYSTEM_TENANT_SLUG:
-        raise ForbiddenError("SYSTEM_TENANT_PROTECTED", "Cannot delete system tenant")
-
-    tenant.deleted_at = datetime.now(timezone.utc)
-    tenant.updated_at = datetime.now(timezone.utc)
-    tenant.is_active = False
+    await revocation_epochs.bump(db, TENANT, tenant_id)
     await db.commit()
+    invalidate_tenant(tenant_id)
     logger.info("Tenant soft-deleted id=%s", tenant_id)
+
+
+def start_user_cascade(tenant_id: UUID, *, delete: bool) -> Job:
+    """Soft-delete (or deactivate) all of a tenant's users in the background, in chunks.
+
+    Run it after the tenant itself was deleted or deactivated: that already revoked
+    every token, this brings the user rows in line. Safe to run again, which
+    ``rerun_user_cascade`` does for a job that failed or died with its worker. Users locked
+    by other transactions are retried until none of them has changed for
+    ``TENANT_CASCADE_LOCK_TIMEOUT_SECONDS``; the job then fails rather than claim
+    success with users left behind.
+    """
+    async def work(job: Job) -> None:
+        async with async_session() as db:
+            remaining = select(func.count()).select_from(User).where(
+                User.tenant_id == tenant_id, User.deleted_at.is_(None)
+            )
+            if not delete:
+                remaining = remaining.where(User.is_active.is_(True))
+            job.total = (await db.execute(remaining)).scalar_one()
+            await db.commit()
+
+            deadline = time.monotonic() + settings.TENANT_CASCADE_LOCK_TIMEOUT_SECONDS
+            while True:
+                changed = await user_service.cascade_tenant_users(
+                    tenant_id, db, delete=delete, limit=settings.TENANT_CASCADE_CHUNK_SIZE
+                )
+                if changed:
+                    job.processed += changed
+                    deadline = time.monotonic() + settings.TENANT_CASCADE_LOCK_TIMEOUT_SECONDS
+                    await asyncio.sleep(0)
+                    continue
+                # Nothing changed: either nothing is left, or all of it is locked right now.
+                left = (await db.execute(remaining)).scalar_one()
+                await db.commit()
+                if not left:
+                    return
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"{left} users stayed locked by other transactions; "
+                        f"retry with POST /api/admin/tenants/{tenant_id}/cascade"
+                    )
+                await asyncio.sleep(settings.TENANT_CASCADE_LOCK_RETRY_SECONDS)
+
+    kind = "tenant_users_delete" if delete else "tenant_users_deactivate"
+    job = job_registry.start(kind, tenant_id, work)
+    logger.info("Tenant cascade started id=%s job=%s kind=%s", tenant_id, job.id, kind)
+    return job
+
+
+async def rerun_user_cascade(tenant_id: UUID, db: AsyncSession) -> Job:
+    """Start the user cascade again for a tenant already deleted or deactivated.
+
+    The tenant's state picks the kind: a deleted tenant's users are soft-deleted, a
+    deactivated one's deactivated. An active tenant has nothing to cascade.
+    """
+    result = await db.execute(
+        select(Tenant.deleted_at, Tenant.is_active).where(
+            Tenant.id == tenant_id, Tenant.slug != SYSTEM_TENANT_SLUG
+        )
+    )
+    tenant = result.one_or_none()
+    if tenant is None:
+        raise NotFoundError("TENANT_NOT_FOUND", "Tenant not found")
+    if tenant.deleted_at is None and tenant.is_active:
+        raise ConflictError("TENANT_ACTIVE", "Deactivate or delete the tenant first")
+    return start_user_cascade(tenant_id, delete=tenant.deleted_at is not None)
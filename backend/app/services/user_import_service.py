@@ -0,0 +1,273 @@
+import codecs
+import csv
+import heapq
+import json
+import logging
+from collections import Counter
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.dependencies import is_superadmin
+from app.core.exceptions import AppError, NotFoundError
+from app.core.hashing import password_hasher
+from app.core.principal import Identity
+from app.core.roles import role_registry
+from app.database.models.tenant import Tenant
+from app.database.models.user import User
+from app.database.utils.stats import adjust_user_counts, record_signups
+from app.dto.user import ImportRowResult, ImportUserRow
+from app.services.dashboard_service import invalidate_stats
+from app.utils.ids import uuid7
+
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+CONTENT_TYPES: dict[str, ImportFormat] = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def import_format(content_type: str | None) -> ImportFormat:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in CONTENT_TYPES:
+        raise AppError(
+            "UNSUPPORTED_FORMAT",
+            f"Expected one of {', '.join(CONTENT_TYPES)}, got {media_type or 'nothing'}",
+            status=415,
+        )
+    return CONTENT_TYPES[media_type]
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines (endings kept) without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line + "\n"
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+async def _records(
+    chunks: AsyncIterator[bytes], fmt: ImportFormat
+) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """Yield (row number, fields, parse error) for each non-blank input row.
+
+    CSV input needs a header line naming its columns; empty cells count as absent.
+    """
+    row = 0
+    header: list[str] | None = None
+    record = ""
+    async for line in _lines(chunks):
+        if fmt == "ndjson":
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                fields = json.loads(line)
+            except ValueError as e:
+                yield row, None, f"invalid JSON: {e}"
+                continue
+            if not isinstance(fields, dict):
+                yield row, None, "expected a JSON object"
+                continue
+            yield row, fields, None
+            continue
+
+        record += line
+        if record.count('"') % 2:
+            continue  # a quoted field spans lines
+        text, record = record, ""
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [v.strip().lower() for v in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row, {k: v for k, v in zip(header, values) if v != ""}, None
+
+
+def _email_of(fields: dict) -> str | None:
+    email = fields.get("email")
+    return email if isinstance(email, str) else None
+
+
+async def resolve_tenant(current_user: Identity, db: AsyncSession, tenant_id: UUID | None) -> UUID:
+    """The tenant an import by ``current_user`` writes to; only superadmins may pick another one.
+
+    Checked before the import starts streaming, while an error can still be the response.
+    """
+    if tenant_id is None or not is_superadmin(current_user) or tenant_id == current_user.tenant_id:
+        return current_user.tenant_id
+    result = await db.execute(
+        select(Tenant.id).where(Tenant.id == tenant_id, Tenant.deleted_at.is_(None))
+    )
+    if result.scalar_one_or_none() is None:
+        raise NotFoundError("TENANT_NOT_FOUND", "Tenant not found")
+    return tenant_id
+
+
+async def _insert_batch(
+    batch: list[tuple[int, ImportUserRow]], tenant_id: UUID, db: AsyncSession
+) -> list[ImportRowResult]:
+    """Hash, insert and commit one batch; rows whose email is taken are reported as ``exists``."""
+    plaintext = [r.password for _, r in batch if r.password is not None]
+    hashed = iter(await password_hasher.hash_many(plaintext))
+    values = [
+        {
+            "id": uuid7(),
+            "email": r.email,
+            "hashed_password": r.password_hash if r.password is None else next(hashed),
+            "is_active": True,
+            "tenant_id": tenant_id,
+            "role_id": r.role_id,
+        }
+        for _, r in batch
+    ]
+
+    # Parameters as a list (not .values(...)) keep one cached compiled statement that
+    # SQLAlchemy expands into multi-row INSERTs ("insertmanyvalues").
+    result = await db.execute(
+        insert(User).on_conflict_do_nothing().returning(User.id, User.email), values
+    )
+    created = {email: user_id for user_id, email in result.all()}
+
+    roles = Counter(r.role_id for _, r in batch if r.email in created)
+    await adjust_user_counts(db, [(tenant_id, role_id, n, n) for role_id, n in roles.items()])
+    if created:
+        await record_signups(db, tenant_id, datetime.now(timezone.utc).date(), len(created))
+    await db.commit()
+
+    return [
+        ImportRowResult(row=row, status="created", email=r.email, id=created[r.email])
+        if r.email in created
+        else ImportRowResult(row=row, status="exists", email=r.email, error="Email already exists")
+        for row, r in batch
+    ]
+
+
+def _parse_row(
+    row: int, fields: dict | None, error: str | None, seen: set[str]
+) -> tuple[ImportUserRow | None, ImportRowResult | None]:
+    """Validate one input row: the row to insert, or the result reporting it invalid."""
+    if error is not None:
+        return None, ImportRowResult(row=row, status="invalid", error=error)
+
+    try:
+        parsed = ImportUserRow.model_validate(fields)
+        role_registry.validate(parsed.role_id)
+    except ValidationError as e:
+        err = e.errors()[0]
+        where = ".".join(str(p) for p in err["loc"])
+        return None, ImportRowResult(
+            row=row,
+            status="invalid",
+            email=_email_of(fields),
+            error=f"{where}: {err['msg']}" if where else err["msg"],
+        )
+    except AppError as e:
+        return None, ImportRowResult(
+            row=row, status="invalid", email=_email_of(fields), error=e.message
+        )
+
+    key = parsed.email.lower()
+    if key in seen:
+        return None, ImportRowResult(
+            row=row, status="invalid", email=parsed.email, error="Duplicate email in import"
+        )
+    seen.add(key)
+    return parsed, None
+
+
+async def _flush(
+    batch: list[tuple[int, ImportUserRow]],
+    held: list[ImportRowResult],
+    tenant_id: UUID,
+    db: AsyncSession,
+) -> list[ImportRowResult]:
+    """Commit ``batch`` and return its results and the ``held`` invalid rows, in row order."""
+    inserted = await _insert_batch(batch, tenant_id, db) if batch else []
+    return list(heapq.merge(inserted, held, key=lambda r: r.row))
+
+
+async def import_users(
+    chunks: AsyncIterator[bytes],
+    fmt: ImportFormat,
+    current_user: Identity,
+    db: AsyncSession,
+    tenant_id: UUID,
+) -> AsyncIterator[ImportRowResult]:
+    """Create users from a CSV/NDJSON stream, yielding one result per input row, in order.
+
+    ``tenant_id`` comes from ``resolve_tenant``. Rows are validated as they arrive and
+    written in batches of ``USER_IMPORT_BATCH_SIZE`` with a multi-row
+    ``INSERT .. ON CONFLICT DO NOTHING``, each batch in its own transaction. A batch's
+    results are yielded as soon as it commits, together with the invalid rows read
+    since the previous one, so a failure part-way has already reported every row
+    that was created.
+    """
+    await role_registry.ensure_loaded(db)
+
+    batch: list[tuple[int, ImportUserRow]] = []
+    held: list[ImportRowResult] = []  # invalid rows waiting for the batch around them
+    seen: set[str] = set()
+    counts: Counter[str] = Counter()
+
+    try:
+        async for row, fields, error in _records(chunks, fmt):
+            over_limit = row > settings.USER_IMPORT_MAX_ROWS
+            if over_limit:
+                parsed, invalid = None, ImportRowResult(
+                    row=row,
+                    status="invalid",
+                    error=(
+                        f"Row limit of {settings.USER_IMPORT_MAX_ROWS} exceeded, "
+                        "rest of input ignored"
+                    ),
+                )
+            else:
+                parsed, invalid = _parse_row(row, fields, error, seen)
+
+            if invalid is not None:
+                held.append(invalid)
+            else:
+                batch.append((row, parsed))
+            if over_limit:
+                break
+            if not batch or len(batch) >= settings.USER_IMPORT_BATCH_SIZE:
+                for result in await _flush(batch, held, tenant_id, db):
+                    counts[result.status] += 1
+                    yield result
+                batch, held = [], []
+
+        for result in await _flush(batch, held, tenant_id, db):
+            counts[result.status] += 1
+            yield result
+    finally:
+        # Batches already committed are visible even if a later one failed.
+        invalidate_stats(tenant_id)
+
+    logger.info(
+        "Users imported tenant=%s created=%s rows=%s by=%s",
+        tenant_id, counts["created"], counts.total(), current_user.id,
+    )
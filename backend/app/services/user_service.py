@@ -1,114 +1,440 @@
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, Row, any_, bindparam, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.core.dependencies import is_superadmin
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError
-from app.utils.security import hash_password
-from app.database.utils.common import tenant_filter
+from app.core.pagination import CountStrategy, encode_cursor
+from app.core.hashing import password_hasher
+from app.core.principal import Identity, invalidate_user, invalidate_users
+from app.core.revocation import USER, revocation_epochs
+from app.core.roles import role_registry
+from app.database.utils.common import fetch_page, keyset_page, tenant_filter
+from app.database.utils.stats import adjust_user_counts, signup_changes, user_count_changes
+from app.database.models.tenant import Tenant
 from app.database.models.user import User
-from app.dto.user import CreateUserRequest, UpdateUserRequest
+from app.database.utils.loaders import USER_RELATIONS
+from app.database.utils.statements import (
+    LIVE_USER_BY_ID,
+    LIVE_USER_BY_ID_IN_TENANT,
+)
+from app.dto.user import (
+    BulkDeleteUsersRequest,
+    BulkUpdateUsersRequest,
+    BulkUserOutcome,
+    BulkUsersResponse,
+    CreateUserRequest,
+    UpdateUserRequest,
+    UserResponse,
+)
+from app.services.dashboard_service import invalidate_stats
+from app.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
 
 async def list_users(
-    current_user: User, db: AsyncSession, *, offset: int = 0, limit: int = 50
-) -> tuple[list[User], int]:
+    current_user: Identity,
+    db: AsyncSession,
+    *,
+    offset: int = 0,
+    limit: int = 50,
+    count: CountStrategy = "exact",
+) -> tuple[list[User], int | None]:
     """Return (users, total_count) with pagination. Excludes soft-deleted users."""
-    base = select(User).options(selectinload(User.role), selectinload(User.tenant))
+    base = select(User).options(*USER_RELATIONS)
     base = base.where(User.deleted_at.is_(None))
     base = tenant_filter(base, current_user, User.tenant_id)
 
-    count_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = count_result.scalar_one()
+    query = base.order_by(User.created_at, User.id)
+    return await fetch_page(db, query, offset=offset, limit=limit, count=count)
 
-    query = base.order_by(User.created_at).offset(offset).limit(limit)
-    result = await db.execute(query)
-    return list(result.scalars().all()), total
 
+async def list_users_after(
+    current_user: Identity,
+    db: AsyncSession,
+    *,
+    after: tuple[datetime, UUID] | None = None,
+    limit: int = 50,
+) -> tuple[list[User], str | None]:
+    """Return (users, next_cursor) for the page following ``after`` in (created_at, id) order."""
+    base = select(User).options(*USER_RELATIONS)
+    base = base.where(User.deleted_at.is_(None))
+    base = tenant_filter(base, current_user, User.tenant_id)
+
+    result = await db.execute(keyset_page(base, User.created_at, User.id, after=after, limit=limit))
+    users = list(result.scalars().all())
+    if len(users) <= limit:
+        return users, None
+    last = users[limit - 1]
+    return users[:limit], encode_cursor(last.created_at, last.id)
+
+
+async def export_users(current_user: Identity, db: AsyncSession) -> AsyncIterator[UserResponse]:
+    """Yield every live user visible to ``current_user`` in (created_at, id) order.
 
-async def create_user(body: CreateUserRequest, current_user: User, db: AsyncSession) -> User:
-    existing = await db.execute(
-        select(User).where(User.email == body.email, User.deleted_at.is_(None))
+    Reads plain columns through a server-side cursor, ``EXPORT_BATCH_SIZE`` rows per
+    fetch, so memory stays flat however many users there are.
+    """
+    await role_registry.ensure_loaded(db)
+    query = (
+        select(
+            User.id,
+            User.email,
+            User.is_active,
+            User.role_id,
+            User.tenant_id,
+            Tenant.name.label("tenant_name"),
+            User.created_at,
+            User.updated_at,
+        )
+        .join(Tenant, Tenant.id == User.tenant_id)
+        .where(User.deleted_at.is_(None))
     )
-    if existing.scalar_one_or_none():
-        raise ConflictError("EMAIL_EXISTS", "Email already exists")
+    query = tenant_filter(query, current_user, User.tenant_id)
+    query = query.order_by(User.created_at, User.id).execution_options(
+        yield_per=settings.EXPORT_BATCH_SIZE
+    )
+
+    result = await db.stream(query)
+    async for row in result:
+        yield UserResponse.from_row(row)
+
+
+async def _live_user(user_id: UUID, current_user: Identity, db: AsyncSession) -> User | None:
+    if is_superadmin(current_user):
+        result = await db.execute(LIVE_USER_BY_ID, {"user_id": user_id})
+    else:
+        result = await db.execute(
+            LIVE_USER_BY_ID_IN_TENANT, {"user_id": user_id, "tenant_id": current_user.tenant_id}
+        )
+    return result.scalar_one_or_none()
+
+
+# Columns a write returns, enough for a UserResponse together with the tenant name.
+_RETURNED = (
+    User.id,
+    User.email,
+    User.is_active,
+    User.role_id,
+    User.tenant_id,
+    User.created_at,
+    User.updated_at,
+)
+
+
+def _as_int(flag) -> object:
+    return cast(flag, Integer)
+
+
+async def create_user(body: CreateUserRequest, current_user: Identity, db: AsyncSession) -> Row:
+    """Insert a user and bump the tenant's counters in one statement.
+
+    A live user with the same email (case-insensitively) makes the insert a no-op
+    and raises ``ConflictError``, also when both are created at the same time.
+    Returns the new user's columns plus ``tenant_name``.
+    """
+    role_registry.validate(body.role_id)
 
     target_tenant_id = current_user.tenant_id
     if body.tenant_id is not None and is_superadmin(current_user):
         target_tenant_id = body.tenant_id
 
-    new_user = User(
-        email=body.email,
-        hashed_password=hash_password(body.password),
-        tenant_id=target_tenant_id,
-        role_id=body.role_id,
+    new = (
+        insert(User)
+        .values(
+            id=uuid7(),
+            email=body.email,
+            hashed_password=await password_hasher.hash(body.password),
+            is_active=True,
+            tenant_id=target_tenant_id,
+            role_id=body.role_id,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[func.lower(User.email)], index_where=User.deleted_at.is_(None)
+        )
+        .returning(*_RETURNED)
+        .cte("new")
+    )
+    # Derived from the inserted row, so a conflict leaves the counters alone too.
+    counts = user_count_changes(
+        select(new.c.tenant_id, new.c.role_id, literal(1).label("total"), literal(1).label("active"))
+    ).cte("counts")
+    signups = signup_changes(
+        select(new.c.tenant_id, literal(datetime.now(timezone.utc).date()), literal(1))
+    ).cte("signups")
+    result = await db.execute(
+        select(*new.c, Tenant.name.label("tenant_name"))
+        .join(Tenant, Tenant.id == new.c.tenant_id)
+        .add_cte(counts, signups)
     )
-    db.add(new_user)
+    created = result.one_or_none()
+    if created is None:
+        raise ConflictError("EMAIL_EXISTS", "Email already exists")
     await db.commit()
-    await db.refresh(new_user, attribute_names=["role", "tenant"])
+    invalidate_stats(target_tenant_id)
 
-    logger.info("User created id=%s by=%s", new_user.id, current_user.id)
-    return new_user
+    logger.info("User created id=%s by=%s", created.id, current_user.id)
+    return created
 
 
-async def update_user(
-    user_id: UUID, body: UpdateUserRequest, current_user: User, db: AsyncSession
-) -> User:
-    query = (
-        select(User)
-        .options(selectinload(User.role), selectinload(User.tenant))
-        .where(User.id == user_id, User.deleted_at.is_(None))
+async def _write_user(
+    user_id: UUID, values: dict, current_user: Identity, db: AsyncSession, *, deleting: bool
+) -> Row:
+    """Apply ``values`` to a live, visible, non-superadmin user and its counters in one statement.
+
+    Returns the user's new columns plus ``tenant_name`` and its previous
+    ``role_id_before``/``is_active_before``. Raises if there is no such user.
+    """
+    await role_registry.ensure_loaded(db)
+    before = select(User.id, User.tenant_id, User.role_id, User.is_active).where(
+        User.id == user_id,
+        User.deleted_at.is_(None),
+        User.role_id != role_registry.id_of("superadmin"),
+    )
+    before = tenant_filter(before, current_user, User.tenant_id).with_for_update().cte("before")
+    changed = (
+        update(User)
+        .where(User.id == before.c.id)
+        .values(**values)
+        .returning(*_RETURNED)
+        .cte("changed")
     )
-    if not is_superadmin(current_user):
-        query = query.where(User.tenant_id == current_user.tenant_id)
+    deltas = [
+        select(
+            before.c.tenant_id,
+            before.c.role_id,
+            literal(-1).label("total"),
+            (-_as_int(before.c.is_active)).label("active"),
+        )
+    ]
+    if not deleting:
+        deltas.append(
+            select(
+                changed.c.tenant_id,
+                changed.c.role_id,
+                literal(1).label("total"),
+                _as_int(changed.c.is_active).label("active"),
+            )
+        )
+    counts = user_count_changes(*deltas).cte("counts")
+    result = await db.execute(
+        select(
+            *changed.c,
+            Tenant.name.label("tenant_name"),
+            before.c.role_id.label("role_id_before"),
+            before.c.is_active.label("is_active_before"),
+        )
+        .join(before, before.c.id == changed.c.id)
+        .join(Tenant, Tenant.id == changed.c.tenant_id)
+        .add_cte(counts)
+    )
+    row = result.one_or_none()
+    if row is not None:
+        return row
 
-    result = await db.execute(query)
-    target = result.scalar_one_or_none()
-    if not target:
-        raise NotFoundError("USER_NOT_FOUND", "User not found")
+    # Nothing written: tell a missing user from a protected one.
+    if await _live_user(user_id, current_user, db):
+        verb = "delete" if deleting else "modify"
+        raise ForbiddenError("SUPERADMIN_PROTECTED", f"Cannot {verb} superadmin account")
+    raise NotFoundError("USER_NOT_FOUND", "User not found")
 
-    if target.role.name == "superadmin":
-        raise ForbiddenError("SUPERADMIN_PROTECTED", "Cannot modify superadmin account")
 
+async def update_user(
+    user_id: UUID, body: UpdateUserRequest, current_user: Identity, db: AsyncSession
+) -> Row:
+    """Returns the updated user's columns plus ``tenant_name``."""
     if body.role_id is not None:
-        target.role_id = body.role_id
+        role_registry.validate(body.role_id)
+
+    values: dict = {"updated_at": func.now()}
+    if body.role_id is not None:
+        values["role_id"] = body.role_id
     if body.is_active is not None:
-        target.is_active = body.is_active
+        values["is_active"] = body.is_active
+    updated = await _write_user(user_id, values, current_user, db, deleting=False)
 
-    target.updated_at = datetime.now(timezone.utc)
+    # Tokens carry the role and rely on is_active for revocation, so either change
+    # must invalidate the tokens already issued to the user.
+    if updated.role_id != updated.role_id_before or body.is_active is False:
+        await revocation_epochs.bump(db, USER, user_id)
     await db.commit()
-    await db.refresh(target, attribute_names=["role", "tenant"])
+    invalidate_user(user_id)
+    invalidate_stats(updated.tenant_id)
 
     logger.info("User updated id=%s by=%s", user_id, current_user.id)
-    return target
+    return updated
 
 
-async def delete_user(user_id: UUID, current_user: User, db: AsyncSession) -> None:
+async def delete_user(user_id: UUID, current_user: Identity, db: AsyncSession) -> None:
     """Soft-delete a user by setting deleted_at timestamp."""
-    query = (
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user_id, User.deleted_at.is_(None))
+    deleted = await _write_user(
+        user_id,
+        {"deleted_at": func.now(), "updated_at": func.now(), "is_active": False},
+        current_user,
+        db,
+        deleting=True,
     )
-    if not is_superadmin(current_user):
-        query = query.where(User.tenant_id == current_user.tenant_id)
+    await revocation_epochs.bump(db, USER, user_id)
+    await db.commit()
+    invalidate_user(user_id)
+    invalidate_stats(deleted.tenant_id)
+    logger.info("User soft-deleted id=%s by=%s", user_id, current_user.id)
 
-    result = await db.execute(query)
-    target = result.scalar_one_or_none()
-    if not target:
-        raise NotFoundError("USER_NOT_FOUND", "User not found")
 
-    if target.role.name == "superadmin":
-        raise ForbiddenError("SUPERADMIN_PROTECTED", "Cannot delete superadmin account")
+async def _bulk_apply(
+    ids: list[UUID], values: dict, current_user: Identity, db: AsyncSession
+) -> list[Row]:
+    """Apply ``values`` to the live, visible, non-superadmin users among ``ids`` in one statement.
 
-    target.deleted_at = datetime.now(timezone.utc)
-    target.updated_at = datetime.now(timezone.utc)
-    target.is_active = False
+    Returns one row per visible user with its *previous* tenant_id, role_id and
+    is_active, plus ``changed`` telling whether it was updated (false means protected).
+    """
+    found = select(User.id, User.tenant_id, User.role_id, User.is_active).where(
+        User.id == any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))),
+        User.deleted_at.is_(None),
+    )
+    found = tenant_filter(found, current_user, User.tenant_id).with_for_update().cte("found")
+    changed = (
+        update(User)
+        .where(User.id == found.c.id, found.c.role_id != role_registry.id_of("superadmin"))
+        .values(**values)
+        .returning(User.id)
+        .cte("changed")
+    )
+    result = await db.execute(
+        select(
+            found.c.id,
+            found.c.tenant_id,
+            found.c.role_id,
+            found.c.is_active,
+            changed.c.id.is_not(None).label("changed"),
+        ).outerjoin(changed, changed.c.id == found.c.id)
+    )
+    return list(result.all())
+
+
+def _outcomes(ids: list[UUID], rows: list[Row], done: str) -> BulkUsersResponse:
+    status = {row.id: done if row.changed else "protected" for row in rows}
+    items = [BulkUserOutcome(id=i, status=status.get(i, "not_found")) for i in ids]
+    return BulkUsersResponse(items=items, succeeded=sum(1 for row in rows if row.changed))
+
+
+def _after_bulk_commit(rows: list[Row]) -> None:
+    invalidate_users([row.id for row in rows if row.changed])
+    for tenant_id in {row.tenant_id for row in rows if row.changed}:
+        invalidate_stats(tenant_id)
+
+
+async def bulk_update_users(
+    body: BulkUpdateUsersRequest, current_user: Identity, db: AsyncSession
+) -> BulkUsersResponse:
+    """Set role and/or active flag on many users with a single UPDATE.
+
+    Same rules as ``update_user``: other tenants' users are reported ``not_found``,
+    superadmins ``protected``.
+    """
+    if body.role_id is not None:
+        role_registry.validate(body.role_id)
+    await role_registry.ensure_loaded(db)
+
+    ids = list(dict.fromkeys(body.ids))
+    values: dict = {"updated_at": func.now()}
+    if body.role_id is not None:
+        values["role_id"] = body.role_id
+    if body.is_active is not None:
+        values["is_active"] = body.is_active
+
+    rows = await _bulk_apply(ids, values, current_user, db)
+    updated = [row for row in rows if row.changed]
+
+    await revocation_epochs.bump_many(
+        db,
+        USER,
+        [
+            row.id
+            for row in updated
+            if (body.role_id is not None and body.role_id != row.role_id) or body.is_active is False
+        ],
+    )
+    deltas = []
+    for row in updated:
+        role_id = row.role_id if body.role_id is None else body.role_id
+        is_active = row.is_active if body.is_active is None else body.is_active
+        deltas.append((row.tenant_id, row.role_id, -1, -int(row.is_active)))
+        deltas.append((row.tenant_id, role_id, 1, int(is_active)))
+    await adjust_user_counts(db, deltas)
     await db.commit()
-    logger.info("User soft-deleted id=%s by=%s", user_id, current_user.id)
+    _after_bulk_commit(rows)
+
+    logger.info("Users bulk-updated count=%s by=%s", len(updated), current_user.id)
+    return _outcomes(ids, rows, "updated")
+
+
+async def bulk_delete_users(
+    body: BulkDeleteUsersRequest, current_user: Identity, db: AsyncSession
+) -> BulkUsersResponse:
+    """Soft-delete many users with a single UPDATE, following the rules of ``delete_user``."""
+    await role_registry.ensure_loaded(db)
+
+    ids = list(dict.fromkeys(body.ids))
+    rows = await _bulk_apply(
+        ids,
+        {"deleted_at": func.now(), "updated_at": func.now(), "is_active": False},
+        current_user,
+        db,
+    )
+    deleted = [row for row in rows if row.changed]
+
+    await revocation_epochs.bump_many(db, USER, [row.id for row in deleted])
+    await adjust_user_counts(
+        db, [(row.tenant_id, row.role_id, -1, -int(row.is_active)) for row in deleted]
+    )
+    await db.commit()
+    _after_bulk_commit(rows)
+
+    logger.info("Users bulk-deleted count=%s by=%s", len(deleted), current_user.id)
+    return _outcomes(ids, rows, "deleted")
+
+
+async def cascade_tenant_users(
+    tenant_id: UUID, db: AsyncSession, *, delete: bool, limit: int
+) -> int:
+    """Soft-delete (or just deactivate) up to ``limit`` of a tenant's remaining users and commit.
+
+    Returns how many were changed. Rows locked by another transaction are skipped
+    rather than waited on, so each chunk holds its locks briefly; 0 therefore means
+    nothing is left *or* everything left is locked, and the caller has to count.
+    """
+    batch = select(User.id, User.role_id, User.is_active).where(
+        User.tenant_id == tenant_id, User.deleted_at.is_(None)
+    )
+    if not delete:
+        batch = batch.where(User.is_active.is_(True))
+    batch = batch.limit(limit).with_for_update(skip_locked=True).cte("batch")
+
+    values: dict = {"is_active": False, "updated_at": func.now()}
+    if delete:
+        values["deleted_at"] = func.now()
+    result = await db.execute(
+        update(User)
+        .where(User.id == batch.c.id)
+        .values(**values)
+        .returning(batch.c.role_id, batch.c.is_active)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+
+    await adjust_user_counts(
+        db,
+        [(tenant_id, role_id, -1 if delete else 0, -int(was_active)) for role_id, was_active in rows],
+    )
+    await db.commit()
+    invalidate_stats(tenant_id)
+    return len(rows)
@@ -0,0 +1,54 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+async def _encode(
+    items: AsyncIterator[BaseModel], fmt: ExportFormat, model: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """Serialize rows into chunks of ``EXPORT_BATCH_SIZE`` rows; CSV starts with a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(model.model_fields)
+
+    rows = 0
+    async for item in items:
+        if writer is not None:
+            writer.writerow(item.model_dump(mode="json").values())
+        else:
+            buffer.write(item.model_dump_json())
+            buffer.write("\n")
+        rows += 1
+        if rows == settings.EXPORT_BATCH_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    items: AsyncIterator[BaseModel], fmt: ExportFormat, model: type[BaseModel], filename: str
+) -> StreamingResponse:
+    """Stream ``items`` as an NDJSON or CSV download without materializing the result set."""
+    return StreamingResponse(
+        _encode(items, fmt, model),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,70 @@
+import threading
+from collections.abc import Sequence
+
+# Prometheus' default latency buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram with fixed upper bounds, Prometheus-style."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.count = 0
+        self.sum = 0.0
+        self._counts = [0] * len(self.buckets)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+                    break
+
+    def snapshot(self) -> dict:
+        """Cumulative bucket counts keyed by upper bound, plus ``+Inf``, sum and count."""
+        with self._lock:
+            cumulative, running = {}, 0
+            for bound, n in zip(self.buckets, self._counts):
+                running += n
+                cumulative[str(bound)] = running
+            cumulative["+Inf"] = self.count
+            return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+
+Labels = dict[str, str]
+
+
+def _label_text(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels.items()
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def prometheus_samples(
+    name: str, kind: str, help_text: str, samples: Sequence[tuple[Labels, float]]
+) -> list[str]:
+    """Lines of a counter or gauge family in the Prometheus text exposition format."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines += [f"{name}{_label_text(labels)} {value}" for labels, value in samples]
+    return lines
+
+
+def prometheus_histogram(
+    name: str, help_text: str, series: Sequence[tuple[Labels, dict]]
+) -> list[str]:
+    """Lines of a histogram family from ``(labels, Histogram.snapshot())`` pairs."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, snapshot in series:
+        for bound, count in snapshot["buckets"].items():
+            lines.append(f"{name}_bucket{_label_text({**labels, 'le': bound})} {count}")
+        lines.append(f"{name}_sum{_label_text(labels)} {snapshot['sum']}")
+        lines.append(f"{name}_count{_label_text(labels)} {snapshot['count']}")
+    return lines
@@ -1,11 +1,23 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import bcrypt
 import jwt
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
+# Verified access-token payloads by token digest. A client presents the same token
+# on every request for its whole lifetime; this skips re-verifying the signature.
+# Entries never outlive their token's ``exp``, and revocation is checked by the
+# caller after decoding, so a hit is exactly as valid as a fresh decode.
+token_cache: TTLCache[bytes, dict] = TTLCache(
+    maxsize=settings.ACCESS_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
 
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
@@ -15,27 +27,54 @@ def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed.encode())
 
 
-def create_access_token(user_id: UUID, tenant_id: UUID, role: str) -> str:
+def create_access_token(
+    user_id: UUID,
+    tenant_id: UUID,
+    role: str,
+    *,
+    tenant_slug: str | None = None,
+    user_epoch: int = 0,
+    tenant_epoch: int = 0,
+    session_id: UUID | None = None,
+) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {
         "sub": str(user_id),
         "tid": str(tenant_id),
         "role": role,
+        "uep": user_epoch,
+        "tep": tenant_epoch,
         "type": "access",
         "exp": expire,
     }
+    if tenant_slug is not None:
+        payload["tsl"] = tenant_slug
+    if session_id is not None:
+        payload["sid"] = str(session_id)
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
-def create_refresh_token(user_id: UUID) -> str:
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+def create_refresh_token(
+    user_id: UUID, session_id: UUID, token_id: UUID, expires_at: datetime
+) -> str:
+    """Refresh token of one rotation (``jti``) of a server-side session (``sid``)."""
     payload = {
         "sub": str(user_id),
+        "sid": str(session_id),
+        "jti": str(token_id),
         "type": "refresh",
-        "exp": expire,
+        "exp": expires_at,
     }
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    # Refresh tokens are single-use (rotated on every refresh); caching them is waste.
+    if payload.get("type") == "access" and "exp" in payload:
+        token_cache.set(key, dict(payload), ttl=payload["exp"] - time.time())
+    return payload
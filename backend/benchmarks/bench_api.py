@@ -0,0 +1,337 @@
+"""API load test: concurrent clients against the real app, per scenario, into a JSON report.
+
+Seeds the database, then drives ``app.main:app`` in-process over ASGI (or a running
+server with --base-url) with --concurrency clients per scenario for --duration
+seconds each, and writes throughput, status counts and latency percentiles to
+--output. Reports from two commits can be diffed directly, or pass the older one
+as --baseline to print the change per scenario.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_api --tenants 100 --users 100000 --output bench.json
+
+In ASGI mode the app is configured from the environment like a server would be
+(DATABASE_URL is set to the benchmark database). With --base-url the server must
+use the same database the harness seeds. The target database is dropped and
+re-seeded unless --no-seed is given.
+
+Scenarios:
+  login_storm      POST /auth/login as random active users (bcrypt-bound)
+  me_hot_loop      GET /auth/me with a token per client
+  deep_pagination  superadmin walks /admin/users by cursor, 200 per page, to the end
+  user_crud        tenant admins create, update, list and delete users
+  dashboard        tenant admins GET /dashboard/stats
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from itertools import count
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+SCENARIOS = ("login_storm", "me_hot_loop", "deep_pagination", "user_crud", "dashboard")
+
+
+class Recorder:
+    """Latency samples and status codes of one scenario's requests."""
+
+    def __init__(self):
+        self.latencies_ms: list[float] = []
+        self.statuses: Counter[int] = Counter()
+        self.recording = False
+
+    async def request(self, client: AsyncClient, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        resp = await client.request(method, url, **kwargs)
+        if self.recording:
+            self.latencies_ms.append((time.perf_counter() - start) * 1000)
+            self.statuses[resp.status_code] += 1
+        return resp
+
+    def report(self, seconds: float) -> dict:
+        ordered = sorted(self.latencies_ms)
+
+        def pct(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 2)
+
+        errors = sum(n for status, n in self.statuses.items() if status >= 400)
+        return {
+            "requests": len(ordered),
+            "errors": errors,
+            "statuses": {str(s): n for s, n in sorted(self.statuses.items())},
+            "throughput_rps": round(len(ordered) / seconds, 1),
+            "latency_ms": {
+                "p50": pct(50),
+                "p95": pct(95),
+                "p99": pct(99),
+                "max": round(ordered[-1], 2) if ordered else 0.0,
+            },
+        }
+
+
+def _bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def _login(client: AsyncClient, email: str, password: str) -> str:
+    resp = await client.post("/api/auth/login", json={"email": email, "password": password})
+    resp.raise_for_status()
+    return resp.json()["access_token"]
+
+
+# A scenario gets the client, the recorder, the seeded accounts and the client's
+# index, prepares whatever it needs and returns the step each client repeats.
+Step = Callable[[], Awaitable[None]]
+
+
+async def login_storm(client, rec: Recorder, accounts: dict, _i: int) -> Step:
+    async def step():
+        email = random.choice(accounts["users"])
+        await rec.request(
+            client,
+            "POST",
+            "/api/auth/login",
+            json={"email": email, "password": accounts["password"]},
+        )
+
+    return step
+
+
+async def me_hot_loop(client, rec: Recorder, accounts: dict, i: int) -> Step:
+    email = accounts["users"][i % len(accounts["users"])]
+    headers = _bearer(await _login(client, email, accounts["password"]))
+
+    async def step():
+        await rec.request(client, "GET", "/api/auth/me", headers=headers)
+
+    return step
+
+
+async def deep_pagination(client, rec: Recorder, accounts: dict, _i: int) -> Step:
+    headers = _bearer(accounts["superadmin_token"])
+    cursor = ""
+
+    async def step():
+        nonlocal cursor
+        resp = await rec.request(
+            client,
+            "GET",
+            "/api/admin/users",
+            params={"cursor": cursor, "limit": 200},
+            headers=headers,
+        )
+        cursor = resp.json().get("next_cursor") or ""
+
+    return step
+
+
+async def user_crud(client, rec: Recorder, accounts: dict, i: int) -> Step:
+    email = accounts["admins"][i % len(accounts["admins"])]
+    headers = _bearer(await _login(client, email, accounts["password"]))
+    serial = count()
+
+    async def step():
+        email = f"crud-{i}-{next(serial)}-{random.getrandbits(32):x}@load.example.com"
+        resp = await rec.request(
+            client,
+            "POST",
+            "/api/admin/users",
+            json={"email": email, "password": "load-password", "role_id": 3},
+            headers=headers,
+        )
+        if resp.status_code != 201:
+            return
+        path = f"/api/admin/users/{resp.json()['id']}"
+        await rec.request(client, "PATCH", path, json={"is_active": False}, headers=headers)
+        await rec.request(client, "GET", "/api/admin/users", params={"limit": 20}, headers=headers)
+        await rec.request(client, "DELETE", path, headers=headers)
+
+    return step
+
+
+async def dashboard(client, rec: Recorder, accounts: dict, i: int) -> Step:
+    email = accounts["admins"][i % len(accounts["admins"])]
+    headers = _bearer(await _login(client, email, accounts["password"]))
+
+    async def step():
+        await rec.request(client, "GET", "/api/dashboard/stats", headers=headers)
+
+    return step
+
+
+async def run_scenario(
+    name: str, client: AsyncClient, accounts: dict, concurrency: int, duration: float, warmup: float
+) -> dict:
+    rec = Recorder()
+    scenario = globals()[name]
+    steps = [await scenario(client, rec, accounts, i) for i in range(concurrency)]
+
+    async def worker(step: Step, until: float):
+        while time.perf_counter() < until:
+            await step()
+
+    if warmup:
+        until = time.perf_counter() + warmup
+        await asyncio.gather(*(worker(step, until) for step in steps))
+
+    rec.recording = True
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(step, start + duration) for step in steps))
+    return rec.report(time.perf_counter() - start)
+
+
+async def load_accounts(
+    database_url: str, client: AsyncClient, superadmin_email: str, password: str
+) -> dict:
+    engine = create_async_engine(database_url)
+    async with engine.connect() as conn:
+        users = await conn.execute(
+            text(
+                "SELECT email FROM users WHERE role_id = 3 AND is_active AND deleted_at IS NULL "
+                "AND email LIKE '%@bench.example.com' ORDER BY random() LIMIT 1000"
+            )
+        )
+        admins = await conn.execute(
+            text(
+                "SELECT email FROM users WHERE role_id = 2 AND is_active AND deleted_at IS NULL "
+                "AND email LIKE '%@bench.example.com' ORDER BY random() LIMIT 1000"
+            )
+        )
+        accounts = {
+            "users": list(users.scalars()),
+            "admins": list(admins.scalars()),
+            "password": password,
+            "tenant_count": (await conn.execute(text("SELECT count(*) FROM tenants"))).scalar(),
+            "user_count": (await conn.execute(text("SELECT count(*) FROM users"))).scalar(),
+        }
+    await engine.dispose()
+    if not accounts["users"] or not accounts["admins"]:
+        raise SystemExit("Seed at least 50 users so there are active users and tenant admins")
+    accounts["superadmin_token"] = await _login(client, superadmin_email, password)
+    return accounts
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(report: dict, baseline: dict) -> None:
+    print(f"{'scenario':<18}{'rps':>22}{'p95 ms':>24}{'p99 ms':>24}")
+    for name, now in report["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+
+        def change(a: float, b: float) -> str:
+            return f"{a:>8} -> {b:<8}({(b - a) / a * 100:+.0f}%)" if a else f"{a} -> {b}"
+
+        print(
+            f"{name:<18}"
+            f"{change(before['throughput_rps'], now['throughput_rps']):>24}"
+            f"{change(before['latency_ms']['p95'], now['latency_ms']['p95']):>24}"
+            f"{change(before['latency_ms']['p99'], now['latency_ms']['p99']):>24}"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--base-url", help="drive a running server instead of the app in-process")
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=32, help="clients per scenario")
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="measured seconds per scenario"
+    )
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=0, help="random seed for account choice")
+    parser.add_argument("--output", default="bench-api.json")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    if not args.base_url:
+        # Settings are read when app modules are first imported, so point the
+        # in-process app at the benchmark database before importing any of them.
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+    from benchmarks.seed import PASSWORD, SUPERADMIN_EMAIL, reset_and_seed
+
+    if not args.no_seed:
+        engine = create_async_engine(args.database_url)
+        await reset_and_seed(engine, tenants=args.tenants, users=args.users)
+        await engine.dispose()
+
+    async with AsyncExitStack() as stack:
+        if args.base_url:
+            client = AsyncClient(base_url=args.base_url, timeout=60)
+        else:
+            from app.main import app
+
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench", timeout=60
+            )
+        await stack.enter_async_context(client)
+
+        accounts = await load_accounts(args.database_url, client, SUPERADMIN_EMAIL, PASSWORD)
+        report = {
+            "meta": {
+                "commit": _commit(),
+                "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "target": args.base_url or "asgi",
+                "tenants": accounts["tenant_count"],
+                "users": accounts["user_count"],
+                "concurrency": args.concurrency,
+                "duration_s": args.duration,
+                "warmup_s": args.warmup,
+            },
+            "scenarios": {},
+        }
+        for name in args.scenarios:
+            result = await run_scenario(
+                name, client, accounts, args.concurrency, args.duration, args.warmup
+            )
+            report["scenarios"][name] = result
+            latency = result["latency_ms"]
+            print(
+                f"{name:<18}{result['throughput_rps']:>9} rps  p50 {latency['p50']:>8} ms  "
+                f"p95 {latency['p95']:>8} ms  p99 {latency['p99']:>8} ms  errors {result['errors']}"
+            )
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            print_comparison(report, json.load(f))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
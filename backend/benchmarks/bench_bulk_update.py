@@ -0,0 +1,105 @@
+"""Deactivating many users: one bulk_update_users call vs update_user per id.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_bulk_update --ids 5000 --loop-ids 500
+
+The per-id loop is timed on --loop-ids users and extrapolated to --ids.
+The target database is dropped and re-seeded unless --no-seed is given.
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.principal import Identity
+from app.core.roles import role_registry
+from app.database.models.tenant import Tenant
+from app.database.models.user import User
+from app.dto.user import BulkUpdateUsersRequest, UpdateUserRequest
+from app.services import user_service
+from benchmarks.seed import reset_and_seed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--ids", type=int, default=5000)
+    parser.add_argument("--loop-ids", type=int, default=500)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    if not args.no_seed:
+        # The seed leaves every 10th user inactive.
+        await reset_and_seed(engine, tenants=1, users=(args.ids + args.loop_ids) * 12 // 10)
+
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        await role_registry.load(db)
+        result = await db.execute(select(Tenant.id).where(Tenant.slug == "tenant-1"))
+        tenant_id = result.scalar_one()
+        admin = Identity(
+            id=tenant_id, tenant_id=tenant_id, tenant_slug="tenant-1", role_name="admin"
+        )
+        ids = list(
+            (
+                await db.execute(
+                    select(User.id)
+                    .where(User.tenant_id == tenant_id, User.is_active)
+                    .limit(args.ids + args.loop_ids)
+                )
+            ).scalars()
+        )
+        bulk_ids, loop_ids = ids[: args.ids], ids[args.ids :]
+
+        statements = 0
+        start = time.perf_counter()
+        resp = await user_service.bulk_update_users(
+            BulkUpdateUsersRequest(ids=bulk_ids, is_active=False), admin, db
+        )
+        bulk_s = time.perf_counter() - start
+        print(
+            {
+                "mode": "bulk",
+                "ids": len(bulk_ids),
+                "succeeded": resp.succeeded,
+                "seconds": round(bulk_s, 3),
+                "statements": statements,
+            }
+        )
+
+        statements = 0
+        start = time.perf_counter()
+        for user_id in loop_ids:
+            await user_service.update_user(user_id, UpdateUserRequest(is_active=False), admin, db)
+        loop_s = time.perf_counter() - start
+        per_id = loop_s / len(loop_ids)
+        print(
+            {
+                "mode": "per_id",
+                "ids": len(loop_ids),
+                "seconds": round(loop_s, 3),
+                "statements": statements,
+                f"extrapolated_{args.ids}_s": round(per_id * args.ids, 1),
+            }
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
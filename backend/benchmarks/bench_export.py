@@ -0,0 +1,105 @@
+"""Resident memory while streaming a user export, sampled every --sample-every rows.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_export --users 1000000 --format csv
+
+Drives the same generator the /admin/users/export endpoint returns and discards
+the bytes. --buffered additionally loads the whole result set in one query, the
+way paging everything into memory would, for comparison.
+The target database is dropped and re-seeded unless --no-seed is given.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.principal import Identity
+from app.database.models.user import User
+from app.dto.user import UserResponse
+from app.services import user_service
+from app.utils.export import export_response
+from benchmarks.seed import SYSTEM_TENANT_ID, reset_and_seed
+
+SUPERADMIN = Identity(
+    id=SYSTEM_TENANT_ID, tenant_id=SYSTEM_TENANT_ID, tenant_slug="system", role_name="superadmin"
+)
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def peak_rss_mb() -> float:
+    return peak_rss_mb()
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return round(int(f.read().split()[1]) * PAGE_SIZE / 2**20, 1)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--sample-every", type=int, default=100_000)
+    parser.add_argument("--buffered", action="store_true")
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    if not args.no_seed:
+        await reset_and_seed(engine, tenants=args.tenants, users=args.users)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        response = export_response(
+            user_service.export_users(SUPERADMIN, db), args.format, UserResponse, "users"
+        )
+        print({"phase": "start", "rss_mb": rss_mb()})
+        start = time.perf_counter()
+        rows = sent = 0
+        next_sample = args.sample_every
+        async for chunk in response.body_iterator:
+            sent += len(chunk)
+            rows += chunk.count(b"\n")
+            if rows >= next_sample:
+                print({"rows": rows, "rss_mb": rss_mb()})
+                next_sample += args.sample_every
+        elapsed = time.perf_counter() - start
+        print(
+            {
+                "phase": "streamed",
+                "rows": rows,
+                "mb_sent": round(sent / 2**20, 1),
+                "seconds": round(elapsed, 1),
+                "rows_per_s": round(rows / elapsed),
+                "rss_mb": rss_mb(),
+                "peak_rss_mb": peak_rss_mb(),
+            }
+        )
+
+    if args.buffered:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            result = await db.execute(select(User).order_by(User.created_at, User.id))
+            users = result.scalars().all()
+            print(
+                {
+                    "phase": "buffered",
+                    "rows": len(users),
+                    "rss_mb": rss_mb(),
+                    "peak_rss_mb": peak_rss_mb(),
+                }
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Page latency of list_users / list_tenants per total-count strategy on a seeded database.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_list_count --users 1000000 --tenants 100
+
+The target database is dropped and re-seeded unless --no-seed is given.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.principal import Identity
+from app.database.models.tenant import Tenant
+from app.services import tenant_service, user_service
+from benchmarks.seed import SYSTEM_TENANT_ID, reset_and_seed
+
+STRATEGIES = ("exact", "window", "estimated", "none")
+
+
+async def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    if not args.no_seed:
+        await reset_and_seed(engine, tenants=args.tenants, users=args.users)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        result = await db.execute(select(Tenant.id).where(Tenant.slug == "tenant-1"))
+        tenant_id = result.scalar_one()
+        scopes = {
+            "superadmin": Identity(
+                id=SYSTEM_TENANT_ID,
+                tenant_id=SYSTEM_TENANT_ID,
+                tenant_slug="system",
+                role_name="superadmin",
+            ),
+            "tenant_admin": Identity(
+                id=tenant_id, tenant_id=tenant_id, tenant_slug="tenant-1", role_name="admin"
+            ),
+        }
+
+        for strategy in STRATEGIES:
+            row = {"strategy": strategy}
+            for scope, identity in scopes.items():
+                async def page(identity=identity):
+                    return await user_service.list_users(
+                        identity, db, offset=args.offset, limit=args.limit, count=strategy
+                    )
+                _, total = await page()
+                row[f"users_{scope}_ms"] = await timed(page, args.repeat)
+                row[f"users_{scope}_total"] = total
+
+            async def tenants_page():
+                return await tenant_service.list_tenants(
+                    db, offset=args.offset, limit=args.limit, count=strategy
+                )
+            row["tenants_ms"] = await timed(tenants_page, args.repeat)
+            print(row)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
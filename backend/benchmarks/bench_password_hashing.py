@@ -0,0 +1,85 @@
+"""Latency of /health while bcrypt-bound logins run concurrently, inline vs. worker pool.
+
+Adds two throwaway routes that do the password check of a login (bcrypt verify of a
+stored hash), once inline on the event loop as the services used to, once through
+``password_hasher``. No database is needed.
+
+    python -m benchmarks.bench_password_hashing --logins 16 --duration 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core.hashing import password_hasher
+from app.main import app
+from app.utils.security import hash_password, verify_password
+
+HASHED = hash_password("benchmark-password")
+
+
+@app.post("/bench/login-inline")
+async def _login_inline():
+    return {"ok": verify_password("benchmark-password", HASHED)}
+
+
+@app.post("/bench/login-pooled")
+async def _login_pooled():
+    return {"ok": await password_hasher.verify("benchmark-password", HASHED)}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(mode: str, logins: int, duration: float) -> dict:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        deadline = time.perf_counter() + duration
+        health_latencies: list[float] = []
+        login_count = 0
+
+        async def login_worker():
+            nonlocal login_count
+            while time.perf_counter() < deadline:
+                resp = await client.post(f"/bench/login-{mode}")
+                if resp.status_code == 200:
+                    login_count += 1
+
+        async def health_probe():
+            # Fixed-rate probe measured from its scheduled send time, so time spent
+            # waiting for a blocked event loop counts towards latency.
+            scheduled = time.perf_counter()
+            while scheduled < deadline:
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                await client.get("/health")
+                health_latencies.append((time.perf_counter() - scheduled) * 1000)
+                scheduled += 0.01
+
+        await asyncio.gather(health_probe(), *(login_worker() for _ in range(logins)))
+
+    return {
+        "mode": mode,
+        "logins_per_s": round(login_count / duration, 1),
+        "health_p50_ms": round(statistics.median(health_latencies), 2),
+        "health_p99_ms": round(percentile(health_latencies, 99), 2),
+        "health_samples": len(health_latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=16, help="concurrent login clients")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per mode")
+    args = parser.parse_args()
+
+    for mode in ("inline", "pooled"):
+        print(await run(mode, args.logins, args.duration))
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
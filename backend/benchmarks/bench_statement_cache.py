@@ -0,0 +1,141 @@
+"""Per-call Python overhead of the hot lookups: statements built per call vs pre-built.
+
+Two measurements per query:
+
+* build: constructing the statement and computing its compiled-cache key, the part
+  pre-building removes. No database involved.
+* execute: a full ``session.execute`` round trip against a seeded database, with the
+  compiled-cache hit/miss counts over the run.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_statement_cache --calls 20000 --users 1000
+
+The target database is dropped and re-seeded unless --no-seed is given.
+"""
+import argparse
+import asyncio
+import os
+import time
+import timeit
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.revocation import TENANT, USER
+from app.database.compiled_cache import compiled_cache_stats
+from app.database.models.auth_epoch import AuthEpoch
+from app.database.models.user import User
+from app.database.session import build_engine
+from app.database.utils import statements
+from app.database.utils.loaders import USER_RELATIONS
+from benchmarks.seed import SUPERADMIN_EMAIL, SYSTEM_TENANT_ID, reset_and_seed
+
+
+def _cases(user_id: uuid.UUID, tenant_id: uuid.UUID) -> list[tuple[str, Callable, object, dict]]:
+    """(name, per-call builder as the services used to write it, pre-built statement, params)."""
+    keys = [(USER, user_id), (TENANT, tenant_id)]
+    return [
+        (
+            "user by id",
+            lambda: select(User).options(*USER_RELATIONS).where(User.id == user_id),
+            statements.USER_BY_ID,
+            {"user_id": user_id},
+        ),
+        (
+            "live user by email",
+            lambda: select(User)
+            .options(*USER_RELATIONS)
+            .where(func.lower(User.email) == SUPERADMIN_EMAIL, User.deleted_at.is_(None)),
+            statements.LIVE_USER_BY_EMAIL,
+            {"email": SUPERADMIN_EMAIL},
+        ),
+        (
+            "live user in tenant",
+            lambda: select(User)
+            .options(*USER_RELATIONS)
+            .where(User.id == user_id, User.deleted_at.is_(None))
+            .where(User.tenant_id == tenant_id),
+            statements.LIVE_USER_BY_ID_IN_TENANT,
+            {"user_id": user_id, "tenant_id": tenant_id},
+        ),
+        (
+            "auth epochs",
+            lambda: select(AuthEpoch.subject_type, AuthEpoch.subject_id, AuthEpoch.epoch).where(
+                tuple_(AuthEpoch.subject_type, AuthEpoch.subject_id).in_(keys)
+            ),
+            statements.EPOCHS_BY_SUBJECT,
+            {"keys": keys},
+        ),
+    ]
+
+
+def build_cost(build: Callable, prebuilt, calls: int) -> tuple[float, float]:
+    """Microseconds per call to get a statement plus its cache key."""
+    adhoc = timeit.timeit(lambda: build()._generate_cache_key(), number=calls)
+    cached = timeit.timeit(lambda: prebuilt._generate_cache_key(), number=calls)
+    return adhoc / calls * 1e6, cached / calls * 1e6
+
+
+async def execute_cost(db: AsyncSession, run: Callable, calls: int) -> tuple[float, int, int]:
+    """Microseconds per execute, and the compiled-cache hits and misses it caused."""
+    await run()  # warm the compiled cache and asyncpg's prepared statements
+    hits, misses = compiled_cache_stats.hits, compiled_cache_stats.misses
+    start = time.perf_counter()
+    for _ in range(calls):
+        await run()
+        db.expunge_all()
+    elapsed = time.perf_counter() - start
+    return (
+        elapsed / calls * 1e6,
+        compiled_cache_stats.hits - hits,
+        compiled_cache_stats.misses - misses,
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--execute-calls", type=int, default=2_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    engine = build_engine(args.database_url)
+    if not args.no_seed:
+        await reset_and_seed(engine, tenants=1, users=args.users)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user_id = (
+            await db.execute(select(User.id).where(User.email == SUPERADMIN_EMAIL))
+        ).scalar_one()
+
+        print(f"{'query':<22}{'build us':>20}{'execute us':>22}{'cache hit/miss':>24}")
+        for name, build, prebuilt, params in _cases(user_id, SYSTEM_TENANT_ID):
+            build_adhoc, build_cached = build_cost(build, prebuilt, args.calls)
+
+            async def adhoc():
+                (await db.execute(build())).all()
+
+            async def cached():
+                (await db.execute(prebuilt, params)).all()
+
+            exec_adhoc, hits_a, misses_a = await execute_cost(db, adhoc, args.execute_calls)
+            exec_cached, hits_c, misses_c = await execute_cost(db, cached, args.execute_calls)
+            print(
+                f"{name:<22}{build_adhoc:>9.1f} -> {build_cached:>6.2f}"
+                f"{exec_adhoc:>11.1f} -> {exec_cached:>7.1f}"
+                f"{hits_a:>9}/{misses_a} -> {hits_c}/{misses_c}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
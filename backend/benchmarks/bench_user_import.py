@@ -0,0 +1,111 @@
+"""Bulk import throughput vs one create_user call per row, on a seeded database.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_user_import --rows 100000 --plaintext-rows 200
+
+Imports --rows users carrying bcrypt hashes (as when migrating from another system)
+and --plaintext-rows users whose passwords must be hashed, then creates
+--baseline-rows users through user_service.create_user for comparison.
+The target database is dropped and re-seeded unless --no-seed is given.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.hashing import password_hasher
+from app.core.principal import Identity
+from app.dto.user import CreateUserRequest
+from app.services import user_import_service, user_service
+from app.utils.security import hash_password
+from benchmarks.seed import SYSTEM_TENANT_ID, reset_and_seed
+
+SUPERADMIN = Identity(
+    id=SYSTEM_TENANT_ID, tenant_id=SYSTEM_TENANT_ID, tenant_slug="system", role_name="superadmin"
+)
+
+
+async def ndjson_body(prefix: str, rows: int, field: str, value: str) -> AsyncIterator[bytes]:
+    """Yield the body in 64 KiB chunks, the way a client upload arrives."""
+    chunk: list[str] = []
+    size = 0
+    for i in range(rows):
+        line = json.dumps({"email": f"{prefix}{i}@import.example.com", field: value}) + "\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= 65536:
+            yield "".join(chunk).encode()
+            chunk, size = [], 0
+    if chunk:
+        yield "".join(chunk).encode()
+
+
+async def run_import(engine, prefix: str, rows: int, field: str, value: str) -> dict:
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        start = time.perf_counter()
+        results = [
+            r
+            async for r in user_import_service.import_users(
+                ndjson_body(prefix, rows, field, value), "ndjson", SUPERADMIN, db, SYSTEM_TENANT_ID
+            )
+        ]
+        elapsed = time.perf_counter() - start
+    created = sum(1 for r in results if r.status == "created")
+    return {
+        "rows": rows,
+        "created": created,
+        "seconds": round(elapsed, 2),
+        "rows_per_s": round(rows / elapsed, 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--plaintext-rows", type=int, default=200)
+    parser.add_argument("--baseline-rows", type=int, default=50)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    if not args.no_seed:
+        await reset_and_seed(engine, tenants=10, users=10_000)
+
+    hashed = hash_password("x")
+    print("import_prehashed", await run_import(engine, "h", args.rows, "password_hash", hashed))
+    print(
+        "import_plaintext",
+        await run_import(engine, "p", args.plaintext_rows, "password", "secret"),
+    )
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        start = time.perf_counter()
+        for i in range(args.baseline_rows):
+            await user_service.create_user(
+                CreateUserRequest(email=f"b{i}@import.example.com", password="secret"), SUPERADMIN, db
+            )
+        elapsed = time.perf_counter() - start
+    print(
+        "create_user_loop",
+        {
+            "rows": args.baseline_rows,
+            "seconds": round(elapsed, 2),
+            "rows_per_s": round(args.baseline_rows / elapsed, 1),
+        },
+    )
+
+    password_hasher.shutdown()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""Insert throughput, primary-key index size and WAL volume: random UUIDv4 vs time-ordered UUIDv7 keys.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://.../saas_bench \
+        python -m benchmarks.bench_uuid_keys --rows 1000000 --batch 5000
+
+For each key kind, --rows ids are generated up front and inserted in --batch-row
+transactions into a scratch table shaped like ``users`` (uuid primary key plus a
+row's worth of payload). Reported per kind:
+
+* rows_per_s: insert throughput, id generation excluded
+* wal_mb: WAL written by the inserts
+* pkey_mb: primary-key index size after the inserts
+* pkey_bloat: that size over the size of the same index freshly rebuilt
+
+The scratch tables are dropped afterwards; nothing else in the database is touched.
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.utils.ids import uuid7
+
+PAYLOAD = "x" * 120  # roughly an email, a bcrypt hash and the flags
+
+
+async def run(engine: AsyncEngine, kind: str, ids: list[uuid.UUID], batch: int) -> dict:
+    table = f"bench_keys_{kind}"
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await conn.execute(text(f"CREATE TABLE {table} (id uuid PRIMARY KEY, payload text NOT NULL)"))
+        wal_start = (await conn.execute(text("SELECT pg_current_wal_lsn()"))).scalar_one()
+
+    insert = text(f"INSERT INTO {table} (id, payload) SELECT unnest(CAST(:ids AS uuid[])), :payload")
+    start = time.perf_counter()
+    for i in range(0, len(ids), batch):
+        async with engine.begin() as conn:
+            await conn.execute(insert, {"ids": ids[i : i + batch], "payload": PAYLOAD})
+    elapsed = time.perf_counter() - start
+
+    async with engine.begin() as conn:
+        wal = (
+            await conn.execute(
+                text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), :start)"), {"start": wal_start}
+            )
+        ).scalar_one()
+        size = text(f"SELECT pg_relation_size('{table}_pkey')")
+        pkey = (await conn.execute(size)).scalar_one()
+        await conn.execute(text(f"REINDEX INDEX {table}_pkey"))
+        compact = (await conn.execute(size)).scalar_one()
+        await conn.execute(text(f"DROP TABLE {table}"))
+
+    return {
+        "rows": len(ids),
+        "seconds": round(elapsed, 2),
+        "rows_per_s": round(len(ids) / elapsed, 1),
+        "wal_mb": round(float(wal) / 2**20, 1),
+        "pkey_mb": round(pkey / 2**20, 1),
+        "pkey_bloat": round(pkey / compact, 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCH_DATABASE_URL"),
+        required=not os.getenv("BENCH_DATABASE_URL"),
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    for kind, generate in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+        ids = [generate() for _ in range(args.rows)]
+        print(kind, await run(engine, kind, ids, args.batch))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
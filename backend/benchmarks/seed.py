@@ -0,0 +1,69 @@
+"""Bulk-seed a benchmark database: roles, the system tenant and superadmin, N tenants, M users.
+
+Rows are generated server-side with generate_series, so a million users take seconds.
+Users (user<i>@bench.example.com, password PASSWORD) are spread round-robin over the
+tenants; every 10th is inactive, and every 50th, offset by one so they stay active, an admin.
+"""
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.database import Base
+from app.database.utils.stats import rebuild_user_stats
+from app.utils.security import hash_password
+
+SYSTEM_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+SUPERADMIN_EMAIL = "admin@system.com"
+PASSWORD = "benchmark-password"
+
+
+async def reset_and_seed(engine: AsyncEngine, *, tenants: int, users: int) -> None:
+    hashed = hash_password(PASSWORD)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        await conn.execute(
+            text("INSERT INTO roles (id, name) VALUES (1, 'superadmin'), (2, 'admin'), (3, 'user')")
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO tenants (id, name, slug, is_active) "
+                "VALUES (:id, 'System', 'system', true)"
+            ),
+            {"id": SYSTEM_TENANT_ID},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, email, hashed_password, is_active, tenant_id, role_id) "
+                "VALUES (gen_random_uuid(), :email, :hashed, true, :tenant_id, 1)"
+            ),
+            {"email": SUPERADMIN_EMAIL, "hashed": hashed, "tenant_id": SYSTEM_TENANT_ID},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO tenants (id, name, slug, is_active, created_at) "
+                "SELECT gen_random_uuid(), 'Tenant ' || i, 'tenant-' || i, true, "
+                "       now() - make_interval(mins => i) "
+                "FROM generate_series(1, :tenants) AS i"
+            ),
+            {"tenants": tenants},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, email, hashed_password, is_active, tenant_id, role_id, created_at) "
+                "SELECT gen_random_uuid(), 'user' || i || '@bench.example.com', :hashed, i % 10 <> 0, "
+                "       t.id, CASE WHEN i % 50 = 1 THEN 2 ELSE 3 END, "
+                "       now() - make_interval(secs => i) "
+                "FROM generate_series(1, :users) AS i "
+                "JOIN (SELECT id, row_number() OVER (ORDER BY slug) - 1 AS n "
+                "      FROM tenants WHERE slug <> 'system') AS t ON t.n = i % :tenants"
+            ),
+            {"hashed": hashed, "users": users, "tenants": tenants},
+        )
+        await rebuild_user_stats(conn)
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE"))
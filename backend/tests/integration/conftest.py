@@ -1,7 +1,9 @@
 import os
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
@@ -11,9 +13,12 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from app.core.instrumentation import StatementRecord, StatementTrace, trace_statements
+from app.core.principal import principal_cache
 from app.database import Base, get_db
 from app.utils.security import hash_password
 from app.main import app
+from app.services.dashboard_service import stats_cache
 from app.database.models.role import Role
 from app.database.models.tenant import Tenant
 from app.database.models.user import User
@@ -81,6 +86,8 @@ async def db() -> AsyncGenerator[AsyncSession, None]:
             yield session
 
         app.dependency_overrides[get_db] = override_get_db
+        # Cached per tenant id, and the seeded system tenant id is fixed across tests.
+        stats_cache.clear()
 
         yield session
 
@@ -134,3 +141,39 @@ async def auth_client(client: AsyncClient, seed) -> AsyncClient:
     token = resp.json()["access_token"]
     client.headers["Authorization"] = f"Bearer {token}"
     return client
+
+
+@pytest.fixture
+def sql_statements(db: AsyncSession) -> Iterator[list[StatementRecord]]:
+    """Record the SQL statements executed during a test, excluding savepoint bookkeeping.
+
+    Clears the principal cache first so authentication queries are counted too.
+    Call ``.clear()`` right before the request under test.
+    """
+    principal_cache.clear()
+    with trace_statements(_state["engine"], ignore=("SAVEPOINT", "RELEASE", "ROLLBACK")) as trace:
+        yield trace.records
+
+
+@pytest.fixture
+def statement_budget(sql_statements: list[StatementRecord]):
+    """Fail the test if a block runs more statements than budgeted.
+
+    ``with statement_budget(3): await client.get(...)``. Counts what ``sql_statements``
+    records inside the block; the failure lists each statement with the code that
+    issued it, so an N+1 shows up as the same call site over and over.
+    """
+
+    @contextmanager
+    def budget(limit: int) -> Iterator[StatementTrace]:
+        block = StatementTrace()
+        start = len(sql_statements)
+        yield block
+        block.records.extend(sql_statements[start:])
+        if len(block.records) > limit:
+            pytest.fail(
+                f"{len(block.records)} statements, budget {limit}:\n{block.report()}",
+                pytrace=False,
+            )
+
+    return budget
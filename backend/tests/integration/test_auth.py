@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from httpx import AsyncClient
 
@@ -62,3 +64,225 @@ async def test_refresh_token(client: AsyncClient, seed):
     )
     assert resp.status_code == 200
     assert "access_token" in resp.json()
+
+
+@pytest.mark.asyncio
+async def test_me_served_from_principal_cache(auth_client: AsyncClient):
+    from app.core.principal import principal_cache
+
+    await auth_client.get("/api/auth/me")
+    hits = principal_cache.hits
+    resp = await auth_client.get("/api/auth/me")
+    assert resp.status_code == 200
+    assert principal_cache.hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_stateless_mode_rejects_revoked_token(auth_client: AsyncClient, seed, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+
+    create_resp = await auth_client.post(
+        "/api/admin/users",
+        json={
+            "email": "stateless@test.com",
+            "password": "password123",
+            "role_id": 2,
+            "tenant_id": str(seed["system_tenant"].id),
+        },
+    )
+    user_id = create_resp.json()["id"]
+    login_resp = await auth_client.post(
+        "/api/auth/login",
+        json={"email": "stateless@test.com", "password": "password123"},
+    )
+    admin_headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+    resp = await auth_client.get("/api/admin/users", headers=admin_headers)
+    assert resp.status_code == 200
+
+    await auth_client.patch(f"/api/admin/users/{user_id}", json={"is_active": False})
+
+    resp = await auth_client.get("/api/admin/users", headers=admin_headers)
+    assert resp.status_code == 401
+    assert resp.json()["detail"] == "Token revoked"
+
+
+@pytest.mark.asyncio
+async def test_epoch_reload_keeps_local_bumps(db):
+    """A reload that cannot see this process's bump yet (uncommitted, replica lag) keeps it."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.core.revocation import USER, RevocationEpochs
+    from tests.integration.conftest import _state
+
+    epochs = RevocationEpochs(refresh_seconds=30, overlap_seconds=300)
+    user_id = uuid.uuid4()
+    await epochs.bump(db, USER, user_id)  # not committed
+
+    async with AsyncSession(_state["engine"]) as reader:
+        await epochs.refresh(reader, force=True)
+
+    assert epochs.current(USER, user_id) == 1
+    assert epochs.is_revoked({"sub": str(user_id), "tid": str(uuid.uuid4()), "uep": 0})
+
+
+@pytest.mark.asyncio
+async def test_epoch_reload_is_incremental(db, sql_statements):
+    from app.core.revocation import TENANT, USER, RevocationEpochs
+
+    writer = RevocationEpochs(refresh_seconds=30, overlap_seconds=300)
+    reader = RevocationEpochs(refresh_seconds=30, overlap_seconds=300)
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    await writer.bump(db, USER, first)
+    sql_statements.clear()
+    await reader.refresh(db, force=True)
+    assert "updated_at >" not in sql_statements[0].statement  # first load reads everything
+
+    await writer.bump(db, TENANT, second)
+    sql_statements.clear()
+    await reader.refresh(db, force=True)
+    assert "updated_at >" in sql_statements[0].statement
+    assert reader.current(USER, first) == 1
+    assert reader.current(TENANT, second) == 1
+
+
+async def _login(client: AsyncClient, **headers) -> dict:
+    resp = await client.post(
+        "/api/auth/login",
+        json={"email": "admin@system.com", "password": "admin123"},
+        headers=headers,
+    )
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token(client: AsyncClient, seed):
+    tokens = await _login(client)
+
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert resp.status_code == 200
+    rotated = resp.json()["refresh_token"]
+    assert rotated != tokens["refresh_token"]
+
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": rotated})
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_session(client: AsyncClient, seed):
+    tokens = await _login(client)
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    rotated = resp.json()["refresh_token"]
+
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert resp.status_code == 401
+    assert resp.json()["code"] == "TOKEN_REUSED"
+
+    # The legitimate holder of the newer token is signed out too.
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": rotated})
+    assert resp.status_code == 401
+    assert resp.json()["code"] == "SESSION_REVOKED"
+
+
+@pytest.mark.asyncio
+async def test_refresh_rejected_after_user_deactivated(auth_client: AsyncClient, seed):
+    await auth_client.post(
+        "/api/admin/users",
+        json={"email": "rotated@test.com", "password": "password123", "role_id": 3},
+    )
+    resp = await auth_client.post(
+        "/api/auth/login", json={"email": "rotated@test.com", "password": "password123"}
+    )
+    refresh_token = resp.json()["refresh_token"]
+    user_id = (
+        await auth_client.get(
+            "/api/auth/me", headers={"Authorization": f"Bearer {resp.json()['access_token']}"}
+        )
+    ).json()["id"]
+
+    await auth_client.patch(f"/api/admin/users/{user_id}", json={"is_active": False})
+
+    # Claims are still cached, but the rotation sees the revocation epoch move.
+    resp = await auth_client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert resp.status_code == 401
+    assert resp.json()["code"] == "USER_INACTIVE"
+
+
+@pytest.mark.asyncio
+async def test_refresh_after_role_change_carries_new_role(auth_client: AsyncClient, seed):
+    from app.utils.security import decode_token
+
+    resp = await auth_client.post(
+        "/api/admin/users",
+        json={"email": "promoted@test.com", "password": "password123", "role_id": 3},
+    )
+    user_id = resp.json()["id"]
+    resp = await auth_client.post(
+        "/api/auth/login", json={"email": "promoted@test.com", "password": "password123"}
+    )
+    refresh_token = resp.json()["refresh_token"]
+
+    await auth_client.patch(f"/api/admin/users/{user_id}", json={"role_id": 2})
+
+    resp = await auth_client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert resp.status_code == 200
+    assert decode_token(resp.json()["access_token"])["role"] == "admin"
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_session(client: AsyncClient, seed):
+    tokens = await _login(client)
+
+    resp = await client.post("/api/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+    assert resp.status_code == 204
+
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert resp.status_code == 401
+    assert resp.json()["code"] == "SESSION_REVOKED"
+
+
+@pytest.mark.asyncio
+async def test_list_and_revoke_device_sessions(client: AsyncClient, seed):
+    laptop = await _login(client, **{"User-Agent": "laptop"})
+    phone = await _login(client, **{"User-Agent": "phone"})
+    headers = {"Authorization": f"Bearer {laptop['access_token']}"}
+
+    resp = await client.get("/api/auth/sessions", headers=headers)
+    assert resp.status_code == 200
+    sessions = {s["user_agent"]: s for s in resp.json()}
+    assert sessions["laptop"]["current"] is True
+    assert sessions["phone"]["current"] is False
+
+    resp = await client.delete(f"/api/auth/sessions/{sessions['phone']['id']}", headers=headers)
+    assert resp.status_code == 204
+
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": phone["refresh_token"]})
+    assert resp.status_code == 401
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": laptop["refresh_token"]})
+    assert resp.status_code == 200
+
+    resp = await client.delete(f"/api/auth/sessions/{sessions['phone']['id']}", headers=headers)
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_sessions(client: AsyncClient, seed, db):
+    from sqlalchemy import func, select, update
+
+    from app.core.sessions import session_store
+    from app.database.models.auth_session import AuthSession
+
+    for _ in range(3):
+        await _login(client)
+    await db.execute(
+        update(AuthSession)
+        .where(AuthSession.id.in_(select(AuthSession.id).limit(2).scalar_subquery()))
+        .values(expires_at=func.now() - func.make_interval(0, 0, 0, 1))
+    )
+
+    assert await session_store.purge_expired(db, batch_size=1) == 2
+    remaining = (await db.execute(select(func.count()).select_from(AuthSession))).scalar_one()
+    assert remaining == 1
@@ -0,0 +1,111 @@
+"""Hundreds of simultaneous creates of the same emails and slugs, each in its own transaction.
+
+Unlike the rest of the suite this commits for real (a shared rolled-back session
+cannot race itself), so the fixture sets up and removes its own rows.
+"""
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.exceptions import ConflictError
+from app.core.hashing import password_hasher
+from app.core.principal import Identity
+from app.core.roles import role_registry
+from app.database.models import Role, Tenant, TenantSignupDay, TenantUserCount, User
+from app.dto.tenant import CreateTenantRequest
+from app.dto.user import CreateUserRequest
+from app.services import tenant_service, user_service
+from app.utils.security import hash_password
+
+from tests.integration.conftest import _state
+
+SYSTEM_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+SUPERADMIN = Identity(
+    id=uuid.uuid4(), tenant_id=SYSTEM_TENANT_ID, tenant_slug="system", role_name="superadmin"
+)
+
+
+@pytest_asyncio.fixture
+async def sessions(monkeypatch):
+    """A session factory on the real engine, with roles and a system tenant committed."""
+    factory = async_sessionmaker(_state["engine"], expire_on_commit=False)
+    async with factory() as db:
+        db.add_all([Role(id=1, name="superadmin"), Role(id=2, name="admin"), Role(id=3, name="user")])
+        db.add(Tenant(id=SYSTEM_TENANT_ID, name="System", slug="system"))
+        await db.commit()
+        await role_registry.load(db)
+
+    # The race is in the database; don't queue hundreds of bcrypt rounds in front of it.
+    hashed = hash_password("password")
+
+    async def hash_(_password: str) -> str:
+        return hashed
+
+    monkeypatch.setattr(password_hasher, "hash", hash_)
+
+    yield factory
+
+    async with factory() as db:
+        for model in (User, TenantUserCount, TenantSignupDay, Tenant, Role):
+            await db.execute(delete(model))
+        await db.commit()
+    # Leave no dead rows behind to skew later tests' query plans.
+    async with _state["engine"].connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE users, tenants, tenant_user_counts, roles"))
+
+
+async def _outcomes(calls) -> tuple[list, list[ConflictError]]:
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    unexpected = [r for r in results if isinstance(r, Exception) and not isinstance(r, ConflictError)]
+    assert not unexpected, unexpected[:3]
+    conflicts = [r for r in results if isinstance(r, ConflictError)]
+    return [r for r in results if not isinstance(r, Exception)], conflicts
+
+
+@pytest.mark.asyncio
+async def test_concurrent_user_creates(sessions):
+    async def create(email: str):
+        async with sessions() as db:
+            body = CreateUserRequest(email=email, password="password", role_id=3)
+            return await user_service.create_user(body, SUPERADMIN, db)
+
+    # 100 addresses, each raced by three differently-cased creates.
+    emails = [
+        variant
+        for i in range(100)
+        for variant in (f"race{i}@example.com", f"RACE{i}@example.com", f"Race{i}@Example.com")
+    ]
+    created, conflicts = await _outcomes(create(email) for email in emails)
+
+    assert len(created) == 100
+    assert len(conflicts) == 200
+    assert {c.code for c in conflicts} == {"EMAIL_EXISTS"}
+    async with sessions() as db:
+        users = await db.execute(select(func.count()).select_from(User).where(User.role_id == 3))
+        assert users.scalar_one() == 100
+        counted = await db.execute(
+            select(TenantUserCount.total, TenantUserCount.active).where(
+                TenantUserCount.tenant_id == SYSTEM_TENANT_ID, TenantUserCount.role_id == 3
+            )
+        )
+        assert tuple(counted.one()) == (100, 100)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tenant_creates(sessions):
+    async def create(slug: str):
+        async with sessions() as db:
+            return await tenant_service.create_tenant(CreateTenantRequest(name=slug, slug=slug), db)
+
+    slugs = [f"race-{i % 50}" for i in range(200)]
+    created, conflicts = await _outcomes(create(slug) for slug in slugs)
+
+    assert len(created) == 50
+    assert {t.slug for t in created} == set(slugs)
+    assert len(conflicts) == 150
+    assert {c.code for c in conflicts} == {"SLUG_EXISTS"}
@@ -0,0 +1,76 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models.user_stats import TenantUserCount
+from app.database.utils.stats import rebuild_user_stats
+
+
+async def _stats(client: AsyncClient) -> dict:
+    resp = await client.get("/api/dashboard/stats")
+    assert resp.status_code == 200
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_stats_follow_user_writes(auth_client: AsyncClient, db: AsyncSession):
+    await rebuild_user_stats(db)  # the seed fixture inserts the superadmin directly
+    stats = await _stats(auth_client)
+    assert stats["tenant"] == "System"
+    assert (stats["total_users"], stats["active_users"]) == (1, 1)
+    assert len(stats["signups"]) == 30
+    assert stats["signups"][-1]["count"] == 1
+
+    resp = await auth_client.post(
+        "/api/admin/users", json={"email": "dash@test.com", "password": "pass", "role_id": 3}
+    )
+    user_id = resp.json()["id"]
+    stats = await _stats(auth_client)
+    assert (stats["total_users"], stats["active_users"]) == (2, 2)
+    assert stats["signups"][-1]["count"] == 2
+
+    await auth_client.patch(f"/api/admin/users/{user_id}", json={"is_active": False, "role_id": 2})
+    stats = await _stats(auth_client)
+    assert (stats["total_users"], stats["active_users"]) == (2, 1)
+    assert {r["role"]: (r["total"], r["active"]) for r in stats["roles"]} == {
+        "superadmin": (1, 1),
+        "admin": (1, 0),
+    }
+
+    await auth_client.delete(f"/api/admin/users/{user_id}")
+    stats = await _stats(auth_client)
+    assert (stats["total_users"], stats["active_users"]) == (1, 1)
+    assert [r["role"] for r in stats["roles"]] == ["superadmin"]
+
+
+async def _counters(db: AsyncSession) -> list[tuple]:
+    result = await db.execute(
+        select(
+            TenantUserCount.tenant_id,
+            TenantUserCount.role_id,
+            TenantUserCount.total,
+            TenantUserCount.active,
+        )
+        .where(TenantUserCount.total != 0)
+        .order_by(TenantUserCount.tenant_id, TenantUserCount.role_id)
+    )
+    return result.all()
+
+
+@pytest.mark.asyncio
+async def test_counters_match_rebuild(auth_client: AsyncClient, db: AsyncSession):
+    await rebuild_user_stats(db)
+    ids = []
+    for i in range(3):
+        resp = await auth_client.post(
+            "/api/admin/users", json={"email": f"c{i}@test.com", "password": "pass"}
+        )
+        ids.append(resp.json()["id"])
+    await auth_client.patch(f"/api/admin/users/{ids[0]}", json={"is_active": False})
+    await auth_client.patch(f"/api/admin/users/{ids[1]}", json={"role_id": 2})
+    await auth_client.delete(f"/api/admin/users/{ids[2]}")
+    incremental = await _counters(db)
+
+    await rebuild_user_stats(db)
+    assert await _counters(db) == incremental
@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _tenant_with_admin(client: AsyncClient, slug: str) -> tuple[str, str]:
+    resp = await client.post("/api/admin/tenants", json={"name": slug.title(), "slug": slug})
+    tenant_id = resp.json()["id"]
+    email = f"admin@{slug}.com"
+    await client.post(
+        "/api/admin/users",
+        json={"email": email, "password": "pass", "role_id": 2, "tenant_id": tenant_id},
+    )
+    return tenant_id, email
+
+
+@pytest.mark.asyncio
+async def test_export_users_ndjson_is_tenant_scoped(auth_client: AsyncClient):
+    tenant_id, email = await _tenant_with_admin(auth_client, "exporter")
+    await auth_client.post(
+        "/api/admin/users",
+        json={"email": "member@exporter.com", "password": "pass", "tenant_id": tenant_id},
+    )
+
+    resp = await auth_client.get("/api/admin/users/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    everyone = [json.loads(line) for line in resp.text.splitlines()]
+    assert {u["email"] for u in everyone} == {"admin@system.com", email, "member@exporter.com"}
+
+    login = await auth_client.post("/api/auth/login", json={"email": email, "password": "pass"})
+    resp = await auth_client.get(
+        "/api/admin/users/export",
+        headers={"Authorization": f"Bearer {login.json()['access_token']}"},
+    )
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert {u["email"]: u["role"] for u in rows} == {email: "admin", "member@exporter.com": "user"}
+    assert {u["tenant_name"] for u in rows} == {"Exporter"}
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv_in_chunks(auth_client: AsyncClient, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    for i in range(4):
+        await auth_client.post("/api/admin/users", json={"email": f"csv{i}@test.com", "password": "p"})
+
+    resp = await auth_client.get("/api/admin/users/export", params={"format": "csv"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert 'filename="users.csv"' in resp.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert sorted(r["email"] for r in rows) == ["admin@system.com"] + [
+        f"csv{i}@test.com" for i in range(4)
+    ]
+    assert {r["is_active"] for r in rows} == {"True"}
+    assert {r["updated_at"] for r in rows} == {""}
+
+
+@pytest.mark.asyncio
+async def test_export_tenants_requires_superadmin(auth_client: AsyncClient):
+    _, email = await _tenant_with_admin(auth_client, "outsider")
+
+    resp = await auth_client.get("/api/admin/tenants/export", params={"format": "csv"})
+    assert resp.status_code == 200
+    assert {r["slug"] for r in csv.DictReader(io.StringIO(resp.text))} == {"system", "outsider"}
+
+    login = await auth_client.post("/api/auth/login", json={"email": email, "password": "pass"})
+    resp = await auth_client.get(
+        "/api/admin/tenants/export",
+        headers={"Authorization": f"Bearer {login.json()['access_token']}"},
+    )
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/admin/users/export", params={"format": "xml"})
+    assert resp.status_code == 422
@@ -0,0 +1,72 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from app import main
+from app.core.instrumentation import instrument_engine
+from app.database.session import build_engine
+
+from tests.integration.conftest import TEST_DATABASE_URL, _state
+
+
+@pytest.fixture(autouse=True)
+def _instrumented():
+    # The app's engine is instrumented at creation; tests run on their own engine.
+    instrument_engine(_state["engine"])
+
+
+def _server_timing(header: str) -> dict[str, str]:
+    return dict(re.findall(r"(\w+);dur=([\d.]+)", header))
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client: AsyncClient, seed):
+    resp = await client.post(
+        "/api/auth/login", json={"email": "admin@system.com", "password": "admin123"}
+    )
+    assert resp.status_code == 200
+    header = resp.headers["server-timing"]
+    timings = _server_timing(header)
+    assert timings.keys() == {"app", "db", "bcrypt"}
+    assert float(timings["bcrypt"]) > 0
+    assert float(timings["app"]) >= float(timings["bcrypt"])
+    statements = int(re.search(r'desc="(\d+) statements"', header).group(1))
+    assert statements >= 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposition(auth_client: AsyncClient):
+    await auth_client.get("/api/auth/me")
+    await auth_client.get("/no/such/route")
+
+    resp = await auth_client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+    assert re.search(
+        r'^http_requests_total\{method="GET",route="/api/auth/me",status="200"\} \d+$', body, re.M
+    )
+    assert 'route="unmatched",status="404"' in body
+    login = r'^http_request_db_statements_count\{method="POST",route="/api/auth/login"\} \d+$'
+    assert re.search(login, body, re.M)
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'cache_lookups_total{cache="principal",result="hit"}' in body
+    assert re.search(r'^db_pool_wait_seconds_count\{pool="primary"\} \d+$', body, re.M)
+
+
+@pytest.mark.asyncio
+async def test_metrics_pool_per_engine(auth_client: AsyncClient, monkeypatch):
+    replica = build_engine(TEST_DATABASE_URL)
+    monkeypatch.setattr(main, "replica_engines", [replica])
+    try:
+        async with replica.connect():
+            body = (await auth_client.get("/metrics")).text
+    finally:
+        await replica.dispose()
+
+    assert 'db_pool_connections{pool="replica0",state="checked_out"} 1' in body
+    for pool in ("primary", "replica0"):
+        assert f'db_pool_connections{{pool="{pool}",state="checked_out"}}' in body
+        assert f'db_pool_timeouts_total{{pool="{pool}"}}' in body
+        assert f'db_pool_wait_seconds_count{{pool="{pool}"}}' in body
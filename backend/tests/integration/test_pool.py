@@ -0,0 +1,49 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import exc
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.exceptions import pool_timeout_handler
+from app.database.pool import pool_status
+from app.database.session import build_engine, engine as primary_engine
+
+from tests.integration.conftest import TEST_DATABASE_URL
+
+
+@pytest.mark.asyncio
+async def test_pool_exhaustion_times_out(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.1)
+    engine = build_engine(TEST_DATABASE_URL)
+    primary = pool_status(primary_engine)
+    try:
+        async with engine.connect():
+            assert pool_status(engine)["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        await engine.dispose()
+
+    assert pool_status(engine)["timeouts"] == 1
+    assert pool_status(engine)["wait_seconds"]["count"] >= 2
+    # Another engine's pool (a replica, here) never shows up in the primary's numbers.
+    assert pool_status(primary_engine)["timeouts"] == primary["timeouts"]
+    assert pool_status(primary_engine)["wait_seconds"] == primary["wait_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_maps_to_503():
+    request = Request({"type": "http", "method": "GET", "path": "/api/admin/users", "headers": []})
+    resp = await pool_timeout_handler(request, exc.TimeoutError())
+    assert resp.status_code == 503
+    assert b"DB_POOL_EXHAUSTED" in resp.body
+
+
+@pytest.mark.asyncio
+async def test_pool_health(client: AsyncClient):
+    resp = await client.get("/health/pool")
+    assert resp.status_code == 200
+    assert {"size", "checked_out", "overflow", "wait_seconds"} <= resp.json().keys()
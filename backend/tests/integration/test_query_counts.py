@@ -0,0 +1,198 @@
+"""Statement budgets per endpoint. A failure here usually means an N+1 or lost eager load."""
+import pytest
+from httpx import AsyncClient
+
+from app.core.principal import principal_cache
+
+
+async def _create_user(client: AsyncClient, seed, email: str) -> str:
+    resp = await client.post(
+        "/api/admin/users",
+        json={
+            "email": email,
+            "password": "password123",
+            "role_id": 3,
+            "tenant_id": str(seed["system_tenant"].id),
+        },
+    )
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_login_statements(client: AsyncClient, seed, db, sql_statements):
+    from app.core.roles import role_registry
+
+    await role_registry.ensure_loaded(db)  # once per process, not per login
+    sql_statements.clear()
+    resp = await client.post(
+        "/api/auth/login",
+        json={"email": "admin@system.com", "password": "admin123"},
+    )
+    assert resp.status_code == 200
+    # user+tenant+role lookup, revocation epochs, session insert
+    assert len(sql_statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_refresh_statements(client: AsyncClient, seed, sql_statements):
+    from app.core.sessions import session_store
+
+    resp = await client.post(
+        "/api/auth/login",
+        json={"email": "admin@system.com", "password": "admin123"},
+    )
+    refresh_token = resp.json()["refresh_token"]
+
+    sql_statements.clear()
+    resp = await client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert resp.status_code == 200
+    assert len(sql_statements) == 1  # rotation, claims cached at login
+
+    session_store.cache.clear()
+    sql_statements.clear()
+    resp = await client.post(
+        "/api/auth/refresh", json={"refresh_token": resp.json()["refresh_token"]}
+    )
+    assert resp.status_code == 200
+    # session lock, user+tenant+role lookup, revocation epochs, rotation
+    assert len(sql_statements) == 4
+
+
+@pytest.mark.asyncio
+async def test_me_statements(auth_client: AsyncClient, sql_statements):
+    sql_statements.clear()
+    resp = await auth_client.get("/api/auth/me")
+    assert resp.status_code == 200
+    assert len(sql_statements) == 1
+
+    sql_statements.clear()
+    await auth_client.get("/api/auth/me")
+    assert len(sql_statements) == 0  # principal cache hit
+
+
+@pytest.mark.asyncio
+async def test_list_users_statements(auth_client: AsyncClient, seed, sql_statements):
+    for i in range(5):
+        await _create_user(auth_client, seed, f"count{i}@test.com")
+
+    principal_cache.clear()
+    sql_statements.clear()
+    resp = await auth_client.get("/api/admin/users")
+    assert resp.status_code == 200
+    assert len(resp.json()["items"]) == 6
+    # auth, page, count: independent of page size
+    assert len(sql_statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_list_users_keyset_statements(auth_client: AsyncClient, sql_statements):
+    sql_statements.clear()
+    resp = await auth_client.get("/api/admin/users", params={"cursor": ""})
+    assert resp.status_code == 200
+    assert len(sql_statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_tenants_statements(auth_client: AsyncClient, sql_statements):
+    sql_statements.clear()
+    resp = await auth_client.get("/api/admin/tenants")
+    assert resp.status_code == 200
+    assert len(sql_statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_user_statements(auth_client: AsyncClient, seed, sql_statements):
+    await auth_client.get("/api/auth/me")  # warm the principal cache
+
+    sql_statements.clear()
+    await _create_user(auth_client, seed, "writes@test.com")
+    # insert-unless-taken with counters and signups, returning the row and tenant
+    assert len(sql_statements) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ({"is_active": True}, 1),  # update with counters, returning the row and tenant
+        ({"role_id": 2}, 2),  # ... and the revocation epoch bump
+        ({"is_active": False}, 2),
+    ],
+)
+async def test_update_user_statements(
+    auth_client: AsyncClient, seed, sql_statements, body: dict, expected: int
+):
+    user_id = await _create_user(auth_client, seed, "writes@test.com")
+
+    sql_statements.clear()
+    resp = await auth_client.patch(f"/api/admin/users/{user_id}", json=body)
+    assert resp.status_code == 200
+    assert len(sql_statements) == expected
+
+
+@pytest.mark.asyncio
+async def test_delete_user_statements(auth_client: AsyncClient, seed, sql_statements):
+    user_id = await _create_user(auth_client, seed, "writes@test.com")
+
+    sql_statements.clear()
+    resp = await auth_client.delete(f"/api/admin/users/{user_id}")
+    assert resp.status_code == 204
+    # update with counters, epoch bump
+    assert len(sql_statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_user_write_statements(auth_client: AsyncClient, seed, sql_statements):
+    ids = [await _create_user(auth_client, seed, f"bulk{i}@test.com") for i in range(10)]
+
+    sql_statements.clear()
+    resp = await auth_client.post(
+        "/api/admin/users/bulk-update", json={"ids": ids, "is_active": False}
+    )
+    assert resp.json()["succeeded"] == 10
+    # update CTE, epoch bumps, counters -- independent of the number of ids
+    assert len(sql_statements) == 3
+
+    sql_statements.clear()
+    resp = await auth_client.post("/api/admin/users/bulk-delete", json={"ids": ids})
+    assert resp.json()["succeeded"] == 10
+    assert len(sql_statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_tenant_write_statements(auth_client: AsyncClient, sql_statements):
+    await auth_client.get("/api/auth/me")
+
+    sql_statements.clear()
+    resp = await auth_client.post("/api/admin/tenants", json={"name": "Counted", "slug": "counted"})
+    tenant_id = resp.json()["id"]
+    # insert-unless-taken returning the row
+    assert len(sql_statements) == 1
+
+    sql_statements.clear()
+    await auth_client.patch(f"/api/admin/tenants/{tenant_id}", json={"name": "Recounted"})
+    assert len(sql_statements) == 1
+
+    sql_statements.clear()
+    await auth_client.patch(f"/api/admin/tenants/{tenant_id}", json={"is_active": False})
+    assert len(sql_statements) == 2  # update, epoch bump
+
+    sql_statements.clear()
+    await auth_client.delete(f"/api/admin/tenants/{tenant_id}")
+    assert len(sql_statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_statements(auth_client: AsyncClient, sql_statements):
+    await auth_client.get("/api/auth/me")
+
+    sql_statements.clear()
+    resp = await auth_client.get("/api/dashboard/stats")
+    assert resp.status_code == 200
+    # role counters and signups, never the users table
+    assert len(sql_statements) == 2
+    assert not any("FROM users" in r.statement for r in sql_statements)
+
+    sql_statements.clear()
+    await auth_client.get("/api/dashboard/stats")
+    assert len(sql_statements) == 0  # stats cache hit
@@ -0,0 +1,188 @@
+"""EXPLAIN every statement an endpoint runs and fail on sequential scans.
+
+Each test seeds a few thousand users and ANALYZEs, so plans are not cost ties
+between one-page tables. Even so the planner may prefer a seq scan at this size;
+with ``enable_seqscan = off`` it only does so when no index can serve the query,
+or falls back to reading a whole index and filtering, which counts as a scan too.
+Ordered statements must also get their order from an index rather than a sort.
+"""
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.principal import principal_cache
+
+from tests.integration.conftest import _state
+
+# Reference data read whole by design.
+SEQ_SCAN_ALLOWED = {"roles"}
+
+
+@pytest_asyncio.fixture
+async def bulk(db: AsyncSession, seed):
+    """Tenants and users in bulk, a tenth of them soft-deleted, plus planner statistics."""
+    await db.execute(
+        text(
+            "INSERT INTO tenants (id, name, slug, is_active) "
+            "SELECT gen_random_uuid(), 'Bulk ' || i, 'bulk-' || i, true "
+            "FROM generate_series(1, 20) AS i"
+        )
+    )
+    await db.execute(
+        text(
+            "INSERT INTO users (id, email, hashed_password, is_active, tenant_id, role_id, "
+            "                   created_at, deleted_at) "
+            "SELECT gen_random_uuid(), 'bulk' || i || '@example.com', 'x', true, t.id, 3, "
+            "       now() - make_interval(secs => i), "
+            "       CASE WHEN i % 10 = 0 THEN now() END "
+            "FROM generate_series(1, 4000) AS i "
+            "JOIN (SELECT id, row_number() OVER (ORDER BY slug) - 1 AS n "
+            "      FROM tenants WHERE slug LIKE 'bulk-%') AS t ON t.n = i % 20"
+        )
+    )
+    await db.execute(text("ANALYZE tenants, users"))
+
+
+@pytest.fixture
+def executed(bulk, db: AsyncSession):
+    """Record (statement, parameters) for every query run during the test."""
+    statements: list[tuple[str, tuple]] = []
+
+    def record(_conn, _cursor, statement, parameters, _context, executemany):
+        if executemany or statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE", "ROLLBACK")):
+            return
+        statements.append((statement, parameters))
+
+    principal_cache.clear()
+    sync_engine = _state["engine"].sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+def _node_types(plan: dict) -> list[str]:
+    return [plan["Node Type"], *(t for child in plan.get("Plans", []) for t in _node_types(child))]
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    full_index_scan = (
+        plan["Node Type"] in ("Index Scan", "Index Only Scan")
+        and "Index Cond" not in plan
+        and "Filter" in plan
+    )
+    found = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" or full_index_scan else []
+    for child in plan.get("Plans", []):
+        found += _seq_scans(child)
+    return found
+
+
+async def _assert_no_seq_scans(db: AsyncSession, statements: list[tuple[str, tuple]]) -> None:
+    assert statements
+    recorded = list(statements)
+    statements.clear()
+    conn = await db.connection()
+    await conn.execute(text("SET LOCAL enable_seqscan = off"))
+    for statement, parameters in recorded:
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()[0]["Plan"]
+        scans = set(_seq_scans(plan)) - SEQ_SCAN_ALLOWED
+        assert not scans, f"Seq scan on {sorted(scans)} in:\n{statement}"
+        if "ORDER BY" in statement:
+            assert "Sort" not in _node_types(plan), f"Ordering not served by an index:\n{statement}"
+
+
+async def _tenant_admin(client: AsyncClient) -> dict:
+    resp = await client.post("/api/admin/tenants", json={"name": "Planned", "slug": "planned"})
+    tenant_id = resp.json()["id"]
+    for email, role_id in (("Admin@Planned.com", 2), ("member@planned.com", 3)):
+        await client.post(
+            "/api/admin/users",
+            json={"email": email, "password": "pass", "role_id": role_id, "tenant_id": tenant_id},
+        )
+    resp = await client.post("/api/auth/login", json={"email": "admin@planned.com", "password": "pass"})
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_login_uses_email_index(client: AsyncClient, seed, db: AsyncSession, executed):
+    executed.clear()
+    resp = await client.post(
+        "/api/auth/login", json={"email": "ADMIN@system.com", "password": "admin123"}
+    )
+    assert resp.status_code == 200
+    await _assert_no_seq_scans(db, executed)
+
+
+@pytest.mark.asyncio
+# Not the superadmin user export: it reads every live user, where a seq scan is right.
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/api/admin/users", {}),
+        ("/api/admin/users", {"cursor": ""}),
+        ("/api/admin/tenants", {}),
+        ("/api/admin/tenants", {"cursor": ""}),
+        ("/api/admin/tenants/export", {}),
+    ],
+)
+async def test_superadmin_listings_use_indexes(
+    auth_client: AsyncClient, db: AsyncSession, executed, path: str, params: dict
+):
+    executed.clear()
+    resp = await auth_client.get(path, params=params)
+    assert resp.status_code == 200
+    await _assert_no_seq_scans(db, executed)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/api/admin/users", {}),
+        ("/api/admin/users", {"cursor": ""}),
+        ("/api/admin/users/export", {}),
+    ],
+)
+async def test_tenant_listings_use_indexes(
+    auth_client: AsyncClient, db: AsyncSession, executed, path: str, params: dict
+):
+    headers = await _tenant_admin(auth_client)
+
+    executed.clear()
+    resp = await auth_client.get(path, params=params, headers=headers)
+    assert resp.status_code == 200
+    await _assert_no_seq_scans(db, executed)
+
+
+@pytest.mark.asyncio
+async def test_user_writes_use_indexes(auth_client: AsyncClient, db: AsyncSession, executed):
+    await auth_client.get("/api/auth/me")
+
+    executed.clear()
+    resp = await auth_client.post(
+        "/api/admin/users", json={"email": "planned@test.com", "password": "pass"}
+    )
+    assert resp.status_code == 201
+    user_id = resp.json()["id"]
+    await auth_client.patch(f"/api/admin/users/{user_id}", json={"role_id": 2})
+    await auth_client.delete(f"/api/admin/users/{user_id}")
+    await _assert_no_seq_scans(db, executed)
+
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_indexes(client: AsyncClient, seed, db: AsyncSession, executed):
+    from app.core.sessions import session_store
+
+    resp = await client.post("/api/auth/login", json={"email": "admin@system.com", "password": "admin123"})
+    refresh_token = resp.json()["refresh_token"]
+    session_store.cache.clear()  # take the full-check path first, then the cached rotation
+
+    executed.clear()
+    for _ in range(2):
+        resp = await client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+        assert resp.status_code == 200
+        refresh_token = resp.json()["refresh_token"]
+    await _assert_no_seq_scans(db, executed)
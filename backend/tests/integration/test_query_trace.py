@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.instrumentation import MetricsMiddleware, instrument_engine
+from app.database.utils.statements import USER_BY_ID
+
+from tests.integration.conftest import _state
+
+
+@pytest.fixture(autouse=True)
+def _instrumented():
+    instrument_engine(_state["engine"])
+
+
+@pytest.mark.asyncio
+async def test_budget_records_call_sites(auth_client: AsyncClient, statement_budget):
+    with statement_budget(3) as trace:
+        resp = await auth_client.get("/api/admin/users")
+    assert resp.status_code == 200
+    sites = [r.call_site for r in trace.records]
+    assert any(site and site.startswith("app/services/user_service.py") for site in sites)
+    assert any(site and site.startswith("app/core/dependencies.py") for site in sites)
+
+
+@pytest.mark.asyncio
+async def test_budget_exceeded_fails(auth_client: AsyncClient, statement_budget):
+    with pytest.raises(pytest.fail.Exception, match=r"statements, budget 1:\n1\. \[app/"):
+        with statement_budget(1):
+            await auth_client.get("/api/admin/users")
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_reported(
+    db: AsyncSession, seed, monkeypatch, caplog
+):
+    monkeypatch.setattr(settings, "DB_QUERY_TRACE", True)
+    monkeypatch.setattr(settings, "DB_REPEATED_STATEMENT_THRESHOLD", 3)
+    user_id = seed["superadmin"].id
+
+    async def n_plus_one(scope, receive, send):
+        for _ in range(4):
+            await db.execute(USER_BY_ID, {"user_id": user_id})
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    transport = ASGITransport(app=MetricsMiddleware(n_plus_one))
+    with caplog.at_level(logging.INFO, logger="app.core.instrumentation"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/loop")
+
+    summary = next(r for r in caplog.records if r.getMessage().startswith("DB trace"))
+    assert summary.db_trace["statements"] == 4
+    assert summary.db_trace["repeated"] and list(summary.db_trace["repeated"].values()) == [4]
+    warning = next(r for r in caplog.records if "possible N+1" in r.getMessage())
+    assert "count=4" in warning.getMessage()
+    assert "FROM users JOIN tenants" in warning.getMessage()
+
+
+@pytest.mark.asyncio
+async def test_slow_statements_are_logged(auth_client: AsyncClient, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 0.001)
+    with caplog.at_level(logging.WARNING, logger="app.core.instrumentation"):
+        await auth_client.get("/api/admin/tenants")
+
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Slow statement")]
+    assert any("site=app/services/tenant_service.py" in m for m in slow)
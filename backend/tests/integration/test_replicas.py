@@ -0,0 +1,81 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import TTLCache
+from app.core.principal import principal_cache
+from app.database import session as db_session
+from app.database.session import PrimarySession
+from app.utils.ids import uuid7
+
+from tests.integration.conftest import _state
+
+
+@pytest.fixture
+def replica(db: AsyncSession, monkeypatch):
+    """Stand-in replica: separate connections that only see committed rows (i.e. none)."""
+    monkeypatch.setattr(
+        db_session, "replica_sessions", [async_sessionmaker(_state["engine"], expire_on_commit=False)]
+    )
+    monkeypatch.setattr(db_session, "_recent_writers", TTLCache(maxsize=100, ttl=5))
+    principal_cache.clear()
+    # The test session stands in for the primary session, so its commits count as writes.
+    event.listen(db.sync_session, "after_commit", db_session._remember_writer)
+    yield
+    event.remove(db.sync_session, "after_commit", db_session._remember_writer)
+
+
+@pytest.mark.asyncio
+async def test_list_reads_from_replica(auth_client: AsyncClient, replica):
+    resp = await auth_client.get("/api/admin/users")
+    # Authentication fell back to the primary; the listing came from the empty replica.
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_recent_writer_reads_from_primary(auth_client: AsyncClient, seed, replica):
+    db_session.remember_write(seed["superadmin"].id)
+
+    resp = await auth_client.get("/api/admin/users")
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_primary_commit_marks_caller(replica):
+    writer, reader = uuid7(), uuid7()
+    async with _state["engine"].connect() as conn:
+        session = AsyncSession(conn, sync_session_class=PrimarySession)
+        session.info["user_id"] = writer
+        await session.execute(text("SELECT 1"))
+        await session.commit()
+        await session.close()
+
+    assert db_session._recent_writers.get(writer) is True
+    assert db_session._recent_writers.get(reader) is None
+
+
+@pytest.mark.asyncio
+async def test_write_sticks_to_the_user_across_tokens(auth_client: AsyncClient, replica):
+    writer_token = auth_client.headers["Authorization"]
+    resp = await auth_client.post(
+        "/api/auth/login", json={"email": "admin@system.com", "password": "admin123"}
+    )
+    reader_token = f"Bearer {resp.json()['access_token']}"
+    assert reader_token != writer_token
+
+    resp = await auth_client.get("/api/admin/tenants", headers={"Authorization": reader_token})
+    assert resp.json()["total"] == 0  # not a recent writer yet: the empty replica
+
+    resp = await auth_client.post(
+        "/api/admin/tenants",
+        json={"name": "Sticky", "slug": "sticky"},
+        headers={"Authorization": writer_token},
+    )
+    assert resp.status_code == 201
+
+    # Another session of the same user sees the write: its reads go to the primary.
+    resp = await auth_client.get("/api/admin/tenants", headers={"Authorization": reader_token})
+    assert "sticky" in [t["slug"] for t in resp.json()["items"]]
@@ -0,0 +1,33 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_list_roles(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/admin/roles")
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"id": 1, "name": "superadmin"},
+        {"id": 2, "name": "admin"},
+        {"id": 3, "name": "user"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_roles(auth_client: AsyncClient):
+    resp = await auth_client.post("/api/admin/roles/refresh")
+    assert resp.status_code == 200
+    assert len(resp.json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_user_with_unknown_role(auth_client: AsyncClient, sql_statements):
+    sql_statements.clear()
+    resp = await auth_client.post(
+        "/api/admin/users",
+        json={"email": "badrole@test.com", "password": "password123", "role_id": 99},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_ROLE"
+    # only the authentication lookup ran; the role was rejected before touching users
+    assert len(sql_statements) == 1
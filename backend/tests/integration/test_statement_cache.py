@@ -0,0 +1,35 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from app.database.compiled_cache import compiled_cache_stats, compiled_cache_status
+from app.database.session import build_engine
+from app.database.utils.statements import USER_BY_ID
+
+from tests.integration.conftest import TEST_DATABASE_URL
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_statement_compiles_once():
+    engine = build_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(USER_BY_ID, {"user_id": uuid.uuid4()})
+            hits, misses = compiled_cache_stats.hits, compiled_cache_stats.misses
+            for _ in range(3):
+                await conn.execute(USER_BY_ID, {"user_id": uuid.uuid4()})
+        status = compiled_cache_status(engine)
+    finally:
+        await engine.dispose()
+
+    assert compiled_cache_stats.hits == hits + 3
+    assert compiled_cache_stats.misses == misses
+    assert status["size"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_health(client: AsyncClient):
+    resp = await client.get("/health/statement-cache")
+    assert resp.status_code == 200
+    assert {"size", "capacity", "hits", "misses", "hit_rate"} <= resp.json().keys()
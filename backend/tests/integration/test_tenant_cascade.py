@@ -0,0 +1,239 @@
+import asyncio
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.jobs import job_registry
+from app.database.models import AuthEpoch, Role, Tenant, TenantSignupDay, TenantUserCount, User
+from app.services import tenant_service, user_service
+from app.utils.ids import uuid7
+
+from tests.integration.conftest import _state
+
+
+@pytest.fixture
+def job_session(db: AsyncSession, monkeypatch):
+    """Run background jobs on the test's transactional session."""
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    monkeypatch.setattr(tenant_service, "async_session", session)
+
+
+async def _tenant_with_users(client: AsyncClient, slug: str, users: int) -> str:
+    resp = await client.post("/api/admin/tenants", json={"name": slug.title(), "slug": slug})
+    tenant_id = resp.json()["id"]
+    for i in range(users):
+        await client.post(
+            "/api/admin/users",
+            json={"email": f"u{i}@{slug}.com", "password": "pass", "tenant_id": tenant_id},
+        )
+    return tenant_id
+
+
+async def _tenant_users(client: AsyncClient, tenant_id: str) -> list[dict]:
+    resp = await client.get("/api/admin/users", params={"limit": 200})
+    return [u for u in resp.json()["items"] if u["tenant_id"] == tenant_id]
+
+
+@pytest.mark.asyncio
+async def test_cascade_chunks(auth_client: AsyncClient, db: AsyncSession):
+    tenant_id = await _tenant_with_users(auth_client, "chunked", 5)
+    await auth_client.delete(f"/api/admin/tenants/{tenant_id}")
+
+    chunks = [
+        await user_service.cascade_tenant_users(UUID(tenant_id), db, delete=True, limit=2)
+        for _ in range(4)
+    ]
+    assert chunks == [2, 2, 1, 0]
+    assert await _tenant_users(auth_client, tenant_id) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_with_cascade_runs_job(auth_client: AsyncClient, job_session, monkeypatch):
+    monkeypatch.setattr(settings, "TENANT_CASCADE_CHUNK_SIZE", 2)
+    tenant_id = await _tenant_with_users(auth_client, "offboard", 3)
+
+    resp = await auth_client.delete(f"/api/admin/tenants/{tenant_id}", params={"cascade": "true"})
+    assert resp.status_code == 202
+    job = resp.json()
+    assert (job["kind"], job["subject_id"]) == ("tenant_users_delete", tenant_id)
+
+    await job_registry.wait(UUID(job["id"]))
+    resp = await auth_client.get(f"/api/admin/tenants/jobs/{job['id']}")
+    assert resp.status_code == 200
+    job = resp.json()
+    assert (job["status"], job["total"], job["processed"]) == ("succeeded", 3, 3)
+    assert await _tenant_users(auth_client, tenant_id) == []
+
+
+@pytest.mark.asyncio
+async def test_deactivate_with_cascade(auth_client: AsyncClient, job_session):
+    tenant_id = await _tenant_with_users(auth_client, "paused", 2)
+
+    resp = await auth_client.patch(
+        f"/api/admin/tenants/{tenant_id}", params={"cascade": "true"}, json={"is_active": False}
+    )
+    assert resp.status_code == 202
+    await job_registry.wait(UUID(resp.json()["id"]))
+
+    users = await _tenant_users(auth_client, tenant_id)
+    assert len(users) == 2
+    assert {u["is_active"] for u in users} == {False}
+
+
+@pytest.mark.asyncio
+async def test_cascade_requires_deactivation(auth_client: AsyncClient):
+    tenant_id = await _tenant_with_users(auth_client, "renamed", 1)
+
+    for body in ({"name": "Renamed"}, {"is_active": True}):
+        resp = await auth_client.patch(
+            f"/api/admin/tenants/{tenant_id}", params={"cascade": "true"}, json=body
+        )
+        assert resp.status_code == 422
+        assert resp.json()["code"] == "CASCADE_REQUIRES_DEACTIVATION"
+
+    assert (await _tenant_users(auth_client, tenant_id))[0]["is_active"] is True
+
+
+@pytest_asyncio.fixture
+async def committed_tenant(monkeypatch):
+    """A tenant with three active users committed for real, so another transaction can lock them."""
+    factory = async_sessionmaker(_state["engine"], expire_on_commit=False)
+    tenant_id = uuid7()
+    async with factory() as db:
+        db.add(Role(id=3, name="user"))
+        db.add(Tenant(id=tenant_id, name="Locked", slug="locked"))
+        await db.flush()
+        db.add_all(
+            User(email=f"u{i}@locked.com", hashed_password="x", tenant_id=tenant_id, role_id=3)
+            for i in range(3)
+        )
+        await db.commit()
+    monkeypatch.setattr(tenant_service, "async_session", factory)
+    monkeypatch.setattr(settings, "TENANT_CASCADE_LOCK_RETRY_SECONDS", 0.05)
+
+    yield factory, tenant_id
+
+    async with factory() as db:
+        for model in (User, TenantUserCount, TenantSignupDay, Tenant, Role, AuthEpoch):
+            await db.execute(delete(model))
+        await db.commit()
+    async with _state["engine"].connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE users, tenants, tenant_user_counts, roles"))
+
+
+async def _active_users(factory, tenant_id: UUID) -> int:
+    async with factory() as db:
+        result = await db.execute(
+            select(func.count()).select_from(User).where(
+                User.tenant_id == tenant_id, User.is_active.is_(True)
+            )
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_cascade_waits_for_locked_users(committed_tenant):
+    factory, tenant_id = committed_tenant
+    async with factory() as locker:
+        await locker.execute(select(User.id).where(User.tenant_id == tenant_id).with_for_update())
+        job = tenant_service.start_user_cascade(tenant_id, delete=False)
+        await asyncio.sleep(0.3)
+        assert (job.status, job.processed) == ("running", 0)
+        await locker.rollback()
+
+    await job_registry.wait(job.id)
+    assert (job.status, job.total, job.processed) == ("succeeded", 3, 3)
+    assert await _active_users(factory, tenant_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_cascade_fails_if_users_stay_locked(committed_tenant, monkeypatch):
+    factory, tenant_id = committed_tenant
+    monkeypatch.setattr(settings, "TENANT_CASCADE_LOCK_TIMEOUT_SECONDS", 0.2)
+    async with factory() as locker:
+        await locker.execute(select(User.id).where(User.tenant_id == tenant_id).with_for_update())
+        job = tenant_service.start_user_cascade(tenant_id, delete=False)
+        await job_registry.wait(job.id)
+        await locker.rollback()
+
+    assert (job.status, job.total, job.processed) == ("failed", 3, 0)
+    assert "3 users stayed locked" in job.error
+    assert await _active_users(factory, tenant_id) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_cascade_can_be_rerun(committed_tenant, monkeypatch):
+    factory, tenant_id = committed_tenant
+    async with factory() as db:
+        await tenant_service.delete_tenant(tenant_id, db)
+
+    monkeypatch.setattr(settings, "TENANT_CASCADE_LOCK_TIMEOUT_SECONDS", 0.2)
+    async with factory() as locker:
+        await locker.execute(select(User.id).where(User.tenant_id == tenant_id).with_for_update())
+        failed = tenant_service.start_user_cascade(tenant_id, delete=True)
+        await job_registry.wait(failed.id)
+        await locker.rollback()
+    assert failed.status == "failed"
+
+    async with factory() as db:
+        job = await tenant_service.rerun_user_cascade(tenant_id, db)
+    await job_registry.wait(job.id)
+    assert (job.kind, job.status, job.processed) == ("tenant_users_delete", "succeeded", 3)
+    assert await _active_users(factory, tenant_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_rerun_cascade_endpoint(auth_client: AsyncClient, job_session):
+    tenant_id = await _tenant_with_users(auth_client, "rerun", 2)
+
+    resp = await auth_client.post(f"/api/admin/tenants/{tenant_id}/cascade")
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "TENANT_ACTIVE"
+
+    await auth_client.patch(f"/api/admin/tenants/{tenant_id}", json={"is_active": False})
+    resp = await auth_client.post(f"/api/admin/tenants/{tenant_id}/cascade")
+    assert resp.status_code == 202
+    assert resp.json()["kind"] == "tenant_users_deactivate"
+    await job_registry.wait(UUID(resp.json()["id"]))
+    assert {u["is_active"] for u in await _tenant_users(auth_client, tenant_id)} == {False}
+
+    await auth_client.delete(f"/api/admin/tenants/{tenant_id}")
+    resp = await auth_client.post(f"/api/admin/tenants/{tenant_id}/cascade")
+    assert resp.status_code == 202
+    assert resp.json()["kind"] == "tenant_users_delete"
+    await job_registry.wait(UUID(resp.json()["id"]))
+    assert await _tenant_users(auth_client, tenant_id) == []
+
+
+@pytest.mark.asyncio
+async def test_rerun_cascade_unknown_or_system_tenant(auth_client: AsyncClient, seed):
+    for tenant_id in (uuid7(), seed["system_tenant"].id):
+        resp = await auth_client.post(f"/api/admin/tenants/{tenant_id}/cascade")
+        assert resp.status_code == 404
+        assert resp.json()["code"] == "TENANT_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_without_cascade_users_are_untouched(auth_client: AsyncClient):
+    tenant_id = await _tenant_with_users(auth_client, "plain", 1)
+    resp = await auth_client.patch(f"/api/admin/tenants/{tenant_id}", json={"is_active": False})
+    assert resp.status_code == 200
+    assert resp.json()["is_active"] is False
+    assert (await _tenant_users(auth_client, tenant_id))[0]["is_active"] is True
+
+
+@pytest.mark.asyncio
+async def test_unknown_job(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/admin/tenants/jobs/00000000-0000-0000-0000-000000000000")
+    assert resp.status_code == 404
+    assert resp.json()["code"] == "JOB_NOT_FOUND"
@@ -1,5 +1,11 @@
+import uuid
+
 import pytest
 from httpx import AsyncClient
+from pydantic import TypeAdapter
+
+from app.dto.common import CursorPaginatedResponse, PaginatedResponse
+from app.dto.tenant import TenantResponse
 
 
 @pytest.mark.asyncio
@@ -11,6 +17,23 @@ async def test_list_tenants(auth_client: AsyncClient):
     assert data["total"] >= 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params, model",
+    [
+        ({}, PaginatedResponse[TenantResponse]),
+        ({"cursor": ""}, CursorPaginatedResponse[TenantResponse]),
+    ],
+)
+async def test_list_tenants_body_matches_response_model(
+    auth_client: AsyncClient, params: dict, model: type
+):
+    """The list skips response_model validation, so check its body would pass it unchanged."""
+    resp = await auth_client.get("/api/admin/tenants", params=params)
+    adapter = TypeAdapter(model)
+    assert adapter.dump_json(adapter.validate_json(resp.content)) == resp.content
+
+
 @pytest.mark.asyncio
 async def test_create_tenant(auth_client: AsyncClient):
     resp = await auth_client.post(
@@ -22,6 +45,7 @@ async def test_create_tenant(auth_client: AsyncClient):
     assert data["name"] == "Acme Corp"
     assert data["slug"] == "acme"
     assert data["is_active"] is True
+    assert uuid.UUID(data["id"]).version == 7
 
 
 @pytest.mark.asyncio
@@ -112,3 +136,32 @@ async def test_tenant_lifecycle(auth_client: AsyncClient):
     list_resp = await auth_client.get("/api/admin/tenants")
     tenant_ids = [t["id"] for t in list_resp.json()["items"]]
     assert tenant_id not in tenant_ids
+
+
+@pytest.mark.asyncio
+async def test_list_tenants_cursor_pagination(auth_client: AsyncClient):
+    for i in range(3):
+        await auth_client.post(
+            "/api/admin/tenants",
+            json={"name": f"Paged {i}", "slug": f"paged-{i}"},
+        )
+
+    first = await auth_client.get("/api/admin/tenants", params={"limit": 2, "cursor": ""})
+    assert first.status_code == 200
+    assert len(first.json()["items"]) == 2
+
+    second = await auth_client.get(
+        "/api/admin/tenants", params={"limit": 2, "cursor": first.json()["next_cursor"]}
+    )
+    assert len(second.json()["items"]) == 2
+    assert second.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_slug_of_deleted_tenant_can_be_reused(auth_client: AsyncClient):
+    resp = await auth_client.post("/api/admin/tenants", json={"name": "Old", "slug": "reused"})
+    await auth_client.delete(f"/api/admin/tenants/{resp.json()['id']}")
+
+    resp = await auth_client.post("/api/admin/tenants", json={"name": "New", "slug": "reused"})
+    assert resp.status_code == 201
+    assert resp.json()["name"] == "New"
@@ -0,0 +1,164 @@
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.principal import Identity
+from app.services import user_import_service
+from app.utils.security import hash_password
+
+NDJSON = {"Content-Type": "application/x-ndjson"}
+CSV = {"Content-Type": "text/csv"}
+HASHED = hash_password("imported")
+
+
+def _ndjson(*rows) -> str:
+    return "\n".join(r if isinstance(r, str) else json.dumps(r) for r in rows) + "\n"
+
+
+def _results(resp) -> list[dict]:
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_reports_each_row(auth_client: AsyncClient):
+    body = _ndjson(
+        {"email": "hashed@test.com", "password_hash": HASHED},
+        {"email": "plain@test.com", "password": "plainpass", "role_id": 2},
+        {"email": "not-an-email", "password": "x"},
+        {"email": "nopass@test.com"},
+        {"email": "HASHED@test.com", "password": "x"},
+        {"email": "admin@system.com", "password": "x"},
+        {"email": "role@test.com", "password": "x", "role_id": 99},
+        "{broken",
+    )
+    resp = await auth_client.post("/api/admin/users/import", content=body, headers=NDJSON)
+    results = _results(resp)
+
+    assert [(r["row"], r["status"]) for r in results] == [
+        (1, "created"),
+        (2, "created"),
+        (3, "invalid"),
+        (4, "invalid"),
+        (5, "invalid"),
+        (6, "exists"),
+        (7, "invalid"),
+        (8, "invalid"),
+    ]
+    assert results[0]["id"]
+    assert "email" in results[2]["error"]
+    assert results[4]["error"] == "Duplicate email in import"
+    assert "Unknown role" in results[6]["error"]
+
+    login = await auth_client.post(
+        "/api/auth/login", json={"email": "plain@test.com", "password": "plainpass"}
+    )
+    assert login.status_code == 200
+    login = await auth_client.post(
+        "/api/auth/login", json={"email": "hashed@test.com", "password": "imported"}
+    )
+    assert login.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_import_csv_in_batches_into_tenant(auth_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "USER_IMPORT_BATCH_SIZE", 2)
+    resp = await auth_client.post("/api/admin/tenants", json={"name": "Onboard", "slug": "onboard"})
+    tenant_id = resp.json()["id"]
+
+    rows = "".join(f'csv{i}@test.com,"{HASHED}",\n' for i in range(5))
+    body = "email,password_hash,role_id\r\n" + rows + 'admin5@test.com,"' + HASHED + '",2\n'
+    resp = await auth_client.post(
+        f"/api/admin/users/import?tenant_id={tenant_id}", content=body, headers=CSV
+    )
+    results = _results(resp)
+    assert [r["status"] for r in results] == ["created"] * 6
+
+    resp = await auth_client.get("/api/admin/users", params={"limit": 100})
+    imported = [u for u in resp.json()["items"] if u["tenant_id"] == tenant_id]
+    assert len(imported) == 6
+    assert sorted(u["role"] for u in imported) == ["admin"] + ["user"] * 5
+
+
+@pytest.mark.asyncio
+async def test_import_csv_column_mismatch(auth_client: AsyncClient):
+    body = "email,password\nshort@test.com\n"
+    results = _results(
+        await auth_client.post("/api/admin/users/import", content=body, headers=CSV)
+    )
+    assert results == [{"row": 1, "status": "invalid", "error": "expected 2 columns, got 1"}]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_content_type(auth_client: AsyncClient):
+    resp = await auth_client.post(
+        "/api/admin/users/import", content="{}", headers={"Content-Type": "application/json"}
+    )
+    assert resp.status_code == 415
+    assert resp.json()["code"] == "UNSUPPORTED_FORMAT"
+
+
+@pytest.mark.asyncio
+async def test_import_row_limit(auth_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "USER_IMPORT_MAX_ROWS", 1)
+    body = _ndjson(
+        {"email": "first@test.com", "password_hash": HASHED},
+        {"email": "second@test.com", "password_hash": HASHED},
+    )
+    results = _results(
+        await auth_client.post("/api/admin/users/import", content=body, headers=NDJSON)
+    )
+    assert [r["status"] for r in results] == ["created", "invalid"]
+    assert "Row limit" in results[1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_unknown_tenant_fails_before_streaming(auth_client: AsyncClient):
+    body = _ndjson({"email": "lost@test.com", "password_hash": HASHED})
+    resp = await auth_client.post(
+        f"/api/admin/users/import?tenant_id={uuid.uuid4()}", content=body, headers=NDJSON
+    )
+    assert resp.status_code == 404
+    assert resp.json()["code"] == "TENANT_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_import_yields_each_batch_as_it_commits(db: AsyncSession, seed, monkeypatch):
+    monkeypatch.setattr(settings, "USER_IMPORT_BATCH_SIZE", 2)
+    tenant = seed["system_tenant"]
+    superadmin = Identity(
+        id=seed["superadmin"].id, tenant_id=tenant.id, tenant_slug="system", role_name="superadmin"
+    )
+    rows = [
+        {"email": "s1@test.com", "password_hash": HASHED},
+        {"email": "bad"},
+        {"email": "s3@test.com", "password_hash": HASHED},
+        {"email": "s4@test.com", "password_hash": HASHED},
+        {"email": "s5@test.com", "password_hash": HASHED},
+    ]
+    sent = 0
+
+    async def upload():
+        nonlocal sent
+        for row in rows:
+            sent += 1
+            yield _ndjson(row).encode()
+
+    seen = [
+        (result.row, result.status, sent)
+        async for result in user_import_service.import_users(
+            upload(), "ndjson", superadmin, db, tenant.id
+        )
+    ]
+    assert seen == [
+        (1, "created", 3),
+        (2, "invalid", 3),
+        (3, "created", 3),
+        (4, "created", 5),
+        (5, "created", 5),
+    ]
@@ -1,5 +1,11 @@
+import uuid
+
 import pytest
 from httpx import AsyncClient
+from pydantic import TypeAdapter
+
+from app.dto.common import CursorPaginatedResponse, PaginatedResponse
+from app.dto.user import UserResponse
 
 
 @pytest.mark.asyncio
@@ -12,6 +18,20 @@ async def test_list_users(auth_client: AsyncClient):
     assert data["total"] >= 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params, model",
+    [({}, PaginatedResponse[UserResponse]), ({"cursor": ""}, CursorPaginatedResponse[UserResponse])],
+)
+async def test_list_users_body_matches_response_model(
+    auth_client: AsyncClient, params: dict, model: type
+):
+    """The list skips response_model validation, so check its body would pass it unchanged."""
+    resp = await auth_client.get("/api/admin/users", params=params)
+    adapter = TypeAdapter(model)
+    assert adapter.dump_json(adapter.validate_json(resp.content)) == resp.content
+
+
 @pytest.mark.asyncio
 async def test_create_user(auth_client: AsyncClient, seed):
     tenant_id = str(seed["system_tenant"].id)
@@ -28,6 +48,7 @@ async def test_create_user(auth_client: AsyncClient, seed):
     data = resp.json()
     assert data["email"] == "newuser@test.com"
     assert data["role"] == "user"
+    assert uuid.UUID(data["id"]).version == 7
 
 
 @pytest.mark.asyncio
@@ -141,3 +162,154 @@ async def test_user_lifecycle(auth_client: AsyncClient, seed):
     list_resp = await auth_client.get("/api/admin/users")
     user_ids = [u["id"] for u in list_resp.json()["items"]]
     assert user_id not in user_ids
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_token_rejected(auth_client: AsyncClient, seed):
+    """Deactivation invalidates the cached principal, so an already-issued token stops working."""
+    tenant_id = str(seed["system_tenant"].id)
+    create_resp = await auth_client.post(
+        "/api/admin/users",
+        json={
+            "email": "cached@test.com",
+            "password": "password123",
+            "role_id": 3,
+            "tenant_id": tenant_id,
+        },
+    )
+    user_id = create_resp.json()["id"]
+
+    login_resp = await auth_client.post(
+        "/api/auth/login",
+        json={"email": "cached@test.com", "password": "password123"},
+    )
+    user_headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+    assert (await auth_client.get("/api/auth/me", headers=user_headers)).status_code == 200
+
+    await auth_client.patch(f"/api/admin/users/{user_id}", json={"is_active": False})
+
+    resp = await auth_client.get("/api/auth/me", headers=user_headers)
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_list_users_cursor_pagination(auth_client: AsyncClient, seed):
+    tenant_id = str(seed["system_tenant"].id)
+    for i in range(4):
+        await auth_client.post(
+            "/api/admin/users",
+            json={
+                "email": f"page{i}@test.com",
+                "password": "password123",
+                "role_id": 3,
+                "tenant_id": tenant_id,
+            },
+        )
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        resp = await auth_client.get("/api/admin/users", params={"limit": 2, "cursor": cursor})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert "total" not in data
+        seen.extend(u["id"] for u in data["items"])
+        cursor = data["next_cursor"]
+
+    offset_resp = await auth_client.get("/api/admin/users", params={"limit": 200})
+    assert seen == [u["id"] for u in offset_resp.json()["items"]]
+    assert len(seen) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_users_invalid_cursor(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/admin/users", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ["exact", "window", "estimated"])
+async def test_list_users_count_strategies(auth_client: AsyncClient, strategy):
+    resp = await auth_client.get("/api/admin/users", params={"count": strategy})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["items"]) == 1
+    assert isinstance(data["total"], int)
+    if strategy != "estimated":
+        assert data["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_users_without_count(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/admin/users", params={"count": "none"})
+    assert resp.status_code == 200
+    assert resp.json()["total"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_users_window_count_past_last_page(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/admin/users", params={"count": "window", "offset": 10})
+    assert resp.status_code == 200
+    assert resp.json()["items"] == []
+    assert resp.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_user_email_conflict_ignores_case(auth_client: AsyncClient):
+    resp = await auth_client.post(
+        "/api/admin/users", json={"email": "ADMIN@System.com", "password": "pass"}
+    )
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "EMAIL_EXISTS"
+
+
+@pytest.mark.asyncio
+async def test_email_of_deleted_user_can_be_reused(auth_client: AsyncClient):
+    body = {"email": "reused@test.com", "password": "pass"}
+    resp = await auth_client.post("/api/admin/users", json=body)
+    await auth_client.delete(f"/api/admin/users/{resp.json()['id']}")
+
+    resp = await auth_client.post("/api/admin/users", json=body)
+    assert resp.status_code == 201
+    resp = await auth_client.post("/api/auth/login", json=body)
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_write_user_errors(auth_client: AsyncClient, seed):
+    superadmin_id = seed["superadmin"].id
+
+    resp = await auth_client.patch(f"/api/admin/users/{superadmin_id}", json={"role_id": 2})
+    assert resp.status_code == 403
+    assert resp.json()["code"] == "SUPERADMIN_PROTECTED"
+
+    resp = await auth_client.delete(f"/api/admin/users/{superadmin_id}")
+    assert resp.status_code == 403
+    assert resp.json()["code"] == "SUPERADMIN_PROTECTED"
+
+    resp = await auth_client.patch(f"/api/admin/users/{uuid.uuid4()}", json={"is_active": False})
+    assert resp.status_code == 404
+    assert resp.json()["code"] == "USER_NOT_FOUND"
+
+    resp = await auth_client.get("/api/auth/me")
+    assert resp.json()["role"] == "superadmin"
+
+
+@pytest.mark.asyncio
+async def test_update_user_returns_row_with_tenant(auth_client: AsyncClient, seed):
+    resp = await auth_client.post(
+        "/api/admin/users", json={"email": "returned@test.com", "password": "pass"}
+    )
+    created = resp.json()
+    assert created["tenant_name"] == "System"
+    assert created["role"] == "user"
+
+    resp = await auth_client.patch(
+        f"/api/admin/users/{created['id']}", json={"role_id": 2, "is_active": False}
+    )
+    updated = resp.json()
+    assert updated["role"] == "admin"
+    assert updated["is_active"] is False
+    assert updated["tenant_name"] == "System"
+    assert updated["created_at"] == created["created_at"]
+    assert updated["updated_at"] is not None
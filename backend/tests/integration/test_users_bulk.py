@@ -0,0 +1,90 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _create(client: AsyncClient, email: str, **extra) -> str:
+    resp = await client.post("/api/admin/users", json={"email": email, "password": "pass", **extra})
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+async def _as(client: AsyncClient, email: str) -> dict:
+    resp = await client.post("/api/auth/login", json={"email": email, "password": "pass"})
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_reports_each_id(auth_client: AsyncClient, seed):
+    ids = [await _create(auth_client, f"bulk{i}@test.com") for i in range(3)]
+    superadmin_id = str(seed["superadmin"].id)
+    missing = str(uuid.uuid4())
+
+    resp = await auth_client.post(
+        "/api/admin/users/bulk-update",
+        json={"ids": [*ids, ids[0], superadmin_id, missing], "role_id": 2, "is_active": False},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["succeeded"] == 3
+    assert [(i["id"], i["status"]) for i in data["items"]] == [
+        *((i, "updated") for i in ids),
+        (superadmin_id, "protected"),
+        (missing, "not_found"),
+    ]
+
+    users = (await auth_client.get("/api/admin/users", params={"limit": 100})).json()["items"]
+    changed = {u["id"]: (u["role"], u["is_active"]) for u in users if u["id"] in ids}
+    assert set(changed.values()) == {("admin", False)}
+
+    stats = (await auth_client.get("/api/dashboard/stats")).json()
+    assert {r["role"]: (r["total"], r["active"]) for r in stats["roles"]}["admin"] == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_revokes_tokens(auth_client: AsyncClient):
+    user_id = await _create(auth_client, "revoked@test.com", role_id=2)
+    headers = await _as(auth_client, "revoked@test.com")
+    assert (await auth_client.get("/api/auth/me", headers=headers)).status_code == 200
+
+    await auth_client.post("/api/admin/users/bulk-update", json={"ids": [user_id], "is_active": False})
+    assert (await auth_client.get("/api/auth/me", headers=headers)).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_is_tenant_scoped(auth_client: AsyncClient):
+    resp = await auth_client.post("/api/admin/tenants", json={"name": "Other", "slug": "other"})
+    other_tenant = resp.json()["id"]
+    await _create(auth_client, "boss@other.com", role_id=2, tenant_id=other_tenant)
+    own = await _create(auth_client, "member@other.com", tenant_id=other_tenant)
+    foreign = await _create(auth_client, "system-user@test.com")
+
+    headers = await _as(auth_client, "boss@other.com")
+    resp = await auth_client.post(
+        "/api/admin/users/bulk-delete", json={"ids": [own, foreign]}, headers=headers
+    )
+    assert resp.status_code == 200
+    assert resp.json()["items"] == [
+        {"id": own, "status": "deleted"},
+        {"id": foreign, "status": "not_found"},
+    ]
+
+    listed = (await auth_client.get("/api/admin/users", params={"limit": 100})).json()["items"]
+    assert {u["id"] for u in listed} >= {foreign}
+    assert own not in {u["id"] for u in listed}
+
+    resp = await auth_client.post("/api/admin/users/bulk-delete", json={"ids": [own]})
+    assert resp.json()["items"] == [{"id": own, "status": "not_found"}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejects_unknown_role_and_empty_ids(auth_client: AsyncClient):
+    resp = await auth_client.post(
+        "/api/admin/users/bulk-update", json={"ids": [str(uuid.uuid4())], "role_id": 99}
+    )
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_ROLE"
+
+    resp = await auth_client.post("/api/admin/users/bulk-delete", json={"ids": []})
+    assert resp.status_code == 422
@@ -0,0 +1,60 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_set(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_entries_expire(self, monkeypatch):
+        cache = TTLCache(maxsize=10, ttl=5)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("a", 1)
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_only_shortens(self, monkeypatch):
+        cache = TTLCache(maxsize=10, ttl=5)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("short", 1, ttl=2)
+        cache.set("long", 2, ttl=60)
+        cache.set("gone", 3, ttl=0)
+        assert cache.get("gone") is None
+        monkeypatch.setattr(time, "monotonic", lambda: now + 3)
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+        assert cache.get("long") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_discard_where(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("u1", "t1"), 1)
+        cache.set(("u1", "t2"), 2)
+        cache.set(("u2", "t3"), 3)
+        assert cache.discard_where(lambda key, _value: key[0] == "u1") == 2
+        assert len(cache) == 1
+
+    def test_disabled_when_ttl_zero(self):
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
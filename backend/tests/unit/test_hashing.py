@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailableError
+from app.core.hashing import PasswordHasher
+
+
+class TestPasswordHasher:
+    async def test_hash_and_verify(self):
+        hasher = PasswordHasher(executor="thread", workers=2, queue_size=2)
+        try:
+            hashed = await hasher.hash("mypassword")
+            assert await hasher.verify("mypassword", hashed)
+            assert not await hasher.verify("wrongpassword", hashed)
+        finally:
+            hasher.shutdown()
+
+    async def test_rejects_when_saturated(self):
+        hasher = PasswordHasher(executor="thread", workers=1, queue_size=0)
+        try:
+            in_flight = asyncio.create_task(hasher.hash("first"))
+            await asyncio.sleep(0)
+
+            with pytest.raises(ServiceUnavailableError):
+                await hasher.hash("second")
+            assert hasher.rejected == 1
+
+            await in_flight
+            assert hasher.pending == 0
+        finally:
+            hasher.shutdown()
+
+    async def test_hash_many_waits_instead_of_rejecting(self):
+        hasher = PasswordHasher(executor="thread", workers=1, queue_size=0)
+        try:
+            hashes = await hasher.hash_many(["a", "b", "c"])
+            assert len(hashes) == 3
+            assert await hasher.verify("b", hashes[1])
+            assert hasher.rejected == 0
+            assert hasher.pending == 0
+        finally:
+            hasher.shutdown()
+
+    async def test_concurrent_bulk_work_leaves_room_for_logins(self):
+        hasher = PasswordHasher(executor="thread", workers=2, queue_size=2)
+        try:
+            imports = [
+                asyncio.create_task(hasher.hash_many([f"p{i}-{j}" for j in range(4)]))
+                for i in range(9)
+            ]
+            await asyncio.sleep(0.01)
+            assert hasher.pending <= hasher.bulk_slots < hasher.capacity
+
+            hashed = await hasher.hash("login")
+            assert await hasher.verify("login", hashed)
+            assert hasher.rejected == 0
+            assert [len(h) for h in await asyncio.gather(*imports)] == [4] * 9
+        finally:
+            hasher.shutdown()
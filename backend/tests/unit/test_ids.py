@@ -0,0 +1,30 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.utils import ids
+
+
+class TestUUID7:
+    def test_layout(self):
+        value = ids._uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_strictly_increasing(self):
+        values = [ids._uuid7() for _ in range(20_000)]
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    def test_increasing_when_clock_steps_back(self, monkeypatch):
+        now = time.time_ns()
+        monkeypatch.setattr(time, "time_ns", lambda: now)
+        first = ids._uuid7()
+        monkeypatch.setattr(time, "time_ns", lambda: now - 5_000_000_000)
+        assert ids._uuid7() > first
+
+    def test_embeds_creation_time(self):
+        before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+        created = ids.uuid7_time(ids.uuid7())
+        assert before <= created <= datetime.now(timezone.utc)
+        assert ids.uuid7_time(uuid.uuid4()) is None
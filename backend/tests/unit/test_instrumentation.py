@@ -0,0 +1,21 @@
+import uuid
+
+from app.core.instrumentation import StatementTrace, _parameter_shape
+
+
+class TestParameterShape:
+    def test_positional(self):
+        assert _parameter_shape((uuid.uuid4(), "a", None), False) == "(UUID, str, NoneType)"
+
+    def test_executemany(self):
+        assert _parameter_shape([(1, "a"), (2, "b")], True) == "2 x (int, str)"
+
+
+class TestStatementTrace:
+    def test_repeated(self):
+        trace = StatementTrace()
+        for sql in ("SELECT a", "SELECT b", "SELECT a", "SELECT a"):
+            trace.add(sql, "()", 0.001, None)
+        repeated = trace.repeated(3)
+        assert [(r.statement, n) for r, n in repeated] == [("SELECT a", 3)]
+        assert trace.repeated(4) == []
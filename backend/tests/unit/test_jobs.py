@@ -0,0 +1,60 @@
+import asyncio
+import uuid
+
+from app.core.jobs import Job, JobRegistry
+
+
+class TestJobRegistry:
+    async def test_tracks_progress_to_success(self):
+        registry = JobRegistry()
+        release = asyncio.Event()
+
+        async def work(job: Job) -> None:
+            job.total = 2
+            job.processed = 1
+            await release.wait()
+            job.processed = 2
+
+        job = registry.start("demo", uuid.uuid4(), work)
+        await asyncio.sleep(0)
+        assert (job.status, job.processed) == ("running", 1)
+
+        release.set()
+        assert await registry.wait(job.id) is job
+        assert (job.status, job.processed, job.error) == ("succeeded", 2, None)
+        assert job.finished_at is not None
+
+    async def test_records_failure(self):
+        registry = JobRegistry()
+
+        async def work(_job: Job) -> None:
+            raise RuntimeError("boom")
+
+        job = await registry.wait(registry.start("demo", uuid.uuid4(), work).id)
+        assert (job.status, job.error) == ("failed", "boom")
+
+    async def test_forgets_oldest_finished_jobs(self):
+        registry = JobRegistry(keep=1)
+
+        async def work(_job: Job) -> None:
+            pass
+
+        first = registry.start("demo", uuid.uuid4(), work)
+        await registry.wait(first.id)
+        second = registry.start("demo", uuid.uuid4(), work)
+        await registry.wait(second.id)
+        registry.start("demo", uuid.uuid4(), work)
+
+        assert registry.get(first.id) is None
+        assert registry.get(second.id) is second
+
+    async def test_shutdown_cancels_running_jobs(self):
+        registry = JobRegistry()
+
+        async def work(_job: Job) -> None:
+            await asyncio.sleep(60)
+
+        job = registry.start("demo", uuid.uuid4(), work)
+        await asyncio.sleep(0)
+        await registry.shutdown()
+        assert (job.status, job.error) == ("failed", "cancelled")
@@ -0,0 +1,33 @@
+from app.utils.metrics import Histogram, prometheus_histogram, prometheus_samples
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        hist = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            hist.observe(value)
+
+        snapshot = hist.snapshot()
+        assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == 4.25
+
+
+class TestPrometheusFormat:
+    def test_samples_escape_label_values(self):
+        lines = prometheus_samples("hits_total", "counter", "Hits.", [({"path": 'a"b'}, 3)])
+        assert lines == [
+            "# HELP hits_total Hits.",
+            "# TYPE hits_total counter",
+            'hits_total{path="a\\"b"} 3',
+        ]
+
+    def test_histogram_series(self):
+        hist = Histogram(buckets=(0.1,))
+        hist.observe(0.05)
+        lines = prometheus_histogram(
+            "latency_seconds", "Latency.", [({"route": "/x"}, hist.snapshot())]
+        )
+        assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/x",le="+Inf"} 1' in lines
+        assert 'latency_seconds_count{route="/x"} 1' in lines
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import DuplexStreamingResponse, TrustedJSONResponse
+from app.dto.common import PaginatedResponse
+from app.dto.tenant import TenantResponse
+
+
+def _tenant(**overrides) -> dict:
+    values = {
+        "id": uuid4(),
+        "name": "Acme — Ünïcode",
+        "slug": "acme",
+        "is_active": True,
+        "created_at": datetime(2026, 10, 17, 9, 30, 0, 123456, tzinfo=timezone.utc),
+        "updated_at": None,
+    }
+    return values | overrides
+
+
+class TestTrustedJSONResponse:
+    def test_same_bytes_as_validated_path(self):
+        page = {
+            "items": [_tenant(), _tenant(slug="beta", updated_at=datetime.now(timezone.utc))],
+            "total": 2,
+            "offset": 0,
+            "limit": 50,
+        }
+        adapter = TypeAdapter(PaginatedResponse[TenantResponse])
+        validated = JSONResponse(adapter.dump_python(adapter.validate_python(page), mode="json"))
+
+        resp = TrustedJSONResponse(page)
+
+        assert resp.media_type == "application/json"
+        assert resp.body == validated.body
+
+    def test_status_code(self):
+        resp = TrustedJSONResponse(_tenant(), status_code=201)
+        assert resp.status_code == 201
+        assert resp.headers["content-type"] == "application/json"
+
+
+class TestDuplexStreamingResponse:
+    @pytest.mark.asyncio
+    async def test_leaves_receive_to_the_content(self):
+        async def receive():
+            raise AssertionError("the response must not read the request")
+
+        async def content():
+            yield b"a\n"
+            yield b"b\n"
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await DuplexStreamingResponse(content(), media_type="application/x-ndjson")(
+            {"type": "http"}, receive, send
+        )
+
+        assert sent[0]["status"] == 200
+        assert b"".join(m.get("body", b"") for m in sent[1:]) == b"a\nb\n"
+        assert sent[-1]["more_body"] is False
@@ -1,5 +1,9 @@
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+import hashlib
+import time
+
 import jwt
 import pytest
 
@@ -9,6 +13,7 @@ from app.utils.security import (
     create_refresh_token,
     decode_token,
     hash_password,
+    token_cache,
     verify_password,
 )
 
@@ -40,13 +45,27 @@ class TestJWT:
         assert payload["role"] == "admin"
         assert payload["type"] == "access"
 
+    def test_access_token_carries_revocation_claims(self):
+        token = create_access_token(
+            uuid4(), uuid4(), "admin", tenant_slug="acme", user_epoch=2, tenant_epoch=1
+        )
+        payload = decode_token(token)
+
+        assert payload["tsl"] == "acme"
+        assert payload["uep"] == 2
+        assert payload["tep"] == 1
+
     def test_refresh_token_roundtrip(self):
-        user_id = uuid4()
-        token = create_refresh_token(user_id)
+        user_id, session_id, token_id = uuid4(), uuid4(), uuid4()
+        expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+        token = create_refresh_token(user_id, session_id, token_id, expires_at)
         payload = decode_token(token)
 
         assert payload["sub"] == str(user_id)
+        assert payload["sid"] == str(session_id)
+        assert payload["jti"] == str(token_id)
         assert payload["type"] == "refresh"
+        assert payload["exp"] == int(expires_at.timestamp())
         assert "tid" not in payload
 
     def test_invalid_token_raises(self):
@@ -63,3 +82,40 @@ class TestJWT:
         token = create_access_token(uuid4(), uuid4(), "user")
         with pytest.raises(jwt.InvalidSignatureError):
             jwt.decode(token, "a-]different-secret-that-is-long-enough", algorithms=[settings.JWT_ALGORITHM])
+
+
+class TestTokenCache:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        token_cache.clear()
+        yield
+        token_cache.clear()
+
+    def test_second_decode_is_a_hit(self):
+        token = create_access_token(uuid4(), uuid4(), "user")
+        first = decode_token(token)
+        hits = token_cache.hits
+        assert decode_token(token) == first
+        assert token_cache.hits == hits + 1
+
+    def test_entry_expires_with_the_token(self):
+        token = create_access_token(uuid4(), uuid4(), "user")
+        exp = decode_token(token)["exp"]
+        expires_at, _ = token_cache._data[hashlib.sha256(token.encode()).digest()]
+        assert expires_at - time.monotonic() <= exp - time.time() + 0.01
+
+    def test_callers_cannot_alter_cached_payload(self):
+        token = create_access_token(uuid4(), uuid4(), "user")
+        decode_token(token)["role"] = "superadmin"
+        assert decode_token(token)["role"] == "user"
+
+    def test_refresh_tokens_are_not_cached(self):
+        expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+        decode_token(create_refresh_token(uuid4(), uuid4(), uuid4(), expires_at))
+        assert len(token_cache) == 0
+
+    def test_tampered_token_is_not_served_from_cache(self):
+        token = create_access_token(uuid4(), uuid4(), "user")
+        decode_token(token)
+        with pytest.raises(jwt.InvalidSignatureError):
+            decode_token(token[:-5] + "XXXXX")
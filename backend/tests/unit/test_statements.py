@@ -0,0 +1,15 @@
+from sqlalchemy import Select
+
+from app.database.utils import statements
+
+
+class TestPrebuiltStatements:
+    def test_cache_keys_are_memoized(self):
+        prebuilt = [v for v in vars(statements).values() if isinstance(v, Select)]
+        assert len(prebuilt) >= 6
+        for stmt in prebuilt:
+            assert stmt._generate_cache_key() is stmt._generate_cache_key()
+
+    def test_values_are_bound_not_inlined(self):
+        sql = str(statements.LIVE_USER_BY_ID_IN_TENANT)
+        assert ":user_id" in sql and ":tenant_id" in sql
@@ -1,4 +1,5 @@
 import axios from "axios";
+import type { TokenResponse } from "@/types";
 
 const api = axios.create({
   baseURL: "/api",
@@ -21,6 +22,10 @@ export function clearTokens() {
   localStorage.removeItem("refresh_token");
 }
 
+export function getRefreshToken() {
+  return refreshToken;
+}
+
 export function getAccessToken() {
   return accessToken;
 }
@@ -41,6 +46,10 @@ api.interceptors.response.use(
   async (error) => {
     const originalRequest = error.config;
 
+    // Refresh tokens are single-use and rotated on every refresh, so read the
+    // latest one: another tab may have rotated it since this one loaded.
+    refreshToken = localStorage.getItem("refresh_token");
+
     if (
       error.response?.status === 401 &&
       !originalRequest._retry &&
@@ -48,15 +57,13 @@ api.interceptors.response.use(
     ) {
       originalRequest._retry = true;
 
-      // Deduplicate concurrent refresh attempts
+      // Deduplicate concurrent refresh attempts: replaying a spent token revokes the session
       if (!refreshPromise) {
         refreshPromise = axios
-          .post("/api/auth/refresh", { refresh_token: refreshToken })
+          .post<TokenResponse>("/api/auth/refresh", { refresh_token: refreshToken })
           .then((res) => {
-            const newAccessToken = res.data.access_token;
-            accessToken = newAccessToken;
-            localStorage.setItem("access_token", newAccessToken);
-            return newAccessToken;
+            setTokens(res.data.access_token, res.data.refresh_token);
+            return res.data.access_token;
           })
           .catch((refreshError) => {
             clearTokens();
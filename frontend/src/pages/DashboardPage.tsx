@@ -1,4 +1,4 @@
-import { Users, UserCheck, DollarSign, TrendingUp } from "lucide-react";
+import { Users, UserCheck, UserX, UserPlus } from "lucide-react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { useDashboardStats } from "@/hooks/useDashboard";
 
@@ -9,31 +9,17 @@ export default function DashboardPage() {
     return <p className="text-muted-foreground">Loading stats...</p>;
   }
 
+  const total = stats?.total_users ?? 0;
+  const active = stats?.active_users ?? 0;
+  const signups = stats?.signups ?? [];
+  const newUsers = signups.reduce((sum, d) => sum + d.count, 0);
+  const peak = Math.max(1, ...signups.map((d) => d.count));
+
   const cards = [
-    {
-      title: "Total Users",
-      value: stats?.total_users ?? 0,
-      icon: Users,
-      format: (v: number) => v.toLocaleString(),
-    },
-    {
-      title: "Active Users",
-      value: stats?.active_users ?? 0,
-      icon: UserCheck,
-      format: (v: number) => v.toLocaleString(),
-    },
-    {
-      title: "Revenue",
-      value: stats?.revenue ?? 0,
-      icon: DollarSign,
-      format: (v: number) => `$${v.toLocaleString(undefined, { minimumFractionDigits: 2 })}`,
-    },
-    {
-      title: "Growth",
-      value: stats?.growth ?? 0,
-      icon: TrendingUp,
-      format: (v: number) => `${v > 0 ? "+" : ""}${v}%`,
-    },
+    { title: "Total Users", value: total, icon: Users },
+    { title: "Active Users", value: active, icon: UserCheck },
+    { title: "Inactive Users", value: total - active, icon: UserX },
+    { title: "New (30 days)", value: newUsers, icon: UserPlus },
   ];
 
   return (
@@ -53,12 +39,46 @@ export default function DashboardPage() {
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">
-                {card.format(card.value)}
+                {card.value.toLocaleString()}
               </div>
             </CardContent>
           </Card>
         ))}
       </div>
+      <div className="mt-4 grid gap-4 lg:grid-cols-3">
+        <Card>
+          <CardHeader>
+            <CardTitle className="text-sm font-medium">Users by role</CardTitle>
+          </CardHeader>
+          <CardContent className="space-y-2">
+            {stats?.roles.map((r) => (
+              <div key={r.role} className="flex justify-between text-sm">
+                <span className="capitalize">{r.role}</span>
+                <span className="text-muted-foreground">
+                  {r.active.toLocaleString()} / {r.total.toLocaleString()} active
+                </span>
+              </div>
+            ))}
+          </CardContent>
+        </Card>
+        <Card className="lg:col-span-2">
+          <CardHeader>
+            <CardTitle className="text-sm font-medium">Signups, last 30 days</CardTitle>
+          </CardHeader>
+          <CardContent>
+            <div className="flex h-32 items-end gap-1">
+              {signups.map((d) => (
+                <div
+                  key={d.day}
+                  title={`${d.day}: ${d.count}`}
+                  className="flex-1 rounded-sm bg-primary"
+                  style={{ height: `${(d.count / peak) * 100}%` }}
+                />
+              ))}
+            </div>
+          </CardContent>
+        </Card>
+      </div>
     </div>
   );
 }
@@ -1,5 +1,5 @@
 import api from "@/lib/api";
-import type { TokenResponse, User } from "@/types";
+import type { Session, TokenResponse, User } from "@/types";
 
 export async function login(email: string, password: string): Promise<TokenResponse> {
   const res = await api.post<TokenResponse>("/auth/login", { email, password });
@@ -10,3 +10,16 @@ export async function getMe(): Promise<User> {
   const res = await api.get<User>("/auth/me");
   return res.data;
 }
+
+export async function logout(refreshToken: string): Promise<void> {
+  await api.post("/auth/logout", { refresh_token: refreshToken });
+}
+
+export async function getSessions(): Promise<Session[]> {
+  const res = await api.get<Session[]>("/auth/sessions");
+  return res.data;
+}
+
+export async function revokeSession(sessionId: string): Promise<void> {
+  await api.delete(`/auth/sessions/${sessionId}`);
+}
@@ -1,5 +1,5 @@
 import { create } from "zustand";
-import { setTokens, clearTokens } from "@/lib/api";
+import { setTokens, clearTokens, getRefreshToken } from "@/lib/api";
 import * as authService from "@/services/auth.service";
 import type { User } from "@/types";
 
@@ -25,6 +25,11 @@ export const useAuthStore = create<AuthState>((set) => ({
   },
 
   logout: () => {
+    const refreshToken = getRefreshToken();
+    if (refreshToken) {
+      // Best effort: the session expires on its own if the server can't be reached.
+      authService.logout(refreshToken).catch(() => {});
+    }
     clearTokens();
     set({ user: null, isAuthenticated: false, isLoading: false });
   },
@@ -18,7 +18,11 @@ export interface TokenResponse {
   token_type: string;
 }
 
-export interface AccessTokenResponse {
-  access_token: string;
-  token_type: string;
+export interface Session {
+  id: string;
+  user_agent: string | null;
+  created_at: string;
+  last_used_at: string;
+  expires_at: string;
+  current: boolean;
 }
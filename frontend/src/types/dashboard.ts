@@ -1,7 +1,18 @@
+export interface RoleCount {
+  role: string;
+  total: number;
+  active: number;
+}
+
+export interface DailySignups {
+  day: string;
+  count: number;
+}
+
 export interface DashboardStats {
   tenant: string;
   total_users: number;
   active_users: number;
-  revenue: number;
-  growth: number;
+  roles: RoleCount[];
+  signups: DailySignups[];
 }
@@ -1,5 +1,5 @@
-export type { User, LoginRequest, TokenResponse, AccessTokenResponse } from "./auth";
+export type { User, LoginRequest, TokenResponse, Session } from "./auth";
 export type { UserListItem, UserCreatePayload, UserUpdatePayload } from "./user";
 export type { Tenant, TenantCreatePayload, TenantUpdatePayload } from "./tenant";
-export type { DashboardStats } from "./dashboard";
+export type { DailySignups, DashboardStats, RoleCount } from "./dashboard";
 export type { PaginatedResponse } from "./common";